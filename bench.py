@@ -0,0 +1,195 @@
+#!/usr/bin/env python3.9
+
+import argparse, ast, glob, os, sys, time, types
+
+ROOT_DIR = os.path.relpath(os.path.dirname(__file__))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+BUILD_DIR = os.path.join(ROOT_DIR, 'lib')
+EXAMPLES_DIR = os.path.join(ROOT_DIR, 'examples')
+
+sys.path.insert(0, BUILD_DIR)
+import lexer, parse
+
+def corpus(copies):
+  '''Large Parseltongue input made by concatenating the sources in `src`
+  (and lexable examples) `copies` times.'''
+  filenames = sorted(glob.glob(os.path.join(SRC_DIR, '*.pt'))) + \
+    [os.path.join(EXAMPLES_DIR, 'simple.pt')]
+  code = ''
+  for filename in filenames:
+    with open(filename, 'r') as file:
+      code += file.read().rstrip('\n') + '\n'
+  return code * copies
+
+def best_time(func, repeat):
+  best = None
+  for count in range(repeat):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    if best is None or elapsed < best:
+      best = elapsed
+  return best, result
+
+def report(name, elapsed, lines, size, tokens):
+  print(f'{name}: {elapsed:.3f} sec; {lines} lines, {size} chars, {tokens} tokens'
+    f'; {lines / elapsed:.0f} lines/sec, {tokens / elapsed:.0f} tokens/sec')
+
+def bench_lexer(args):
+  code = corpus(args.copies)
+  elapsed, tokens = best_time(
+    lambda: len(lexer.Lexer(code, '<bench>').tokens), args.repeat)
+  report('lexer', elapsed, code.count('\n'), len(code), tokens)
+
+def bench_lexer_bytes(args):
+  code = corpus(args.copies).encode('ascii')
+  elapsed, tokens = best_time(
+    lambda: len(lexer.Lexer(code, '<bench>').tokens), args.repeat)
+  report('lexer (bytes)', elapsed, code.count(b'\n'), len(code), tokens)
+
+def parseable_corpus(copies):
+  '''Like corpus, but without the examples (which the parser rejects)'''
+  filenames = sorted(glob.glob(os.path.join(SRC_DIR, '*.pt')))
+  code = ''
+  for filename in filenames:
+    with open(filename, 'r') as file:
+      code += file.read().rstrip('\n') + '\n'
+  return code * copies
+
+def parse_code(code, parser_class = parse.ParseltongueParser):
+  tokenizer = lexer.Tokenizer(code, '<bench>')
+  parser = parser_class(tokenizer, filename = '<bench>')
+  assert parser.file() is not None, 'parse failed'
+  return len(tokenizer._tokens)
+
+TOKEN_RULES = ['terminal', 'name', 'number', 'string', 'op', 'type_comment',
+  'soft_keyword', 'expect']
+
+def counting_parser(counts):
+  '''Subclass of the generated parser that counts calls to each rule
+  (including token-level rules) in the dict `counts`'''
+  parser_class = parse.ParseltongueParser
+  names = TOKEN_RULES + [name for name, value in vars(parser_class).items()
+    if callable(value) and not name.startswith('__')]
+  def counted(name, method):
+    def wrapper(self, *args):
+      counts[name] = counts.get(name, 0) + 1
+      return method(self, *args)
+    return wrapper
+  return type('Counting' + parser_class.__name__, (parser_class,),
+    {name: counted(name, getattr(parser_class, name)) for name in names})
+
+def bench_parser(args):
+  '''Parse time, and rule calls per token (via counting wrappers on every
+  rule and token-level rule of the generated parser)'''
+  code = parseable_corpus(max(1, args.copies // 10))
+  elapsed, tokens = best_time(lambda: parse_code(code), args.repeat)
+  report('parser', elapsed, code.count('\n'), len(code), tokens)
+  counts = {}
+  parse_code(code, counting_parser(counts))
+  calls = sum(counts.values())
+  print(f'parser: {calls} rule calls, {calls / tokens:.1f} per token; most called: ' +
+    ', '.join(f'{name} {count}' for name, count in
+      sorted(counts.items(), key = lambda item: -item[1])[:5]))
+
+def recording_ast(made):
+  '''Stand-in for the `ast` module whose node classes are subclasses that
+  append each node built, and the time its constructor took, to `made`'''
+  module = types.SimpleNamespace(**vars(ast))
+  def recording(cls):
+    def __init__(self, *args, **kwargs):
+      start = time.perf_counter()
+      cls.__init__(self, *args, **kwargs)
+      made.append((self, time.perf_counter() - start))
+    return type(cls.__name__, (cls,), {'__init__': __init__})
+  for name, value in vars(ast).items():
+    if isinstance(value, type) and issubclass(value, ast.AST):
+      setattr(module, name, recording(value))
+  return module
+
+def bench_actions(args):
+  '''How many AST nodes the parser's actions build speculatively, only for
+  an enclosing rule to backtrack and drop them, and how long building
+  them took (an upper bound on what deferring actions could save)'''
+  code = parseable_corpus(max(1, args.copies // 10))
+  elapsed, tokens = best_time(lambda: parse_code(code), args.repeat)
+  made = []
+  parse.ast = recording_ast(made)
+  try:
+    tokenizer = lexer.Tokenizer(code, '<bench>')
+    tree = parse.ParseltongueParser(tokenizer, filename = '<bench>').file()
+  finally:
+    parse.ast = ast
+  kept = {id(node) for node in ast.walk(tree)}
+  dropped = [seconds for node, seconds in made if id(node) not in kept]
+  print(f'actions: {len(made)} AST nodes built, {len(dropped)} dropped '
+    f'({len(dropped) / len(made):.0%}); building dropped nodes took '
+    f'{sum(dropped) * 1000:.1f} ms of {elapsed * 1000:.0f} ms parse time')
+
+def bench_lexer_edit(args):
+  code = corpus(args.copies)
+  lex = lexer.Lexer(code, '<bench>', incremental = True)
+  # Repeatedly insert and delete an identifier in the middle of the input,
+  # before a top-level definition (so at column 0, outside any block).
+  middle = code.index('\ndef ', len(code) // 2) + 1
+  def edits():
+    for count in range(100):
+      lex.edit(middle, middle, 'x\n')
+      lex.edit(middle, middle + 2, '')
+    return len(lex.tokens)
+  elapsed, tokens = best_time(edits, args.repeat)
+  print(f'lexer (200 edits): {elapsed:.3f} sec; {elapsed / 200 * 1e6:.0f} usec/edit'
+    f' on {code.count(chr(10))} lines, {tokens} tokens')
+
+def long_line(size):
+  '''Single-line Parseltongue input of about `size` characters'''
+  items = []
+  length = 0
+  while length < size:
+    item = f'f(n{len(items) % 97}, {len(items)}, "s")'
+    items.append(item)
+    length += len(item) + 2
+  return 'data = [' + ', '.join(items) + ']\n'
+
+def bench_long_line(args):
+  '''Lexing must stay linear in the input size even when it's all one line:
+  compare throughput on a 1 MB line against the same tokens spread over
+  many lines, and fail if it's much worse.'''
+  line = long_line(1000000)
+  lines = line.replace(', f(', ',\n  f(')
+  rates = []
+  for name, code in [('lexer (1 MB line)', line), ('lexer (1 MB lines)', lines)]:
+    elapsed, tokens = best_time(
+      lambda: len(lexer.Lexer(code, '<bench>').tokens), args.repeat)
+    report(name, elapsed, code.count('\n'), len(code), tokens)
+    rates.append(len(code) / elapsed)
+  if rates[0] < rates[1] / 2:
+    print('long line lexing is more than 2x slower than short lines')
+    return False
+
+benchmarks = {
+  'lexer': bench_lexer,
+  'lexer-bytes': bench_lexer_bytes,
+  'lexer-edit': bench_lexer_edit,
+  'long-line': bench_long_line,
+  'parser': bench_parser,
+  'actions': bench_actions,
+}
+
+def main():
+  argparser = argparse.ArgumentParser('bench.py')
+  argparser.add_argument('benchmarks', metavar='name', nargs='*',
+    help = f"benchmarks to run (default all): {', '.join(benchmarks)}")
+  argparser.add_argument('-n', '--repeat', dest = 'repeat', type = int,
+    default = 5, help = 'report best of this many runs')
+  argparser.add_argument('-c', '--copies', dest = 'copies', type = int,
+    default = 20, help = 'number of copies of the sources to concatenate')
+  args = argparser.parse_args()
+  failed = False
+  for name in args.benchmarks or benchmarks:
+    if benchmarks[name](args) is False:
+      failed = True
+  if failed:
+    sys.exit(1)
+
+if __name__ == '__main__': main()
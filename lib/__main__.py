@@ -1,54 +1,222 @@
-import argparse, ast, os, sys, traceback
-import lexer, parse
+import argparse, ast, hashlib, io, multiprocessing, os, sys, time, traceback
+import cache, lexer, memo, parse, watch
+import pegen.parser, pegen.tokenizer
 import util
 argparser = argparse.ArgumentParser('parseltongue')
-argparser.add_argument('filenames', metavar='file.pt', nargs='+', help='Parseltongue source files')
+argparser.add_argument('filenames', metavar='file.pt', nargs='*', help='Parseltongue source files')
 argparser.add_argument('-o', '--output', dest='output', help='destination directory for Python output')
 argparser.add_argument('-c', '--check', dest='check', action='store_true', help="check for changes, don't modify files")
 argparser.add_argument('-t', '--tokens', dest='lex', action='store_true', help="lex into tokens, don't transpile")
+argparser.add_argument('--stream', dest='stream', action='store_true', help='transpile stdin to stdout, one top-level statement at a time')
+argparser.add_argument('--header', dest='header', action='store_true', help='start Python output with a comment recording hashes of the ' + 'source and transpiler, so --check can skip up-to-date files')
+argparser.add_argument('-u', '--update', dest='update', action='store_true', help='only transpile files whose header is missing or out of date ' + '(implies --header)')
+argparser.add_argument('-w', '--watch', dest='watch', metavar='DIR', help='transpile .pt files within DIR, then keep transpiling them as ' + 'they change, until interrupted')
+argparser.add_argument('-j', '--jobs', dest='jobs', type=int, default=1, help='number of files to transpile in parallel (default 1)')
+argparser.add_argument('--cache', dest='cache', metavar='DIR', help='reuse Python output cached in DIR for unchanged source files')
+argparser.add_argument('--cache-size', dest='cache_size', type=int, default=cache.DEFAULT_MAX_SIZE // (1024 * 1024), metavar='MB', help='evict least recently used cache entries beyond this size ' + f'(default {cache.DEFAULT_MAX_SIZE // (1024 * 1024)})')
+
+def parse_error(parser, tokenizer):
+    """SyntaxError for a failed parse, at the last token lexed"""
+    tok = tokenizer.diagnose()
+    return parser.make_syntax_error(f'Parseltongue parse error at {lexer.tok_name[tok.type]} token {repr(tok.string)}')
+
+def report_error(err, file=sys.stdout):
+    traceback.print_exception(err.__class__, err, None, file=file)
+
+def transpile_stream(input, output, filename='<stdin>'):
+    """Transpile Parseltongue from the text stream `input` to Python on
+  `output`, parsing one top-level statement at a time and writing its code
+  before reading on.  Memory use is bounded by the largest statement, and
+  the output is the same as transpiling all of the input at once.
+  Returns the number of errors (reported on stderr)."""
+    tokenizer = lexer.Tokenizer(input, filename)
+    parser = parse.ParseltongueParser(tokenizer, filename=filename)
+    first = True
+    try:
+        while not parser.expect('ENDMARKER'):
+            statements = parser.statement()
+            if statements is None:
+                parser.enable_invalid_rules()
+                while not parser.statement() is None:
+                    pass
+                report_error(parse_error(parser, tokenizer), sys.stderr)
+                return 1
+            parser.commit(None)
+            for statement in statements:
+                if first:
+                    code = ast.unparse(ast.Module(body=[statement], type_ignores=[]))
+                    first = False
+                else:
+                    code = ast.unparse(ast.Module(body=[ast.Pass(), statement], type_ignores=[]))
+                    code = code[code.index('\n') + 1:]
+                output.write(code + '\n')
+            output.flush()
+    except lexer.ParselTongueLexerError as err:
+        report_error(err, sys.stderr)
+        return 1
+    if first:
+        output.write('\n')
+    return 0
+HEADER = '# Generated by Parseltongue: source sha256 {} transpiler {}'
+
+def make_header(source, transpiler):
+    """Header line identifying given source bytes and transpiler fingerprint"""
+    return HEADER.format(hashlib.sha256(source).hexdigest(), transpiler)
+
+def read_header(py_filename):
+    """First line of given Python file (without newline), or None if missing"""
+    try:
+        with open(py_filename, 'r') as py_file:
+            return py_file.readline().rstrip('\r\n')
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+
+def transpile_file(pt_filename, output=None, check=False, cache=None, transpiler=None, update=False, file=sys.stdout, mapped=True):
+    """Transpile one Parseltongue file to Python, in the directory `output`
+  (default: next to it), or with `check`, compare against the existing
+  Python file instead.  If a `cache.Cache` is given, unchanged sources
+  skip lexing and parsing.  If a `transpiler` fingerprint is given, the
+  output starts with a header line of hashes (see `make_header`), and
+  `check` just compares that line; with `update`, files whose header is
+  already up to date are skipped.  Progress and errors go to `file`.
+  The source gets memory-mapped unless `mapped` is False.
+  Returns the number of errors (0 or 1)."""
+    (basename, ext) = os.path.splitext(pt_filename)
+    py_filename = basename + '.py'
+    if output is not None:
+        py_filename = os.path.join(output, os.path.basename(py_filename))
+    try:
+        if pt_filename == py_filename or os.path.samefile(pt_filename, py_filename):
+            py_filename += '.py'
+    except FileNotFoundError:
+        pass
+    if check:
+        print(pt_filename, 'vs', py_filename, file=file)
+    else:
+        print(pt_filename, '->', py_filename, file=file)
+    with util.source_bytes(pt_filename, mapped) as source:
+        newline = util.detect_newline_bytes(source)
+        if transpiler is not None:
+            header = make_header(source, transpiler)
+            if check or update:
+                if read_header(py_filename) == header:
+                    if update:
+                        print(' -- up to date', file=file)
+                    return 0
+                if check:
+                    print(' -- DIFFERENT', file=file)
+                    return 1
+        py_content = None
+        if cache is not None:
+            key = cache.key(source)
+            py_content = cache.get(key)
+        if py_content is None:
+            py_content = transpile_source(source, pt_filename, file)
+            if py_content is None:
+                return 1
+            if cache is not None:
+                cache.put(key, py_content)
+        if transpiler is not None:
+            py_content = header + '\n' + py_content
+    py_data = py_content.replace('\n', newline or os.linesep).encode('utf-8')
+    old_data = util.read_bytes(py_filename)
+    if check:
+        if not old_data == py_data:
+            print(' -- DIFFERENT', file=file)
+            return 1
+    elif old_data == py_data:
+        print(' -- unchanged', file=file)
+        if not os.stat(py_filename).st_mode == os.stat(pt_filename).st_mode:
+            util.copy_mode(pt_filename, py_filename)
+    else:
+        util.write_atomic(py_filename, py_data, pt_filename)
+    return 0
+
+def transpile_source(source, pt_filename, file=sys.stdout):
+    """Python code for given Parseltongue source, or None after reporting
+  errors to `file`"""
+    try:
+        tokenizer = lexer.Tokenizer(source, pt_filename)
+        parser = parse.ParseltongueParser(tokenizer, filename=pt_filename)
+        parsed = parser.file()
+        if parsed is None:
+            parser.enable_invalid_rules()
+            parser.file()
+    except lexer.ParselTongueLexerError as err:
+        report_error(err, file)
+        return None
+    if parsed is None:
+        report_error(parse_error(parser, tokenizer), file)
+        return None
+    return ast.unparse(parsed) + '\n'
+
+def transpile_job(job):
+    """transpile_file for a worker process: takes the arguments as a tuple,
+  and returns the output (instead of printing it) with the error count"""
+    report = io.StringIO()
+    errors = transpile_file(*job, file=report)
+    return (report.getvalue(), errors)
+
+def watch_directory(directory, output=None, cache=None, transpiler=None, update=False):
+    """Transpile the .pt files within `directory` (as in `transpile_file`),
+  then keep transpiling the ones that change, reporting each file's
+  latency, until interrupted.  The parser stays loaded between changes,
+  avoiding the startup cost of a fresh process per change."""
+
+    def transpile(filenames):
+        for filename in filenames:
+            start = time.perf_counter()
+            try:
+                errors = transpile_file(filename, output, False, cache, transpiler, update, mapped=False)
+            except (OSError, SyntaxError) as err:
+                report_error(err)
+                errors = 1
+            elapsed = 1000 * (time.perf_counter() - start)
+            print(f" -- {('FAILED' if errors else 'done')} in {elapsed:.1f} ms")
+        sys.stdout.flush()
+    changes = watch.changes(directory)
+    transpile(sorted(watch.pt_files(directory)))
+    print(f'Watching {directory} for changes (Ctrl-C to stop)')
+    try:
+        for filenames in changes:
+            transpile(filenames)
+            if cache is not None:
+                cache.trim()
+    except KeyboardInterrupt:
+        pass
 
 def main():
     if '-t' in sys.argv or '--tokens' in sys.argv:
         sys.argv = [arg for arg in sys.argv if arg not in ['-t', '--tokens']]
         return lexer.main()
     args = argparser.parse_args()
+    if not (args.filenames or args.stream or args.watch):
+        argparser.error('no input files (or --stream or --watch)')
     exitcode = 0
-    for pt_filename in args.filenames:
-        (basename, ext) = os.path.splitext(pt_filename)
-        py_filename = basename + '.py'
-        if args.output is not None:
-            py_filename = os.path.join(args.output, os.path.basename(py_filename))
-        try:
-            if pt_filename == py_filename or os.path.samefile(pt_filename, py_filename):
-                py_filename += '.py'
-        except FileNotFoundError:
-            pass
-        if args.check:
-            print(pt_filename, 'vs', py_filename)
-        else:
-            print(pt_filename, '->', py_filename)
-        newline = util.detect_newline(pt_filename)
-        pt_file = open(pt_filename, 'r')
-        tokenizer = lexer.Tokenizer(pt_file, pt_filename)
-        parser = parse.ParseltongueParser(tokenizer, filename=pt_filename)
-        parsed = parser.file()
-        pt_file.close()
-        if parsed is None:
-            tok = tokenizer.diagnose()
-            err = parser.make_syntax_error(f'Parseltongue parse error at {lexer.tok_name[tok.type]} token {repr(tok.string)}')
-            traceback.print_exception(err.__class__, err, None, file=sys.stdout)
-            exitcode += 1
-            continue
-        py_content = ast.unparse(parsed) + '\n'
-        if args.check:
-            with open(py_filename, 'r', newline=newline) as py_file:
-                if not py_file.read() == py_content:
-                    print(' -- DIFFERENT')
-                    exitcode += 1
-        else:
-            with open(py_filename, 'w', newline=newline) as py_file:
-                py_file.write(py_content)
-            util.copy_mode(pt_filename, py_filename)
+    if args.stream:
+        exitcode += transpile_stream(sys.stdin, sys.stdout)
+    fingerprint = transpiler = transpile_cache = None
+    if args.cache is not None or args.header or args.update:
+        modules = [lexer, memo, parse, util, pegen.parser, pegen.tokenizer]
+        fingerprint = cache.fingerprint([sys.modules[__name__]] + modules)
+    if args.header or args.update:
+        transpiler = fingerprint
+    if args.cache is not None:
+        transpile_cache = cache.Cache(args.cache, fingerprint, args.cache_size * 1024 * 1024)
+    options = (args.output, args.check, transpile_cache, transpiler, args.update)
+    jobs = [(filename,) + options for filename in args.filenames]
+    if args.jobs > 1 and len(jobs) > 1:
+        with multiprocessing.Pool(min(args.jobs, len(jobs))) as pool:
+            for (report, errors) in pool.imap(transpile_job, jobs):
+                sys.stdout.write(report)
+                exitcode += errors
+    else:
+        for job in jobs:
+            exitcode += transpile_file(*job, file=sys.stdout)
+    if args.watch is not None:
+        watch_directory(args.watch, args.output, transpile_cache, transpiler, args.update)
+    if transpile_cache is not None:
+        transpile_cache.trim()
     if __name__ == '__main__':
         sys.exit(exitcode)
     else:
@@ -0,0 +1,101 @@
+import hashlib, os, sys, time
+import util
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+STALE_TEMP_AGE = 60 * 60
+
+def fingerprint(modules, options=''):
+    """Hash identifying the transpiler: the source of the given modules
+  (lexer, memo, parse, ...), the Python version (ast.unparse output differs
+  between versions), and any options that affect the generated code"""
+    digest = hashlib.sha256()
+    digest.update(sys.version.encode('utf-8'))
+    digest.update(options.encode('utf-8'))
+    for module in modules:
+        with open(module.__file__, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+class Cache:
+    """Persistent on-disk map from Parseltongue source (together with the
+  transpiler fingerprint) to its generated Python code.
+
+  Each entry is a file named by the hash of its key, within a subdirectory
+  named by the first two hex digits.  Entries are written to a temporary
+  file and renamed into place, so concurrent writers (e.g. `-j` workers or
+  simultaneous builds) never see partial entries; the last rename wins,
+  with identical content.  Reading an entry bumps its mtime, and `trim`
+  evicts the least recently used entries until the total size fits within
+  `max_size`."""
+    directory: str
+    fingerprint: str
+    max_size: int
+
+    def __init__(self, directory, fingerprint, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self.max_size = max_size
+
+    def key(self, source):
+        """Cache key for given source bytes (or mmap)"""
+        digest = hashlib.sha256(self.fingerprint.encode('ascii'))
+        digest.update(source)
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.py')
+
+    def get(self, key):
+        """Cached Python code for given key, or None if not cached"""
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return content.decode('utf-8')
+
+    def put(self, key, content):
+        """Store Python code for given key"""
+        path = self.path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            util.write_atomic(path, content.encode('utf-8'))
+        except OSError:
+            pass
+
+    def trim(self):
+        """Evict least recently used entries until the cache fits in max_size,
+    and remove temporary files abandoned by crashed writers"""
+        entries = []
+        total = 0
+        now = time.time()
+        try:
+            subdirs = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for subdir in subdirs:
+            if not subdir.is_dir():
+                continue
+            for entry in os.scandir(subdir.path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if entry.name.endswith('.py'):
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+                elif entry.name.endswith('.tmp') and now - stat.st_mtime > STALE_TEMP_AGE:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+        entries.sort()
+        for (mtime, size, path) in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
@@ -5,8 +5,10 @@ Much of this code is based on CPython's tokenize.py
 and CoffeeScript's lexer
 [https://coffeescript.org/annotated-source/lexer.html].
 """
-import re
+import bisect, codecs, io, mmap, re, sys
+from array import array
 import pegen.tokenizer
+import util
 import token, tokenize
 tok_name = token.tok_name
 tabsize = tokenize.tabsize
@@ -17,78 +19,528 @@ Whitespace = compile(tokenize.Whitespace)
 Newline_src = '\\r?\\n'
 Newline = compile(Newline_src)
 NewlineOrComment = compile(tokenize.Whitespace + tokenize.group(Newline_src, tokenize.Comment))
-Continuation = compile('\\\\' + tokenize.Whitespace + tokenize.maybe(tokenize.Comment) + Newline_src)
-Triple = compile(tokenize.StringPrefix + "'''" + tokenize.Single3 + '|' + tokenize.StringPrefix + '"""' + tokenize.Double3)
-token_rec = [(token.OP, compile(tokenize.Special)), (token.NUMBER, compile(tokenize.Number)), (token.STRING, Triple), (token.STRING, compile(tokenize.String)), (token.NAME, compile(tokenize.Name))]
+Continuation_src = '\\\\' + tokenize.Whitespace + tokenize.maybe(tokenize.Comment) + Newline_src
+Triple_src = tokenize.StringPrefix + "'''" + tokenize.Single3 + '|' + tokenize.StringPrefix + '"""' + tokenize.Double3
+TripleStart = compile(tokenize.Whitespace + tokenize.Triple)
+BlankLine = compile(tokenize.Whitespace + tokenize.maybe(tokenize.Comment) + Newline_src)
+token_rec = [('OP', tokenize.Special), ('NUMBER', tokenize.Number), ('TRIPLE', Triple_src), ('STRING', tokenize.String), ('NAME', tokenize.Name), ('NEWLINE', Newline_src), ('COMMENT', tokenize.Comment), ('CONTINUATION', Continuation_src)]
+AnyToken = compile(tokenize.Whitespace + '(?:' + '|'.join((f'(?P<{name}>{src})' for (name, src) in token_rec)) + ')')
+token_types = {'OP': token.OP, 'NUMBER': token.NUMBER, 'TRIPLE': token.STRING, 'STRING': token.STRING, 'NAME': token.NAME}
+compile_bytes = lambda regex: re.compile(regex.pattern.encode('ascii'))
+str_patterns = (AnyToken, Whitespace, NewlineOrComment)
+bytes_patterns = tuple((compile_bytes(regex) for regex in str_patterns))
+NonASCII = re.compile(b'[^\\x00-\\x7f]')
 IMPLICIT_CONTINUATION = {token.OP: {'+', '-', '*', '/', '|', '&', '<', '>', '.', '%', '==', '!=', '<=', '>=', '~', '^', '<<', '>>', '**', '//', '@', '=', '+=', '-=', '/=', '%=', '&=', '|=', '^=', '<<=', '>>=', '**=', '//=', '@=', ':='}, token.NAME: {'and', 'or', 'not', 'is', 'in'}}
 
-def implicit_continuation(tok):
-    return tok.type in IMPLICIT_CONTINUATION and tok.string in IMPLICIT_CONTINUATION[tok.type]
+def implicit_continuation(type, string):
+    return type in IMPLICIT_CONTINUATION and string in IMPLICIT_CONTINUATION[type]
 nest_open_ops = {'(': ')', '[': ']', '{': '}'}
 nest_close_ops = set(nest_open_ops.values())
 
+def is_binary(code):
+    return isinstance(code, (bytes, bytearray, mmap.mmap))
+
+def detect_encoding(data):
+    """Detect PEP 263 encoding of source bytes from a BOM or coding cookie
+  in the first two lines, without copying the rest of the buffer."""
+    pos = 0
+
+    def readline():
+        nonlocal pos
+        end = data.find(b'\n', pos) + 1 or len(data)
+        line = data[pos:end]
+        pos = end
+        return line
+    return tokenize.detect_encoding(readline)[0]
+
+def decode_error(data, filename, error):
+    """ParselTongueLexerError for source bytes that can't be decoded, given
+  the SyntaxError from detect_encoding (bad coding cookie) or the
+  UnicodeDecodeError from decoding"""
+    if isinstance(error, UnicodeDecodeError):
+        pos = error.start
+        message = f'cannot decode source as {error.encoding}: {error.reason}'
+    else:
+
+        def suspect(line):
+            try:
+                return tokenize.cookie_re.match(line.decode('utf-8')) is not None
+            except UnicodeDecodeError:
+                return True
+        pos = 0
+        second = data.find(b'\n') + 1
+        if second and (not suspect(data[:second].removeprefix(codecs.BOM_UTF8))) and suspect(data[second:data.find(b'\n', second) + 1 or len(data)]):
+            pos = second
+        message = error.msg
+    line_start = data.rfind(b'\n', 0, pos) + 1
+    line_end = data.find(b'\n', pos)
+    if line_end < 0:
+        line_end = len(data)
+    line = data[line_start:line_end].removeprefix(codecs.BOM_UTF8)
+    line = line.decode('utf-8', 'replace').rstrip('\r')
+    return ParselTongueLexerError([Diagnostic(filename, data[:line_start].count(b'\n') + 1, pos - line_start + 1, message, line)])
+
+class Diagnostic:
+    """Lexer error message with its location: filename, line number and
+  column (both 1-indexed), and the text of the offending line."""
+    filename: str
+    line_num: int
+    column: int
+    message: str
+    line: str
+
+    def __init__(self, filename, line_num, column, message, line):
+        self.filename = filename
+        self.line_num = line_num
+        self.column = column
+        self.message = message
+        self.line = line
+
+    def snippet(self):
+        """Offending line with a caret under the error column"""
+        return self.line + '\n' + ' ' * (self.column - 1) + '^'
+
+    def __str__(self):
+        return '\n'.join([f'{self.filename}:{self.line_num}.{self.column} - {self.message}', self.snippet()])
+
 class ParselTongueLexerError(SyntaxError):
-    pass
+    """Lexer failure, with the Diagnostic(s) that caused it"""
+
+    def __init__(self, diagnostics):
+        super().__init__('\n'.join((str(diagnostic) for diagnostic in diagnostics)))
+        self.diagnostics = diagnostics
+
+class SymbolTable:
+    """Table of interned identifier, keyword and operator strings, shared by
+  all the lexers of a run (see `symbols`).  Each distinct symbol is stored
+  once, as a `sys.intern`ed str, so tokens spelling the same name share a
+  string object and comparisons against keywords and grammar literals can
+  succeed on identity.  Symbols are numbered densely in order of first
+  appearance.
+
+  The table also assigns kind ids to the keywords and operators that a
+  parser matches as terminals (see `kind`).  Each token gets a kind when
+  it's lexed: for NAME and OP tokens, the kind of their string if that's
+  a registered terminal, else the token type.  (Parseltongue's NEWLINE
+  and DEDENT tokens can be spelled like closing brackets, but aren't
+  those terminals.)  A parser can then match any terminal with a single
+  integer comparison."""
+    strings: list[str]
+    ids: dict[str, int]
+    canonical: dict
+    kinds: dict[str, int]
+
+    def __init__(self):
+        self.strings = []
+        self.ids = {}
+        self.canonical = {}
+        self.kinds = {}
+
+    def intern(self, string):
+        """Canonical interned str for the given symbol (str or ASCII bytes)"""
+        symbol = self.canonical.get(string)
+        if symbol is None:
+            if isinstance(string, str):
+                symbol = sys.intern(string)
+            else:
+                symbol = sys.intern(string.decode('ascii'))
+            if symbol not in self.ids:
+                self.ids[symbol] = len(self.strings)
+                self.strings.append(symbol)
+            self.canonical[string] = symbol
+        return symbol
+
+    def id(self, string):
+        """Index of an interned symbol, or None if it hasn't been seen"""
+        return self.ids.get(string)
+
+    def kind(self, string):
+        """Kind id of a terminal string (keyword or operator), registering it
+    if new.  Kind ids start at token.NT_OFFSET, after all token types.
+    Terminals must be registered before lexing the tokens that spell them."""
+        string = self.intern(string)
+        kind = self.kinds.get(string)
+        if kind is None:
+            kind = self.kinds[string] = token.NT_OFFSET + len(self.kinds)
+        return kind
+
+    def __len__(self):
+        return len(self.strings)
+
+    def __iter__(self):
+        return iter(self.strings)
+
+    def __contains__(self, string):
+        return string in self.ids
+
+    def __getitem__(self, id):
+        return self.strings[id]
+symbols = SymbolTable()
+
+class LineIndex:
+    """Table of line start offsets within a source string, built once so that
+  mapping offsets to line numbers and line numbers to line text doesn't
+  need to rescan the source.  The source can also be pure-ASCII bytes,
+  in which case only the requested line text gets decoded.
+
+  When lexing a stream, lines get appended as they're read, and lines
+  that are no longer needed get discarded from the front, so `code` starts
+  with line `first`."""
+    code: str
+    first: int
+    starts: list[int]
+
+    def __init__(self, code):
+        self.code = code
+        self.binary = is_binary(code)
+        newline = b'\n' if self.binary else '\n'
+        self.first = 1
+        self.starts = starts = [0]
+        pos = code.find(newline)
+        while pos >= 0:
+            starts.append(pos + 1)
+            pos = code.find(newline, pos + 1)
+
+    def __len__(self):
+        """Number of the last line"""
+        return self.first - 1 + len(self.starts)
+
+    def append(self, text):
+        """Add text (of the same kind as code) to the end of the code."""
+        newline = b'\n' if self.binary else '\n'
+        offset = len(self.code)
+        pos = text.find(newline)
+        while pos >= 0:
+            self.starts.append(offset + pos + 1)
+            pos = text.find(newline, pos + 1)
+        self.code += text
+
+    def discard(self, line_num):
+        """Drop the lines before line `line_num` from the code.
+    Returns the number of characters removed from its start."""
+        count = line_num - self.first
+        if count <= 0:
+            return 0
+        delta = self.starts[count]
+        self.code = self.code[delta:]
+        self.starts = [start - delta for start in self.starts[count:]]
+        self.first = line_num
+        return delta
+
+    def replace(self, start, end, text, code):
+        """Update the index after code[start:end] got replaced by text,
+    resulting in new source code.  (Assumes no lines were discarded.)"""
+        newline = b'\n' if self.binary else '\n'
+        delta = len(text) - (end - start)
+        first = bisect.bisect_right(self.starts, start)
+        last = bisect.bisect_right(self.starts, end)
+        new_starts = []
+        pos = text.find(newline)
+        while pos >= 0:
+            new_starts.append(start + pos + 1)
+            pos = text.find(newline, pos + 1)
+        new_starts.extend((line_start + delta for line_start in self.starts[last:]))
+        self.starts[first:] = new_starts
+        self.code = code
+
+    def line_num(self, pos):
+        """Line number (1-indexed) containing the given offset"""
+        return bisect.bisect_right(self.starts, pos) + self.first - 1
+
+    def line_start(self, line_num):
+        return self.starts[line_num - self.first]
+
+    def line_end(self, line_num, keepends=False):
+        """Offset of the end of the given line, just before its newline
+    (or just after it if keepends is true)"""
+        index = line_num - self.first + 1
+        if index < len(self.starts):
+            return self.starts[index] - (0 if keepends else 1)
+        return len(self.code)
+
+    def line(self, line_num, keepends=False):
+        """Text of the given line (1-indexed)"""
+        start = self.starts[line_num - self.first]
+        line = self.code[start:self.line_end(line_num, keepends)]
+        if self.binary:
+            line = line.decode('ascii')
+        return line
+
+def shifted(column, delta):
+    """Array column with delta added to every entry"""
+    if delta:
+        return map(delta.__add__, column)
+    return column
+
+class TokenBuffer:
+    """Compact list-like store of tokens.
+
+  Instead of a TokenInfo per token, keeps parallel arrays of token types,
+  start line numbers, line spans and start/end columns, plus an index into
+  a table of the distinct token strings, and the tokens' kind ids (see
+  SymbolTable).  Indexing builds TokenInfo objects on demand, caching
+  recently built ones for the repeated peeks of a backtracking parser.
+
+  Tokens get added as raw records (type, string, start_line, start, end_line,
+  end) where start and end are offsets into the source.  The end column of
+  a multiline token is measured from the start of its first line.  Storing
+  columns rather than offsets, and line spans rather than end lines, means
+  that edits only shift the start line numbers of later tokens, and only if
+  they add or remove lines.
+
+  A parser can `discard` the tokens before an index it will never return
+  to; indices stay absolute, with the arrays starting at token `offset`.
+  """
+    lines: LineIndex
+    kinds: dict[str, int]
+    strings: list[str]
+    string_ids: dict[str, int]
+    offset: int
+    cache_size = 256
+
+    def __init__(self, lines, kinds):
+        self.lines = lines
+        self.kinds = kinds
+        self.strings = []
+        self.string_ids = {}
+        self.clear()
+
+    def clear(self):
+        self.types = array('i')
+        self.string_indices = array('i')
+        self.token_kinds = array('i')
+        self.start_lines = array('i')
+        self.start_cols = array('i')
+        self.line_spans = array('i')
+        self.end_cols = array('i')
+        self.offset = 0
+        self.clear_cache()
+
+    def clear_cache(self):
+        self.cache_indices = [-1] * self.cache_size
+        self.cache_tokens = [None] * self.cache_size
+        self.line_cache = [(0, None), (0, None)]
+
+    def columns(self):
+        return [self.types, self.string_indices, self.token_kinds, self.start_lines, self.start_cols, self.line_spans, self.end_cols]
+
+    def discard(self, index):
+        """Drop the tokens before `index`, keeping later indices unchanged.
+    The string table shrinks to the strings of the remaining tokens."""
+        count = index - self.offset
+        if count <= 0:
+            return
+        for column in self.columns():
+            del column[:count]
+        self.offset = index
+        old_strings = self.strings[:]
+        del self.strings[:]
+        self.string_ids.clear()
+        string_indices = self.string_indices
+        for (i, string_index) in enumerate(string_indices):
+            string = old_strings[string_index]
+            string_index = self.string_ids.get(string)
+            if string_index is None:
+                string_index = self.string_ids[string] = len(self.strings)
+                self.strings.append(string)
+            string_indices[i] = string_index
+
+    def truncate(self, length):
+        """Remove the tokens from index `length` on, and return them as a tail
+    record for `extend`.  (Assumes no tokens were discarded.)"""
+        columns = self.columns()
+        tail = tuple((column[length:] for column in columns))
+        for column in columns:
+            del column[length:]
+        self.clear_cache()
+        return tail
+
+    def extend(self, tail, start, line_delta):
+        """Append the tokens from index `start` of a tail record (as returned by
+    `truncate`), shifting their line numbers by line_delta."""
+        (types, string_indices, token_kinds, start_lines, start_cols, line_spans, end_cols) = tail
+        self.types.extend(types[start:])
+        self.string_indices.extend(string_indices[start:])
+        self.token_kinds.extend(token_kinds[start:])
+        self.start_lines.extend(shifted(start_lines[start:], line_delta))
+        self.start_cols.extend(start_cols[start:])
+        self.line_spans.extend(line_spans[start:])
+        self.end_cols.extend(end_cols[start:])
+
+    def __len__(self):
+        return self.offset + len(self.types)
+
+    def __iter__(self):
+        index = self.offset
+        while index < len(self):
+            yield self[index]
+            index += 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        i = index - self.offset
+        if i < 0:
+            raise IndexError('token index out of range')
+        slot = index & self.cache_size - 1
+        if self.cache_indices[slot] == index:
+            return self.cache_tokens[slot]
+        start_line = self.start_lines[i]
+        tok = TokenInfo(self.types[i], self.strings[self.string_indices[i]], (start_line, self.start_cols[i]), (start_line + self.line_spans[i], self.end_cols[i]), self.line(start_line))
+        self.cache_indices[slot] = index
+        self.cache_tokens[slot] = tok
+        return tok
+
+    def append(self, type, string, start_line, start, end_line, end):
+        string_index = self.string_ids.get(string)
+        if string_index is None:
+            string_index = self.string_ids[string] = len(self.strings)
+            self.strings.append(string)
+        lines = self.lines
+        line_start = lines.starts[start_line - lines.first]
+        self.types.append(type)
+        self.string_indices.append(string_index)
+        if type == token.NAME or type == token.OP:
+            self.token_kinds.append(self.kinds.get(string, type))
+        else:
+            self.token_kinds.append(type)
+        self.start_lines.append(start_line)
+        self.start_cols.append(start - line_start)
+        self.line_spans.append(end_line - start_line)
+        self.end_cols.append(end - line_start)
+
+    def type(self, index):
+        return self.types[index - self.offset]
+
+    def string(self, index):
+        return self.strings[self.string_indices[index - self.offset]]
+
+    def kind(self, index):
+        return self.token_kinds[index - self.offset]
+
+    def token(self, type, string, start_line, start, end_line, end):
+        """Build a TokenInfo from a raw token record"""
+        line_start = self.lines.line_start(start_line)
+        return TokenInfo(type, string, (start_line, start - line_start), (end_line, end - line_start), self.line(start_line))
+
+    def line(self, line_num):
+        slot = line_num & 1
+        (cached_num, line) = self.line_cache[slot]
+        if not cached_num == line_num:
+            line = self.lines.line(line_num)
+            self.line_cache[slot] = (line_num, line)
+        return line
 
 class Lexer:
     code: str
+    binary: bool
     len: int
     pos: int
     line_num: int
     line_start: int
+    next_line_start: int
     line: str
+    lines: LineIndex
     indent: int
     indents: list[int]
-    tokens: list[TokenInfo]
+    tokens: TokenBuffer
+    last_type: int
+    last_string: str
+    stream: bool
+    symbols: SymbolTable
+    recover: bool
+    diagnostics: list[Diagnostic]
+    checkpoints: list[tuple]
+    input: io.TextIOBase
+    eof: bool
 
-    def __init__(self, code, filename=''):
+    def __init__(self, code, filename='', stream=False, incremental=False, symbols=symbols, recover=False):
         self.filename = filename
-        if hasattr(code, 'read'):
+        self.stream = stream
+        self.symbols = symbols
+        self.recover = recover
+        self.diagnostics = []
+        self.input = None
+        self.eof = True
+        if stream and isinstance(code, io.TextIOBase):
+            self.input = code
+            self.eof = False
+            code = ''
+        elif hasattr(code, 'read') and (not is_binary(code)):
             code = code.read()
+        self.binary = is_binary(code)
+        if self.binary:
+            try:
+                encoding = detect_encoding(code)
+                if NonASCII.search(code):
+                    code = str(code, encoding)
+                    self.binary = False
+            except (SyntaxError, UnicodeDecodeError) as error:
+                raise decode_error(code, filename, error) from None
+        (self.any_token, self.whitespace, self.newline_or_comment) = bytes_patterns if self.binary else str_patterns
         self.code = code
         self.len = len(code)
+        self.lines = LineIndex(code)
+        self.tokens = TokenBuffer(self.lines, self.symbols.kinds)
+        self.checkpoints = [] if incremental else None
+        if self.input is not None:
+            self.pos = self.line_num = 0
+            self.read_ahead()
+        self.start()
+        if not stream:
+            self.tokenize()
+
+    def start(self):
+        """Set up the lexer state for the start of the input."""
         self.pos = 0
-        self.line_start = self.pos
-        self.line_num = 1
-        self.set_line()
+        self.set_line(1)
         self.skip_blank_lines()
         self.indents = [self.measure_indent()[0]]
         self.nests = []
+        self.last_type = self.last_string = None
         self.start_line()
-        self.tokens = []
-        self.tokenize()
 
     def __iter__(self):
+        if self.stream:
+            return self.tokengen()
         return iter(self.tokens)
 
-    def set_line(self):
-        end_of_line = self.code.find('\n', self.line_start)
-        if end_of_line < 0:
-            end_of_line = self.len
-        self.line = self.code[self.line_start:end_of_line]
+    def set_line(self, line_num):
+        self.line_num = line_num
+        self.line_start = self.lines.line_start(line_num)
+        if line_num < len(self.lines):
+            self.next_line_start = self.lines.line_start(line_num + 1)
+        else:
+            self.next_line_start = self.len + 1
+
+    @property
+    def line(self):
+        return self.lines.line(self.line_num)
 
     def start_line(self):
         (self.indent, self.pos) = self.measure_indent()
         if self.pos == self.len:
             return
         indent = self.indents[-1]
-        if self.indent > indent:
-            self.indents.append(self.indent)
-            tok = self.indent_token(token.INDENT)
-            tok.closing = lambda tok2: tok2.type == token.DEDENT
-            self.nests.append(tok)
         while self.indent < indent:
             self.dedent()
             indent = self.indents[-1]
             if self.indent > indent:
                 self.error(f'dedent to {self.indent} but expected {self.indents[-1]}')
+        if self.indent > indent:
+            self.indents.append(self.indent)
+            tok = self.indent_token(token.INDENT)
+            self.nests.append((token.DEDENT, None, tok))
 
     def indent_token(self, type, tok=None):
         if tok is None:
-            tok = TokenInfo(type, self.code[self.line_start:self.pos], (self.line_num, 0), (self.line_num, self.pos - self.line_start), self.line)
+            string = self.text(self.line_start, self.pos)
+            tok = (type, string, self.line_num, self.line_start, self.line_num, self.pos)
         else:
-            tok = TokenInfo(type, tok.string, tok.start, tok.end, tok.line)
-        self.tokens.append(tok)
+            tok = (type,) + tok[1:]
+        self.emit(*tok)
         return tok
 
     def dedent(self, tok=None):
@@ -97,107 +549,362 @@ class Lexer:
         self.unnest(tok)
         if not self.indents:
             self.error('dedent beyond global indent')
+            self.indents.append(self.indent)
 
     def unnest(self, tok):
+        """Close the innermost nest with the given closing token record."""
         while True:
             if not self.nests:
-                self.error(f'Extra closing {tok}')
-            nest = self.nests[-1]
-            if nest.closing(tok):
+                self.error(f'Extra closing {self.tokens.token(*tok)}')
+                return
+            (closing_type, closing_string, nest) = self.nests[-1]
+            if tok[0] == closing_type and (closing_string is None or tok[1] == closing_string):
                 return self.nests.pop()
-            elif nest.type == token.INDENT:
-                prev = self.prev()
-                if not (prev and prev.type == token.NEWLINE):
-                    self.tokens.append(TokenInfo(token.NEWLINE, tok.string, tok.start, tok.end, tok.line))
+            elif nest[0] == token.INDENT:
+                if not self.last_type == token.NEWLINE:
+                    self.emit(token.NEWLINE, *tok[1:])
                 self.dedent(tok)
             else:
-                self.error(f'{nest} closed by {tok}')
+                self.error(f'{self.tokens.token(*nest)} closed by {self.tokens.token(*tok)}')
+                return
 
     def measure_indent(self):
+        end = self.whitespace.match(self.code, self.pos).end()
         indent = 0
-        pos = self.pos
-        while pos < self.len:
-            char = self.code[pos]
+        for char in self.text(self.pos, end):
             if char == ' ':
                 indent += 1
             elif char == '\t':
                 indent = (indent // tabsize + 1) * tabsize
-            elif char == '\x0c':
-                indent = 0
             else:
-                break
-            pos += 1
-        return (indent, pos)
+                indent = 0
+        return (indent, end)
+
+    def text(self, start, end):
+        """Source text between the given offsets, as a str"""
+        text = self.code[start:end]
+        if self.binary:
+            text = text.decode('ascii')
+        return text
 
     def tokenize(self):
+        """Lex the entire input into `self.tokens`."""
         while self.pos < self.len:
+            self.scan_line()
+        self.finish()
+
+    def tokengen(self):
+        """Generate tokens lazily, lexing only as much input as needed to
+    produce the next token.  Yielded tokens are dropped from `self.tokens`,
+    so only the few tokens produced by the latest step are ever buffered."""
+        while True:
+            yield from self.tokens
+            self.tokens.clear()
+            if not self.advance():
+                return
+
+    def advance(self):
+        """Lex one more step of the input into `self.tokens`.
+    Returns False if there's nothing left to lex."""
+        if not self.eof:
+            self.read_ahead()
+        if self.pos < self.len:
             self.token()
+        elif len(self.indents) > 1:
+            self.finish()
+        else:
+            return False
+        return True
+
+    def read_ahead(self):
+        """Read enough of the input stream to lex the next token: the lines
+    through the first non-blank line after the current one (for newline
+    and indentation handling), and any triple-quoted string starting at
+    the current position."""
+        lines = self.lines
+        while len(lines) - 1 <= self.line_num or BlankLine.fullmatch(lines.line(len(lines) - 1, True)):
+            if not self.read_line():
+                break
+        if TripleStart.match(self.code, self.pos):
+            while self.any_token.match(self.code, self.pos).lastgroup != 'TRIPLE':
+                if not self.read_line():
+                    break
+        if self.line_num:
+            self.set_line(self.line_num)
+
+    def read_line(self):
+        """Append the next line of the input stream to the code.
+    Returns False at the end of the stream."""
+        line = self.input.readline()
+        if not line:
+            self.eof = True
+            return False
+        self.lines.append(line)
+        self.code = self.lines.code
+        self.len = len(self.code)
+        return True
+
+    def discard_lines(self, line_num):
+        """Forget the input before line `line_num`, which no remaining token
+    refers to, to bound memory use when lexing a stream."""
+        delta = self.lines.discard(line_num)
+        if not delta:
+            return
+        self.code = self.lines.code
+        self.len -= delta
+        state = shift_state(self.state(), -delta, 0, 0, {})
+        self.pos = state[0]
+        self.nests = list(state[4])
+        self.set_line(self.line_num)
+
+    def finish(self):
+        """Close any indentation still open at the end of the input."""
         while len(self.indents) > 1:
             self.dedent()
 
+    def scan_line(self):
+        """Lex through the end of the current line.
+
+    Most tokens are plain Python names, numbers, strings and operators that
+    need none of the Parseltongue-specific handling, so they get appended
+    straight to the token buffer as the regex scanner matches them,
+    skipping the general `token` machinery.  Line breaks, brackets,
+    comments, continuations, multiline strings and errors still go
+    through `lexed`, which may resynchronize the scanner."""
+        tokens = self.tokens
+        strings = tokens.strings
+        string_ids = tokens.string_ids
+        append_type = tokens.types.append
+        append_string_index = tokens.string_indices.append
+        append_kind = tokens.token_kinds.append
+        kinds = self.symbols.kinds
+        append_start_line = tokens.start_lines.append
+        append_start_col = tokens.start_cols.append
+        append_line_span = tokens.line_spans.append
+        append_end_col = tokens.end_cols.append
+        intern = self.symbols.intern
+        canonical = self.symbols.canonical
+        binary = self.binary
+        nests = self.nests
+        scanner = self.any_token.scanner(self.code, self.pos)
+        line_num = self.line_num
+        line_start = self.line_start
+        next_line_start = self.next_line_start
+        while (match := scanner.match()):
+            kind = match.lastgroup
+            type = token_types.get(kind)
+            (start, end) = match.span(kind)
+            if type is None or end >= next_line_start:
+                self.lexed(match)
+                if kind == 'NEWLINE':
+                    return
+                if self.line_num != line_num:
+                    line_num = self.line_num
+                    line_start = self.line_start
+                    next_line_start = self.next_line_start
+                continue
+            string = match.group(kind)
+            token_kind = type
+            if type == token.NAME or type == token.OP:
+                string = canonical.get(string) or intern(string)
+                token_kind = kinds.get(string, type)
+                if type == token.OP:
+                    if string in nest_open_ops:
+                        tok = (type, string, line_num, start, line_num, end)
+                        nests.append((token.OP, nest_open_ops[string], tok))
+                    elif string in nest_close_ops:
+                        if not (nests and nests[-1][1] == string):
+                            self.lexed(match)
+                            continue
+                        nests.pop()
+            elif binary:
+                string = string.decode('ascii')
+            string_index = string_ids.get(string)
+            if string_index is None:
+                string_index = string_ids[string] = len(strings)
+                strings.append(string)
+            append_type(type)
+            append_string_index(string_index)
+            append_kind(token_kind)
+            append_start_line(line_num)
+            append_start_col(start - line_start)
+            append_line_span(0)
+            append_end_col(end - line_start)
+            self.last_type = type
+            self.last_string = string
+            self.pos = end
+        if self.pos < self.len:
+            self.token()
+
     def token(self):
-        match = Whitespace.match(self.code, self.pos)
-        (start, end) = match.span()
-        self.pos += end - start
-        for (type, rec) in token_rec:
-            if (match := rec.match(self.code, self.pos)):
-                self.token_from_match(type, match)
-                break
+        match = self.any_token.match(self.code, self.pos)
+        if not match:
+            self.pos = self.whitespace.match(self.code, self.pos).end()
+            self.error('failed to parse token')
+            self.pos += 1
+            return
+        self.lexed(match)
+
+    def lexed(self, match):
+        """Process a match of the token regex."""
+        kind = match.lastgroup
+        if kind in token_types:
+            self.token_from_match(token_types[kind], match, kind)
+        elif kind == 'NEWLINE':
+            newline = self.last_type is not None and self.last_type != token.NEWLINE and (not implicit_continuation(self.last_type, self.last_string))
+            self.token_from_match(token.NEWLINE if newline else None, match, kind)
+            if self.checkpoints is not None:
+                self.checkpoints.append(self.state() + (newline,))
+            self.next_line(newline)
         else:
-            if (match := Newline.match(self.code, self.pos)):
-                prev = self.prev()
-                newline = prev and prev.type != token.NEWLINE and (not implicit_continuation(prev))
-                self.token_from_match(token.NEWLINE if newline else None, match)
-                self.skip_blank_lines()
-                if newline:
-                    self.start_line()
-            elif (match := Comment.match(self.code, self.pos)):
-                self.token_from_match(None, match)
-            elif (match := Continuation.match(self.code, self.pos)):
-                self.token_from_match(None, match)
-            else:
-                self.error('failed to parse token')
+            self.token_from_match(None, match, kind)
+
+    def next_line(self, newline):
+        self.skip_blank_lines()
+        if newline:
+            self.start_line()
 
     def skip_blank_lines(self):
         """Skip over any blank/comment-only lines,
       in particular to ignore indentation."""
-        while (match := NewlineOrComment.match(self.code, self.pos)):
+        while (match := self.newline_or_comment.match(self.code, self.pos)):
             self.token_from_match(None, match)
 
-    def token_from_match(self, type, match):
-        (start, end) = match.span()
-        end_line_start = self.code.rfind('\n', start, end)
-        if end_line_start < 0:
-            end_line_start = self.line_start
+    def token_from_match(self, type, match, group=0):
+        (start, end) = match.span(group)
+        if end < self.next_line_start:
             end_line_num = self.line_num
         else:
-            end_line_start += 1
-            end_line_num = self.line_num + self.code.count('\n', start, end)
-        tok = TokenInfo(type, match.group(), (self.line_num, start - self.line_start), (end_line_num, end - self.line_start), self.line)
-        self.line_start = end_line_start
-        self.line_num = end_line_num
-        self.set_line()
-        self.pos += end - start
+            end_line_num = self.lines.line_num(end)
+        start_line_num = self.line_num
+        if not end_line_num == start_line_num:
+            self.set_line(end_line_num)
+        self.pos = end
+        if not type:
+            return
+        string = match.group(group)
+        if type == token.NAME or type == token.OP:
+            string = self.symbols.intern(string)
+        elif self.binary:
+            string = string.decode('ascii')
         if type == token.OP:
-            if tok.string in nest_open_ops:
-                closing = nest_open_ops[tok.string]
-                tok.closing = lambda tok2: tok2.type == token.OP and tok2.string == closing
-                self.nests.append(tok)
-            elif tok.string in nest_close_ops:
-                self.unnest(tok)
-        if type:
-            self.tokens.append(tok)
-        return tok
+            if string in nest_open_ops:
+                tok = (type, string, start_line_num, start, end_line_num, end)
+                self.nests.append((token.OP, nest_open_ops[string], tok))
+            elif string in nest_close_ops:
+                self.unnest((type, string, start_line_num, start, end_line_num, end))
+        self.emit(type, string, start_line_num, start, end_line_num, end)
+
+    def emit(self, type, string, start_line, start, end_line, end):
+        self.tokens.append(type, string, start_line, start, end_line, end)
+        self.last_type = type
+        self.last_string = string
+
+    def emit_endmarker(self):
+        self.tokens.append(token.ENDMARKER, '', self.line_num, self.line_start, self.line_num, self.lines.line_end(self.line_num))
+
+    def state(self):
+        """Lexer state between tokens, as a tuple
+    (pos, line_num, number of tokens, indents, nests, last type, last string)"""
+        return (self.pos, self.line_num, len(self.tokens), tuple(self.indents)) + (tuple(self.nests), self.last_type, self.last_string)
+
+    def restore(self, state):
+        (pos, line_num, count, indents, nests, self.last_type, self.last_string) = state[:7]
+        self.pos = pos
+        self.set_line(line_num)
+        self.indents = list(indents)
+        self.nests = list(nests)
+
+    def edit(self, start, end, text):
+        """Replace code[start:end] with text, and update the tokens to match.
+
+    Relexing starts from the last checkpoint (the state just after a newline)
+    before the edit, and stops at the first checkpoint after the edit where
+    the lexer state (indentation, open brackets, previous token) is the same
+    as at the corresponding checkpoint before the edit.  From there on, the
+    old tokens are reused, shifted to their new positions.  Requires a
+    non-streaming Lexer constructed with incremental = True.
+
+    Relexing is proportional to the size of the edit, but shifting is still
+    linear in the rest of the file: every later checkpoint is rebuilt and
+    the token columns after the edit are copied (about 0.1 s per edit on
+    40,000 lines).
+
+    Returns (index, removed, added), meaning that the old
+    tokens[index:index + removed] got replaced by tokens[index:index + added].
+    """
+        if self.stream or self.checkpoints is None:
+            raise ValueError('edit requires a non-streaming incremental Lexer')
+        if self.binary:
+            if text.isascii():
+                text = text.encode('ascii')
+            else:
+                self.decode()
+        delta = len(text) - (end - start)
+        old_final = self.state()
+        self.code = self.code[:start] + text + self.code[end:]
+        self.len = len(self.code)
+        self.lines.replace(start, end, text, self.code)
+        count = bisect.bisect_left(self.checkpoints, (start + 1,))
+        old_checkpoints = self.checkpoints[count:]
+        del self.checkpoints[count:]
+        if count:
+            resume = self.checkpoints[-1]
+            index = resume[2]
+        else:
+            index = 0
+        tail = self.tokens.truncate(index)
+        if count:
+            self.restore(resume)
+            self.next_line(resume[7])
+        else:
+            self.start()
+        edit_end = start + len(text)
+        old = 0
+        while self.pos < self.len:
+            checkpoints = len(self.checkpoints)
+            self.token()
+            if not len(self.checkpoints) > checkpoints:
+                continue
+            new_state = self.checkpoints[-1]
+            if not new_state[0] >= edit_end:
+                continue
+            while old < len(old_checkpoints) and old_checkpoints[old][0] + delta < new_state[0]:
+                old += 1
+            if not (old < len(old_checkpoints) and same_state(old_checkpoints[old], new_state, delta)):
+                continue
+            old_state = old_checkpoints[old]
+            line_delta = new_state[1] - old_state[1]
+            count_delta = new_state[2] - old_state[2]
+            nests = dict(zip(old_state[4], new_state[4]))
+            shift = lambda state: shift_state(state, delta, line_delta, count_delta, nests)
+            self.tokens.truncate(new_state[2])
+            self.tokens.extend(tail, old_state[2] - index, line_delta)
+            for state in old_checkpoints[old + 1:]:
+                self.checkpoints.append(shift(state))
+            self.restore(shift(old_final))
+            return (index, old_state[2] - index, new_state[2] - index)
+        self.finish()
+        return (index, old_final[2] - index, len(self.tokens) - index)
 
-    def prev(self):
-        if self.tokens:
-            return self.tokens[-1]
+    def decode(self):
+        """Switch from lexing bytes to lexing decoded str."""
+        self.code = self.text(0, self.len)
+        self.binary = self.lines.binary = False
+        self.lines.code = self.code
+        (self.any_token, self.whitespace, self.newline_or_comment) = str_patterns
 
     def error(self, msg):
-        self.dump()
-        raise ParselTongueLexerError('\n'.join([f'{self.filename}:{self.line_num}.{self.pos - self.line_start + 1} - {msg}', self.line, ' ' * (self.pos - self.line_start) + '^']))
+        """Report an error at the current position: raise it, or if recovering,
+    record it in `self.diagnostics` and return so lexing can continue."""
+        diagnostic = Diagnostic(self.filename, self.line_num, self.pos - self.line_start + 1, msg, self.lines.line(self.line_num))
+        self.diagnostics.append(diagnostic)
+        if not self.recover:
+            raise ParselTongueLexerError([diagnostic])
 
     def dump(self, columns=False):
+        if not self.tokens:
+            return
         line = None
         line_width = len(str(self.tokens[-1].start[0]))
         for token in self:
@@ -212,26 +919,129 @@ class Lexer:
             print(f'{tok_name[token.type]}{repr(token.string)}', end='')
         print()
 
+def same_state(old, new, delta):
+    """Whether old lexer checkpoint, shifted by delta, matches new checkpoint
+  (ignoring the positions of open brackets)"""
+    return old[0] + delta == new[0] and old[3] == new[3] and (old[5:] == new[5:]) and (len(old[4]) == len(new[4])) and all((a[:2] == b[:2] for (a, b) in zip(old[4], new[4])))
+
+def shift_state(state, delta, line_delta, count_delta, nests):
+    """Shift an old lexer checkpoint after an edit.  `nests` maps old nests to
+  their shifted versions; it starts out mapping the nests that were open at
+  the resynchronization point to their relexed versions, and gets extended
+  so that checkpoints keep sharing nest tuples."""
+    (pos, line_num, count, indents, old_nests) = state[:5]
+    if old_nests:
+        new_nests = []
+        for nest in old_nests:
+            if not nest in nests:
+                (type, string, start_line, start, end_line, end) = nest[2]
+                tok = (type, string, start_line + line_delta, start + delta)
+                tok += (end_line + line_delta, end + delta)
+                nests[nest] = nest[:2] + (tok,)
+            new_nests.append(nests[nest])
+        old_nests = tuple(new_nests)
+    return (pos + delta, line_num + line_delta, count + count_delta, indents) + (old_nests,) + state[5:]
+
 class Tokenizer(pegen.tokenizer.Tokenizer):
+    """pegen Tokenizer that lexes on demand directly into the lexer's compact
+  TokenBuffer, instead of keeping its own list of TokenInfo objects."""
+    _furthest: int
 
     def __init__(self, file, filename):
+        self.lexer = Lexer(file, filename, stream=True)
+        super().__init__(iter(()), path=filename)
+        self._tokens = self.lexer.tokens
+        self._furthest = 0
+
+    def peek(self):
+        tokens = self._tokens
+        while self._index - tokens.offset == len(tokens.types):
+            if not self.lexer.advance():
+                self.lexer.emit_endmarker()
+        if self._index > self._furthest:
+            self._furthest = self._index
+        return tokens[self._index]
+
+    def peek_kind(self):
+        """Kind id of the next token (see SymbolTable), without building
+    a TokenInfo"""
+        tokens = self._tokens
+        index = self._index - tokens.offset
+        while index == len(tokens.types):
+            if not self.lexer.advance():
+                self.lexer.emit_endmarker()
+        if self._index > self._furthest:
+            self._furthest = self._index
+        return tokens.token_kinds[index]
+
+    def diagnose(self):
+        """The furthest token the parser has peeked at, where it failed.
+    (pegen's returns the last token lexed, but each lexer step can buffer
+    several tokens beyond the parser's reach.)"""
+        index = self._index
+        self._index = self._furthest
+        try:
+            return self.peek()
+        finally:
+            self._index = index
+
+    def last_non_whitespace(self, index):
+        """Index of the last token before `index` that isn't ENDMARKER, NEWLINE,
+    INDENT or DEDENT (or else of the first token still kept)"""
+        tokens = self._tokens
+        index -= 1
+        while index > tokens.offset:
+            type = tokens.type(index)
+            if type != token.ENDMARKER and (type < token.NEWLINE or type > token.DEDENT):
+                break
+            index -= 1
+        return index
+
+    def get_last_non_whitespace_token(self):
+        return self._tokens[self.last_non_whitespace(self._index)]
+
+    def discard(self, index):
+        """Drop the tokens before `index`, which the parser will never revisit,
+    except for the last non-whitespace one: get_last_non_whitespace_token
+    may still need it to compute end positions.  When lexing a stream,
+    also drop the input lines before the remaining tokens."""
+        tokens = self._tokens
+        tokens.discard(self.last_non_whitespace(index))
+        if self.lexer.input is not None and tokens.types:
+            self.lexer.discard_lines(tokens.start_lines[0])
 
-        def tokengen():
-            lexer = Lexer(file, filename)
-            yield from iter(lexer)
-            while True:
-                yield TokenInfo(token.ENDMARKER, '', (lexer.line_num, 0), (lexer.line_num, len(lexer.line)), lexer.line)
-        super().__init__(tokengen(), path=filename)
+    def get_lines(self, line_numbers):
+        """Retrieve source lines from the lexer's line index
+    (instead of rereading the file)"""
+        return [self.lexer.lines.line(line_num, True) for line_num in line_numbers]
 
 def main():
     import argparse, sys
     argparser = argparse.ArgumentParser('lexer.py')
     argparser.add_argument('filenames', metavar='file.pt', nargs='+', help='Parseltongue source files')
     argparser.add_argument('-c', '--columns', dest='columns', action='store_true', help='show column numbers')
+    argparser.add_argument('-s', '--symbols', dest='symbols', action='store_true', help='show table of interned symbols')
+    argparser.add_argument('-k', '--keep-going', dest='recover', action='store_true', help='keep lexing after errors, reporting all')
     args = argparser.parse_args()
+    errors = 0
     for filename in args.filenames:
         print(f'# {filename}')
-        lexer = Lexer(open(filename, 'r').read(), filename)
-        lexer.dump(columns=args.columns)
+        with util.source_bytes(filename) as source:
+            try:
+                lexer = Lexer(source, filename, recover=args.recover)
+            except ParselTongueLexerError as error:
+                print(error)
+                errors += 1
+                continue
+            lexer.dump(columns=args.columns)
+        for diagnostic in lexer.diagnostics:
+            print(diagnostic)
+        errors += len(lexer.diagnostics)
+    if args.symbols:
+        print(f'# {len(symbols)} symbols')
+        for (id, symbol) in enumerate(symbols):
+            print(id, symbol)
+    if errors:
+        sys.exit(1)
 if __name__ == '__main__':
     main()
@@ -0,0 +1,260 @@
+"""Packrat memoization for the generated Parseltongue parser
+
+Replaces pegen's `memoize` and `memoize_left_rec`, which key one big dict
+by (mark, rule name, args) tuples and probe it twice per call.  Here every
+memoized rule gets a small integer slot when it is decorated, and results
+are stored per token position: `parser._memo[mark - parser._memo_base]` is
+a dict mapping slots to results, plus `~slot` to the end mark for results
+that moved past mark.  `Parser.commit` drops the entries before a position
+the parser will never backtrack past.
+Rules with an argument (in practice just `expect`) keep a small table per
+position and rule, mapping the argument to its result (and end mark).
+Neither a memo hit nor a miss allocates a tuple.
+
+Terminals (keywords, operators and token types) aren't memoized at all:
+the generated parser matches them with `Parser.terminal`, comparing
+the kind id that the lexer assigned to the next token (see
+lexer.SymbolTable) against the terminal's.
+"""
+import token
+import pegen.parser
+from pegen.parser import logger
+missing = object()
+rule_names = []
+
+def new_slot(method):
+    rule_names.append(method.__name__)
+    return len(rule_names) - 1
+
+def memo_entry(parser, mark):
+    """Memo dict for the given token position, adding positions as needed"""
+    memo = parser._memo
+    index = mark - parser._memo_base
+    while len(memo) <= index:
+        memo.append({})
+    return memo[index]
+
+def memoize(method):
+    """Memoize a rule method."""
+    if method.__code__.co_argcount > 1:
+        return memoize_args(method)
+    slot = new_slot(method)
+    end_slot = ~slot
+    method_name = method.__name__
+
+    def memoize_wrapper(self):
+        mark = self._mark()
+        memo = self._memo
+        index = mark - self._memo_base
+        if index < len(memo):
+            entry = memo[index]
+            tree = entry.get(slot, missing)
+            if tree is not missing and (not self._verbose):
+                self._reset(entry.get(end_slot, mark))
+                return tree
+        else:
+            entry = memo_entry(self, mark)
+            tree = missing
+        verbose = self._verbose
+        fill = '  ' * self._level
+        if tree is missing:
+            if verbose:
+                print(f'{fill}{method_name}() ... (looking at {self.showpeek()})')
+            self._level += 1
+            tree = method(self)
+            self._level -= 1
+            if verbose:
+                print(f'{fill}... {method_name}() -> {str(tree):.200}')
+            entry[slot] = tree
+            endmark = self._mark()
+            if not endmark == mark:
+                entry[end_slot] = endmark
+        else:
+            if verbose:
+                print(f'{fill}{method_name}() -> {str(tree):.200}')
+            self._reset(entry.get(end_slot, mark))
+        return tree
+    memoize_wrapper.__wrapped__ = method
+    return memoize_wrapper
+
+def memoize_args(method):
+    """Memoize a rule method taking an argument.  Per position, the rule's
+  slot maps to a table from argument to result, and `~slot` to a table
+  from argument to end mark (for results that moved past mark)."""
+    slot = new_slot(method)
+    end_slot = ~slot
+    method_name = method.__name__
+
+    def memoize_wrapper(self, arg):
+        mark = self._mark()
+        memo = self._memo
+        index = mark - self._memo_base
+        if index < len(memo):
+            entry = memo[index]
+        else:
+            entry = memo_entry(self, mark)
+        trees = entry.get(slot)
+        if trees is None:
+            trees = entry[slot] = {}
+        tree = trees.get(arg, missing)
+        verbose = self._verbose
+        if tree is missing:
+            if verbose:
+                fill = '  ' * self._level
+                peek = self.showpeek()
+                print(f'{fill}{method_name}({arg!r}) ... (looking at {peek})')
+            self._level += 1
+            tree = method(self, arg)
+            self._level -= 1
+            if verbose:
+                print(f'{fill}... {method_name}({arg!r}) -> {str(tree):.200}')
+            trees[arg] = tree
+            endmark = self._mark()
+            if not endmark == mark:
+                ends = entry.get(end_slot)
+                if ends is None:
+                    ends = entry[end_slot] = {}
+                ends[arg] = endmark
+        else:
+            if verbose:
+                fill = '  ' * self._level
+                print(f'{fill}{method_name}({arg!r}) -> {str(tree):.200}')
+            ends = entry.get(end_slot)
+            if ends is not None:
+                self._reset(ends.get(arg, mark))
+        return tree
+    memoize_wrapper.__wrapped__ = method
+    return memoize_wrapper
+
+def memoize_left_rec(method):
+    """Memoize a left-recursive rule method, growing the seed result
+  as in pegen's `memoize_left_rec`."""
+    slot = new_slot(method)
+    end_slot = ~slot
+    method_name = method.__name__
+
+    def memoize_left_rec_wrapper(self):
+        mark = self._mark()
+        memo = self._memo
+        index = mark - self._memo_base
+        if index < len(memo):
+            entry = memo[index]
+        else:
+            entry = memo_entry(self, mark)
+        tree = entry.get(slot, missing)
+        verbose = self._verbose
+        fill = '  ' * self._level
+        if not tree is missing:
+            if verbose:
+                print(f'{fill}{method_name}() -> {str(tree):.200} [fresh]')
+            if tree:
+                self._reset(entry[end_slot])
+            return tree
+        if verbose:
+            print(f'{fill}{method_name} ... (looking at {self.showpeek()})')
+        self._level += 1
+        entry[slot] = None
+        entry[end_slot] = mark
+        lastresult = None
+        lastmark = mark
+        depth = 0
+        if verbose:
+            print(f'{fill}Recursive {method_name} at {mark} depth {depth}')
+        while True:
+            self._reset(mark)
+            self.in_recursive_rule += 1
+            try:
+                result = method(self)
+            finally:
+                self.in_recursive_rule -= 1
+            endmark = self._mark()
+            depth += 1
+            if verbose:
+                print(f'{fill}Recursive {method_name} at {mark} depth {depth}: ' + f'{str(result):.200} to {endmark}')
+            if not result:
+                if verbose:
+                    print(f'{fill}Fail with {str(lastresult):.200} to {lastmark}')
+                break
+            if endmark <= lastmark:
+                if verbose:
+                    print(f'{fill}Bailing with {str(lastresult):.200} to {lastmark}')
+                break
+            entry[slot] = lastresult = result
+            entry[end_slot] = lastmark = endmark
+        self._reset(lastmark)
+        tree = lastresult
+        self._level -= 1
+        if verbose:
+            print(f'{fill}{method_name}() -> {str(tree):.200} [cached]')
+        if tree:
+            endmark = self._mark()
+        else:
+            endmark = mark
+            self._reset(endmark)
+        entry[slot] = tree
+        entry[end_slot] = endmark
+        return tree
+    memoize_left_rec_wrapper.__wrapped__ = method
+    return memoize_left_rec_wrapper
+
+class Parser(pegen.parser.Parser):
+    """pegen Parser base class using the memo tables of this module"""
+    _memo: list[dict]
+    _memo_base: int
+    _commit_mark: int
+    soft_keyword_kinds = frozenset()
+    call_invalid_rules = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._memo = []
+        self._memo_base = self._commit_mark = 0
+
+    def commit(self, result):
+        """Cut point for grammar actions, returning `result`: the parser will
+    never backtrack before the current position, so forget the memo entries
+    for earlier positions, and let the tokenizer drop earlier tokens (if it
+    supports that).  Everything since the previous commit is kept, though:
+    after a failure, the second pass (see `enable_invalid_rules`) reparses
+    the last committed statement too, as invalid_* rules for a statement
+    can match beyond its valid prefix (e.g. an `else` without a block)."""
+        base = self._commit_mark
+        self._commit_mark = self._mark()
+        del self._memo[:base - self._memo_base]
+        self._memo_base = base
+        discard = getattr(self._tokenizer, 'discard', None)
+        if discard is not None:
+            discard(base)
+        return result
+
+    def enable_invalid_rules(self):
+        """Prepare for a second pass after a failed parse, which also tries the
+    `invalid_*` rules, to raise a more specific SyntaxError.  Reparsing
+    starts over from the start of the last committed statement (or the
+    start of the input), with an empty memo, as first-pass results may
+    differ from second-pass results."""
+        self._reset(self._memo_base)
+        self._memo.clear()
+        self.call_invalid_rules = True
+
+    def terminal(self, kind):
+        """Match the next token if it has the given kind id: a keyword or
+    operator kind from lexer.SymbolTable.kind, or a token type."""
+        tokenizer = self._tokenizer
+        if tokenizer.peek_kind() == kind:
+            return tokenizer.getnext()
+        return None
+
+    def name(self):
+        """Match a NAME token that isn't a (hard) keyword, by kind"""
+        tokenizer = self._tokenizer
+        kind = tokenizer.peek_kind()
+        if kind == token.NAME or kind in self.soft_keyword_kinds:
+            return tokenizer.getnext()
+        return None
+    number = memoize(pegen.parser.Parser.number.__wrapped__)
+    string = memoize(pegen.parser.Parser.string.__wrapped__)
+    op = memoize(pegen.parser.Parser.op.__wrapped__)
+    type_comment = memoize(pegen.parser.Parser.type_comment.__wrapped__)
+    soft_keyword = memoize(pegen.parser.Parser.soft_keyword.__wrapped__)
+    expect = memoize(pegen.parser.Parser.expect.__wrapped__)
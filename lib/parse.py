@@ -9,6 +9,7 @@ from typing import Any, Optional
 
 from pegen.parser import memoize, memoize_left_rec, logger, Parser
 
+import codecs
 import io
 import itertools
 import os
@@ -19,6 +20,8 @@ from typing import (
 )
 
 from pegen.tokenizer import Tokenizer
+from lexer import symbols
+from memo import Parser, logger, memoize, memoize_left_rec
 
 # Singleton ast nodes, created once for efficiency
 Load = ast.Load()
@@ -56,6 +59,49 @@ EXPR_NAME_MAPPING = {
     ast.NamedExpr: "named expression",
 }
 
+# Precedence levels of the operators from `disjunction` down to `power`,
+# for precedence climbing (see Parser.climb)
+(
+    OR, AND, NOT, COMPARE, BIT_OR, BIT_XOR, BIT_AND, SHIFT, SUM, TERM, FACTOR, POWER
+) = range(1, 13)
+
+# Binary, boolean and comparison operators by kind id: (precedence, op class)
+CLIMB_OPERATORS = {
+    symbols.kind(string): entry
+    for string, entry in {
+        "or": (OR, ast.Or),
+        "and": (AND, ast.And),
+        "==": (COMPARE, ast.Eq),
+        "!=": (COMPARE, ast.NotEq),
+        "<=": (COMPARE, ast.LtE),
+        "<": (COMPARE, ast.Lt),
+        ">=": (COMPARE, ast.GtE),
+        ">": (COMPARE, ast.Gt),
+        "not": (COMPARE, ast.NotIn),  # 'not' 'in'
+        "in": (COMPARE, ast.In),
+        "is": (COMPARE, ast.Is),  # or 'is' 'not'
+        "|": (BIT_OR, ast.BitOr),
+        "^": (BIT_XOR, ast.BitXor),
+        "&": (BIT_AND, ast.BitAnd),
+        "<<": (SHIFT, ast.LShift),
+        ">>": (SHIFT, ast.RShift),
+        "+": (SUM, ast.Add),
+        "-": (SUM, ast.Sub),
+        "*": (TERM, ast.Mult),
+        "/": (TERM, ast.Div),
+        "//": (TERM, ast.FloorDiv),
+        "%": (TERM, ast.Mod),
+        "@": (TERM, ast.MatMult),
+    }.items()
+}
+
+# Unary operators (`factor`) by kind id
+UNARY_OPERATORS = {
+    symbols.kind("+"): ast.UAdd,
+    symbols.kind("-"): ast.USub,
+    symbols.kind("~"): ast.Invert,
+}
+
 
 def parse_file(
     path: str,
@@ -107,6 +153,10 @@ class Parser(Parser):
     #: Name of the source file, used in error reports
     filename : str
 
+    #: Whether `disjunction` parses its operators by precedence climbing
+    #: instead of the rule cascade down to `power`
+    precedence_climbing = True
+
     def __init__(self,
         tokenizer: Tokenizer, *,
         verbose: bool = False,
@@ -180,19 +230,79 @@ class Parser(Parser):
             self.store_syntax_error("imaginary  number required in complex literal")
         return number
 
+    def decode_strings(self, tokens) -> Optional[ast.Constant]:
+        """Constant node for a concatenation of plain, raw or bytes STRING
+        tokens, decoded directly and with the same locations that
+        `ast.parse` would give (see generate_ast_for_string).  Returns None
+        for f-strings, errors, and anything unusual (non-ASCII or CR
+        characters, or a token right after another or on the last line of
+        a multiline one), which need the full parse."""
+        values = []
+        is_bytes = None
+        line = 0
+        end = None
+        for t in tokens:
+            string = t.string
+            if (not string.isascii() or "\r" in string
+                    or t.start[0] == line or t.start == end):
+                return None
+            end = t.end
+            quote = string.find(string[-1])
+            prefix = string[:quote].lower()
+            if "f" in prefix or is_bytes is not None and is_bytes != ("b" in prefix):
+                return None
+            is_bytes = "b" in prefix
+            if len(string) - quote >= 6 and string[quote] * 3 == string[quote:quote + 3]:
+                body = string[quote + 3:-3]
+            else:
+                body = string[quote + 1:-1]
+            try:
+                if "r" in prefix or "\\" not in body:
+                    values.append(body.encode("ascii") if is_bytes else body)
+                elif is_bytes:
+                    values.append(codecs.escape_decode(body.encode("ascii"))[0])
+                else:
+                    values.append(body.encode("ascii").decode("unicode_escape"))
+            except (UnicodeDecodeError, ValueError):
+                return None
+            if "\n" in string:
+                line = t.start[0] + string.count("\n")
+        first, last = tokens[0], tokens[-1]
+        lineno, col_offset = first.start
+        end_lineno = last.start[0] + last.string.count("\n")
+        if end_lineno == last.start[0]:
+            end_col_offset = last.start[1] + len(last.string)
+        else:
+            end_col_offset = len(last.string) - last.string.rindex("\n") - 1
+        if lineno == 1 and col_offset == 0:
+            # generate_ast_for_string parses with a "(" before the first line
+            col_offset += 1
+            if end_lineno == 1:
+                end_col_offset += 1
+        return ast.Constant(
+            value=(b"" if is_bytes else "").join(values),
+            kind="u" if first.string[0] == "u" else None,
+            lineno=lineno, col_offset=col_offset,
+            end_lineno=end_lineno, end_col_offset=end_col_offset,
+        )
+
     def generate_ast_for_string(self, tokens):
         """Generate AST nodes for strings."""
+        node = self.decode_strings(tokens)
+        if node is not None:
+            return node
         err_msg = ''
         line = 1
         col_offset = 0
-        source = ''
+        parts = []
         for t in tokens:
             n_line = t.start[0] - line
             if n_line:
                 col_offset = 0
-            source += """
-""" * n_line + ' ' * (t.start[1] - col_offset) + t.string
+            parts.append("""
+""" * n_line + ' ' * (t.start[1] - col_offset) + t.string)
             line, col_offset = t.end
+        source = ''.join(parts)
         if source[0] == ' ':
             source = '(' + source[1:]
         else:
@@ -240,6 +350,111 @@ class Parser(Parser):
         target.decorator_list = decorators
         return target
 
+    def climb_disjunction(self) -> Optional[ast.AST]:
+        return self.climb(OR)
+
+    def climb(self, level: int) -> Optional[ast.AST]:
+        """Parse operators of precedence at least `level` (and their operands)
+        in one pass, building the same tree as the rules from `disjunction`
+        down to `power` would: operands are `await_primary`s, and a failed
+        operator match backtracks to just before the operator."""
+        tokenizer = self._tokenizer
+        mark = self._mark()
+        kind = tokenizer.peek_kind()
+        start_lineno, start_col_offset = tokenizer.peek().start
+        if kind == KIND_not and level <= NOT or kind in UNARY_OPERATORS:
+            # inversion: 'not' inversion; factor: ('+' | '-' | '~') factor
+            tokenizer.getnext()
+            if kind == KIND_not:
+                op, operand = ast.Not, self.climb(NOT)
+            else:
+                op, operand = UNARY_OPERATORS[kind], self.climb(FACTOR)
+            if operand is None:
+                self._reset(mark)
+                return None
+            end_lineno, end_col_offset = tokenizer.get_last_non_whitespace_token().end
+            left = ast.UnaryOp(op=op(), operand=operand, lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset)
+        else:
+            left = self.await_primary()
+            if left is None:
+                return None
+            # power: await_primary '**' factor
+            if tokenizer.peek_kind() == KIND_DOUBLESTAR:
+                op_mark = self._mark()
+                tokenizer.getnext()
+                right = self.climb(FACTOR)
+                if right is None:
+                    self._reset(op_mark)
+                else:
+                    end_lineno, end_col_offset = tokenizer.get_last_non_whitespace_token().end
+                    left = ast.BinOp(left=left, op=ast.Pow(), right=right, lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset)
+
+        while True:
+            kind = tokenizer.peek_kind()
+            entry = CLIMB_OPERATORS.get(kind)
+            if entry is None or entry[0] < level:
+                return left
+            precedence, op = entry
+            op_mark = self._mark()
+            tokenizer.getnext()
+            if precedence == COMPARE:
+                # comparison: bitwise_or compare_op_bitwise_or_pair+
+                ops = []
+                comparators = []
+                while True:
+                    if kind == KIND_not:
+                        if tokenizer.peek_kind() != KIND_in:
+                            break
+                        tokenizer.getnext()
+                    elif kind == KIND_is and tokenizer.peek_kind() == KIND_not:
+                        tokenizer.getnext()
+                        op = ast.IsNot
+                    right = self.climb(BIT_OR)
+                    if right is None:
+                        break
+                    ops.append(op())
+                    comparators.append(right)
+                    op_mark = self._mark()
+                    kind = tokenizer.peek_kind()
+                    entry = CLIMB_OPERATORS.get(kind)
+                    if entry is None or entry[0] != COMPARE:
+                        break
+                    op = entry[1]
+                    tokenizer.getnext()
+                self._reset(op_mark)
+                if not ops:
+                    return left
+                end_lineno, end_col_offset = tokenizer.get_last_non_whitespace_token().end
+                left = ast.Compare(left=left, ops=ops, comparators=comparators, lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset)
+            elif precedence <= AND:
+                # disjunction, conjunction: operand (op operand)+
+                values = [left]
+                while True:
+                    right = self.climb(precedence + 1)
+                    if right is None:
+                        self._reset(op_mark)
+                        break
+                    values.append(right)
+                    if tokenizer.peek_kind() != kind:
+                        break
+                    op_mark = self._mark()
+                    tokenizer.getnext()
+                if len(values) == 1:
+                    return left
+                end_lineno, end_col_offset = tokenizer.get_last_non_whitespace_token().end
+                left = ast.BoolOp(op=op(), values=values, lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset)
+            else:
+                # bitwise_or through term: left-recursive binary operators
+                right = self.climb(precedence + 1)
+                if right is None:
+                    self._reset(op_mark)
+                    return left
+                end_lineno, end_col_offset = tokenizer.get_last_non_whitespace_token().end
+                node = ast.BinOp(left=left, op=op(), right=right, lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset)
+                if op is ast.MatMult:
+                    node = self.check_version((3, 5), "The '@' operator is", node)
+                left = node
+
     def get_comparison_ops(self, pairs):
         return [op for op, _ in pairs]
 
@@ -394,13 +609,267 @@ class Parser(Parser):
         raise self._exception
 
 
+# Kind ids of the terminals, which the lexer assigns to the tokens
+# spelling them
+KIND_False = symbols.kind('False')
+KIND_None = symbols.kind('None')
+KIND_True = symbols.kind('True')
+KIND__ = symbols.kind('_')
+KIND_and = symbols.kind('and')
+KIND_as = symbols.kind('as')
+KIND_assert = symbols.kind('assert')
+KIND_async = symbols.kind('async')
+KIND_await = symbols.kind('await')
+KIND_break = symbols.kind('break')
+KIND_case = symbols.kind('case')
+KIND_class = symbols.kind('class')
+KIND_continue = symbols.kind('continue')
+KIND_def = symbols.kind('def')
+KIND_del = symbols.kind('del')
+KIND_elif = symbols.kind('elif')
+KIND_else = symbols.kind('else')
+KIND_except = symbols.kind('except')
+KIND_finally = symbols.kind('finally')
+KIND_for = symbols.kind('for')
+KIND_from = symbols.kind('from')
+KIND_global = symbols.kind('global')
+KIND_if = symbols.kind('if')
+KIND_import = symbols.kind('import')
+KIND_in = symbols.kind('in')
+KIND_is = symbols.kind('is')
+KIND_lambda = symbols.kind('lambda')
+KIND_loop = symbols.kind('loop')
+KIND_match = symbols.kind('match')
+KIND_nonlocal = symbols.kind('nonlocal')
+KIND_not = symbols.kind('not')
+KIND_or = symbols.kind('or')
+KIND_pass = symbols.kind('pass')
+KIND_raise = symbols.kind('raise')
+KIND_return = symbols.kind('return')
+KIND_try = symbols.kind('try')
+KIND_unless = symbols.kind('unless')
+KIND_until = symbols.kind('until')
+KIND_while = symbols.kind('while')
+KIND_with = symbols.kind('with')
+KIND_yield = symbols.kind('yield')
+KIND_NOTEQUAL = symbols.kind('!=')
+KIND_PERCENT = symbols.kind('%')
+KIND_PERCENTEQUAL = symbols.kind('%=')
+KIND_AMPER = symbols.kind('&')
+KIND_AMPEREQUAL = symbols.kind('&=')
+KIND_LPAR = symbols.kind('(')
+KIND_RPAR = symbols.kind(')')
+KIND_STAR = symbols.kind('*')
+KIND_DOUBLESTAR = symbols.kind('**')
+KIND_DOUBLESTAREQUAL = symbols.kind('**=')
+KIND_STAREQUAL = symbols.kind('*=')
+KIND_PLUS = symbols.kind('+')
+KIND_PLUSEQUAL = symbols.kind('+=')
+KIND_COMMA = symbols.kind(',')
+KIND_MINUS = symbols.kind('-')
+KIND_MINEQUAL = symbols.kind('-=')
+KIND_RARROW = symbols.kind('->')
+KIND_DOT = symbols.kind('.')
+KIND_ELLIPSIS = symbols.kind('...')
+KIND_SLASH = symbols.kind('/')
+KIND_DOUBLESLASH = symbols.kind('//')
+KIND_DOUBLESLASHEQUAL = symbols.kind('//=')
+KIND_SLASHEQUAL = symbols.kind('/=')
+KIND_COLON = symbols.kind(':')
+KIND_COLONEQUAL = symbols.kind(':=')
+KIND_SEMI = symbols.kind(';')
+KIND_LESS = symbols.kind('<')
+KIND_LEFTSHIFT = symbols.kind('<<')
+KIND_LEFTSHIFTEQUAL = symbols.kind('<<=')
+KIND_LESSEQUAL = symbols.kind('<=')
+KIND_EQUAL = symbols.kind('=')
+KIND_EQEQUAL = symbols.kind('==')
+KIND_GREATER = symbols.kind('>')
+KIND_GREATEREQUAL = symbols.kind('>=')
+KIND_RIGHTSHIFT = symbols.kind('>>')
+KIND_RIGHTSHIFTEQUAL = symbols.kind('>>=')
+KIND_AT = symbols.kind('@')
+KIND_ATEQUAL = symbols.kind('@=')
+KIND_LSQB = symbols.kind('[')
+KIND_RSQB = symbols.kind(']')
+KIND_CIRCUMFLEX = symbols.kind('^')
+KIND_CIRCUMFLEXEQUAL = symbols.kind('^=')
+KIND_LBRACE = symbols.kind('{')
+KIND_VBAR = symbols.kind('|')
+KIND_VBAREQUAL = symbols.kind('|=')
+KIND_RBRACE = symbols.kind('}')
+KIND_TILDE = symbols.kind('~')
+
+# FIRST sets: kinds of the tokens that can start a rule or
+# alternative.  Rules try only the alternatives the next token
+# can start.
+FIRST_0 = frozenset({tokenize.ENDMARKER, tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_AT, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_assert, KIND_async, KIND_await, KIND_break, KIND_case, KIND_class, KIND_continue, KIND_def, KIND_del, KIND_for, KIND_from, KIND_global, KIND_if, KIND_import, KIND_lambda, KIND_loop, KIND_match, KIND_nonlocal, KIND_not, KIND_pass, KIND_raise, KIND_return, KIND_try, KIND_unless, KIND_until, KIND_while, KIND_with, KIND_yield, KIND_LBRACE, KIND_TILDE})
+FIRST_1 = frozenset({tokenize.ENDMARKER, tokenize.NAME, tokenize.NEWLINE, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_AT, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_assert, KIND_async, KIND_await, KIND_break, KIND_case, KIND_class, KIND_continue, KIND_def, KIND_del, KIND_for, KIND_from, KIND_global, KIND_if, KIND_import, KIND_lambda, KIND_loop, KIND_match, KIND_nonlocal, KIND_not, KIND_pass, KIND_raise, KIND_return, KIND_try, KIND_unless, KIND_until, KIND_while, KIND_with, KIND_yield, KIND_LBRACE, KIND_TILDE})
+FIRST_2 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_lambda, KIND_match, KIND_not, KIND_LBRACE, KIND_TILDE})
+FIRST_3 = frozenset({KIND_LPAR})
+FIRST_4 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_lambda, KIND_match, KIND_not, KIND_LBRACE, KIND_TILDE})
+FIRST_5 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_AT, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_assert, KIND_async, KIND_await, KIND_break, KIND_case, KIND_class, KIND_continue, KIND_def, KIND_del, KIND_for, KIND_from, KIND_global, KIND_if, KIND_import, KIND_lambda, KIND_loop, KIND_match, KIND_nonlocal, KIND_not, KIND_pass, KIND_raise, KIND_return, KIND_try, KIND_unless, KIND_until, KIND_while, KIND_with, KIND_yield, KIND_LBRACE, KIND_TILDE})
+FIRST_6 = frozenset({KIND_AT, KIND_async, KIND_class, KIND_def, KIND_for, KIND_if, KIND_loop, KIND_match, KIND_try, KIND_unless, KIND_until, KIND_while, KIND_with})
+FIRST_7 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_assert, KIND_await, KIND_break, KIND_case, KIND_continue, KIND_del, KIND_from, KIND_global, KIND_import, KIND_lambda, KIND_match, KIND_nonlocal, KIND_not, KIND_pass, KIND_raise, KIND_return, KIND_yield, KIND_LBRACE, KIND_TILDE})
+FIRST_8 = frozenset({tokenize.NEWLINE})
+FIRST_9 = frozenset({tokenize.ENDMARKER})
+FIRST_10 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_lambda, KIND_match, KIND_not, KIND_yield, KIND_LBRACE, KIND_TILDE})
+FIRST_11 = frozenset({KIND_return})
+FIRST_12 = frozenset({KIND_from, KIND_import})
+FIRST_13 = frozenset({KIND_raise})
+FIRST_14 = frozenset({KIND_pass})
+FIRST_15 = frozenset({KIND_del})
+FIRST_16 = frozenset({KIND_yield})
+FIRST_17 = frozenset({KIND_assert})
+FIRST_18 = frozenset({KIND_break})
+FIRST_19 = frozenset({KIND_continue})
+FIRST_20 = frozenset({KIND_global})
+FIRST_21 = frozenset({KIND_nonlocal})
+FIRST_22 = frozenset({KIND_AT, KIND_async, KIND_def})
+FIRST_23 = frozenset({KIND_if})
+FIRST_24 = frozenset({KIND_unless})
+FIRST_25 = frozenset({KIND_AT, KIND_class})
+FIRST_26 = frozenset({KIND_async, KIND_with})
+FIRST_27 = frozenset({KIND_async, KIND_for})
+FIRST_28 = frozenset({KIND_try})
+FIRST_29 = frozenset({KIND_while})
+FIRST_30 = frozenset({KIND_until})
+FIRST_31 = frozenset({KIND_loop})
+FIRST_32 = frozenset({KIND_match})
+FIRST_33 = frozenset({tokenize.NAME, KIND__, KIND_case, KIND_match})
+FIRST_34 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_case, KIND_match, KIND_LBRACE})
+FIRST_35 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_case, KIND_match, KIND_LBRACE})
+FIRST_36 = frozenset({KIND_PERCENTEQUAL, KIND_AMPEREQUAL, KIND_DOUBLESTAREQUAL, KIND_STAREQUAL, KIND_PLUSEQUAL, KIND_MINEQUAL, KIND_DOUBLESLASHEQUAL, KIND_SLASHEQUAL, KIND_LEFTSHIFTEQUAL, KIND_RIGHTSHIFTEQUAL, KIND_ATEQUAL, KIND_CIRCUMFLEXEQUAL, KIND_VBAREQUAL})
+FIRST_37 = frozenset({KIND_PLUSEQUAL})
+FIRST_38 = frozenset({KIND_MINEQUAL})
+FIRST_39 = frozenset({KIND_STAREQUAL})
+FIRST_40 = frozenset({KIND_ATEQUAL})
+FIRST_41 = frozenset({KIND_SLASHEQUAL})
+FIRST_42 = frozenset({KIND_PERCENTEQUAL})
+FIRST_43 = frozenset({KIND_AMPEREQUAL})
+FIRST_44 = frozenset({KIND_VBAREQUAL})
+FIRST_45 = frozenset({KIND_CIRCUMFLEXEQUAL})
+FIRST_46 = frozenset({KIND_LEFTSHIFTEQUAL})
+FIRST_47 = frozenset({KIND_RIGHTSHIFTEQUAL})
+FIRST_48 = frozenset({KIND_DOUBLESTAREQUAL})
+FIRST_49 = frozenset({KIND_DOUBLESLASHEQUAL})
+FIRST_50 = frozenset({KIND_import})
+FIRST_51 = frozenset({KIND_from})
+FIRST_52 = frozenset({tokenize.NAME, KIND_LPAR, KIND_STAR, KIND__, KIND_case, KIND_match})
+FIRST_53 = frozenset({KIND_STAR})
+FIRST_54 = frozenset({tokenize.NEWLINE, KIND_COMMA})
+FIRST_55 = frozenset({KIND_COMMA})
+FIRST_56 = frozenset({tokenize.NEWLINE, KIND_COLON})
+FIRST_57 = frozenset({KIND_COLON})
+FIRST_58 = frozenset({tokenize.NEWLINE, tokenize.TYPE_COMMENT, KIND_COLON})
+FIRST_59 = frozenset({tokenize.NEWLINE, tokenize.TYPE_COMMENT})
+FIRST_60 = frozenset({tokenize.NAME, tokenize.NEWLINE, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_assert, KIND_await, KIND_break, KIND_case, KIND_continue, KIND_del, KIND_from, KIND_global, KIND_import, KIND_lambda, KIND_match, KIND_nonlocal, KIND_not, KIND_pass, KIND_raise, KIND_return, KIND_yield, KIND_LBRACE, KIND_TILDE})
+FIRST_61 = frozenset({KIND_AT})
+FIRST_62 = frozenset({KIND_class})
+FIRST_63 = frozenset({KIND_async, KIND_def})
+FIRST_64 = frozenset({KIND_def})
+FIRST_65 = frozenset({KIND_async})
+FIRST_66 = frozenset({tokenize.NAME, KIND_STAR, KIND_DOUBLESTAR, KIND__, KIND_case, KIND_match})
+FIRST_67 = frozenset({KIND_STAR, KIND_DOUBLESTAR})
+FIRST_68 = frozenset({KIND_DOUBLESTAR})
+FIRST_69 = frozenset({KIND_EQUAL})
+FIRST_70 = frozenset({KIND_elif})
+FIRST_71 = frozenset({KIND_else})
+FIRST_72 = frozenset({KIND_for})
+FIRST_73 = frozenset({KIND_with})
+FIRST_74 = frozenset({KIND_except})
+FIRST_75 = frozenset({KIND_finally})
+FIRST_76 = frozenset({KIND_case})
+FIRST_77 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_MINUS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_case, KIND_match, KIND_LBRACE})
+FIRST_78 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_MINUS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_case, KIND_match, KIND_LBRACE})
+FIRST_79 = frozenset({tokenize.NUMBER, tokenize.STRING, KIND_MINUS, KIND_False, KIND_None, KIND_True})
+FIRST_80 = frozenset({KIND__})
+FIRST_81 = frozenset({KIND_LPAR, KIND_LSQB})
+FIRST_82 = frozenset({KIND_LBRACE})
+FIRST_83 = frozenset({tokenize.NUMBER, KIND_MINUS})
+FIRST_84 = frozenset({tokenize.STRING})
+FIRST_85 = frozenset({KIND_None})
+FIRST_86 = frozenset({KIND_True})
+FIRST_87 = frozenset({KIND_False})
+FIRST_88 = frozenset({tokenize.NUMBER})
+FIRST_89 = frozenset({KIND_MINUS})
+FIRST_90 = frozenset({KIND_LSQB})
+FIRST_91 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_MINUS, KIND_False, KIND_None, KIND_True, KIND__, KIND_case, KIND_match})
+FIRST_92 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_match, KIND_not, KIND_LBRACE, KIND_TILDE})
+FIRST_93 = frozenset({KIND_lambda})
+FIRST_94 = frozenset({tokenize.INDENT, tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_lambda, KIND_match, KIND_not, KIND_LBRACE, KIND_TILDE})
+FIRST_95 = frozenset({tokenize.INDENT})
+FIRST_96 = frozenset({KIND_not})
+FIRST_97 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_match, KIND_LBRACE, KIND_TILDE})
+FIRST_98 = frozenset({KIND_NOTEQUAL, KIND_LESS, KIND_LESSEQUAL, KIND_EQEQUAL, KIND_GREATER, KIND_GREATEREQUAL, KIND_in, KIND_is, KIND_not})
+FIRST_99 = frozenset({KIND_EQEQUAL})
+FIRST_100 = frozenset({KIND_NOTEQUAL})
+FIRST_101 = frozenset({KIND_LESSEQUAL})
+FIRST_102 = frozenset({KIND_LESS})
+FIRST_103 = frozenset({KIND_GREATEREQUAL})
+FIRST_104 = frozenset({KIND_GREATER})
+FIRST_105 = frozenset({KIND_in})
+FIRST_106 = frozenset({KIND_is})
+FIRST_107 = frozenset({KIND_PLUS})
+FIRST_108 = frozenset({KIND_TILDE})
+FIRST_109 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_match, KIND_LBRACE})
+FIRST_110 = frozenset({KIND_await})
+FIRST_111 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_COLON, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_lambda, KIND_match, KIND_not, KIND_LBRACE, KIND_TILDE})
+FIRST_112 = frozenset({KIND_LPAR, KIND_LSQB, KIND_LBRACE})
+FIRST_113 = frozenset({KIND_ELLIPSIS})
+FIRST_114 = frozenset({tokenize.NAME, tokenize.NEWLINE, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_DOUBLESTAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_lambda, KIND_match, KIND_not, KIND_LBRACE, KIND_TILDE})
+FIRST_115 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_DOUBLESTAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_lambda, KIND_match, KIND_not, KIND_LBRACE, KIND_TILDE})
+FIRST_116 = frozenset({tokenize.NAME, tokenize.NEWLINE, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_DOUBLESTAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_lambda, KIND_match, KIND_not, KIND_LBRACE, KIND_TILDE})
+FIRST_117 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_DOUBLESTAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_lambda, KIND_match, KIND_not, KIND_LBRACE, KIND_TILDE})
+FIRST_118 = frozenset({tokenize.NAME, KIND_LPAR, KIND_LSQB, KIND__, KIND_case, KIND_match})
+FIRST_119 = frozenset({KIND_LPAR, KIND_DOT, KIND_LSQB})
+FIRST_120 = frozenset({KIND_DOT})
+FIRST_121 = frozenset({tokenize.TYPE_COMMENT})
+FIRST_122 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_STAR, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_case, KIND_match, KIND_yield, KIND_LBRACE})
+FIRST_123 = frozenset({KIND_LSQB, KIND_LBRACE})
+FIRST_124 = frozenset({tokenize.NEWLINE, KIND_SEMI})
+FIRST_125 = frozenset({KIND_SEMI})
+FIRST_126 = frozenset({KIND_as})
+FIRST_127 = frozenset({KIND_RARROW})
+FIRST_128 = frozenset({tokenize.NEWLINE, KIND_RPAR, KIND_COMMA, KIND_COLON})
+FIRST_129 = frozenset({KIND_RPAR})
+FIRST_130 = frozenset({KIND_PLUS, KIND_MINUS})
+FIRST_131 = frozenset({KIND_LPAR, KIND_DOT, KIND_EQUAL})
+FIRST_132 = frozenset({tokenize.NAME, tokenize.NUMBER, tokenize.STRING, KIND_LPAR, KIND_PLUS, KIND_MINUS, KIND_ELLIPSIS, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND__, KIND_await, KIND_case, KIND_lambda, KIND_match, KIND_not, KIND_yield, KIND_LBRACE, KIND_TILDE})
+FIRST_133 = frozenset({KIND_COLON, KIND_else})
+FIRST_134 = frozenset({KIND_COLONEQUAL, KIND_EQUAL})
+FIRST_135 = frozenset({KIND_COLONEQUAL})
+FIRST_136 = frozenset({KIND_LPAR, KIND_False, KIND_None, KIND_True, KIND_LSQB, KIND_LBRACE})
+FIRST_137 = frozenset({KIND_RPAR, KIND_COMMA})
+FIRST_138 = frozenset({KIND_COMMA, KIND_COLON})
+FIRST_139 = frozenset({KIND_except, KIND_finally})
+FIRST_140 = frozenset({KIND_COMMA, KIND_RBRACE})
+FIRST_141 = frozenset({KIND_RBRACE})
+FIRST_142 = frozenset({KIND_DOT, KIND_ELLIPSIS})
+FIRST_143 = frozenset({KIND_or})
+FIRST_144 = frozenset({KIND_and})
+FIRST_145 = frozenset({KIND_RPAR, KIND_DOUBLESTAR})
+FIRST_146 = frozenset({KIND_DOUBLESTAR, KIND_COLON})
+
 # Keywords and soft keywords are listed at the end of the parser definition.
 class ParseltongueParser(Parser):
 
-    @memoize
+    soft_keyword_kinds = frozenset({KIND__, KIND_case, KIND_match})
+
+    # Token-level rules left unmemoized
+    number = Parser.number.__wrapped__
+    string = Parser.string.__wrapped__
+    op = Parser.op.__wrapped__
+    type_comment = Parser.type_comment.__wrapped__
+    soft_keyword = Parser.soft_keyword.__wrapped__
+    expect = Parser.expect.__wrapped__
+
     def start(self) -> Optional[Any]:
         # start: file
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_0:
+            return None
         if (
             (file := self.file())
         ):
@@ -408,23 +877,27 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def file(self) -> Optional[ast . Module]:
-        # file: statements? $
+        # file: file_statements? $
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_0:
+            return None
         if (
-            (a := self.statements(),)
+            (a := self.file_statements(),)
             and
-            (_endmarker := self.expect('ENDMARKER'))
+            (_endmarker := self.terminal(tokenize.ENDMARKER))
         ):
             return ast . Module ( body = a or [] , type_ignores = [] )
         self._reset(mark)
         return None
 
-    @memoize
     def interactive(self) -> Optional[ast . Interactive]:
         # interactive: statement_newline
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_1:
+            return None
         if (
             (a := self.statement_newline())
         ):
@@ -432,48 +905,54 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def eval(self) -> Optional[ast . Expression]:
         # eval: expressions NEWLINE* $
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
             (a := self.expressions())
             and
             (_loop0_1 := self._loop0_1(),)
             and
-            (_endmarker := self.expect('ENDMARKER'))
+            (_endmarker := self.terminal(tokenize.ENDMARKER))
         ):
             return ast . Expression ( body = a )
         self._reset(mark)
         return None
 
-    @memoize
     def func_type(self) -> Optional[ast . FunctionType]:
         # func_type: '(' type_expressions? ')' '->' expression NEWLINE* $
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_3:
+            return None
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (a := self.type_expressions(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
             and
-            (literal_2 := self.expect('->'))
+            (literal_2 := self.terminal(KIND_RARROW))
             and
             (b := self.expression())
             and
             (_loop0_2 := self._loop0_2(),)
             and
-            (_endmarker := self.expect('ENDMARKER'))
+            (_endmarker := self.terminal(tokenize.ENDMARKER))
         ):
             return ast . FunctionType ( argtypes = a , returns = b )
         self._reset(mark)
         return None
 
-    @memoize
     def fstring(self) -> Optional[ast . Expr]:
         # fstring: star_expressions
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_4:
+            return None
         if (
             (star_expressions := self.star_expressions())
         ):
@@ -481,10 +960,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def statements(self) -> Optional[list]:
         # statements: statement+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_5:
+            return None
         if (
             (a := self._loop1_3())
         ):
@@ -492,90 +973,140 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def statement(self) -> Optional[list]:
         # statement: compound_stmt | simple_stmts
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_5:
+            return None
         if (
+            kind in FIRST_6
+            and
             (a := self.compound_stmt())
         ):
             return [a]
         self._reset(mark)
         if (
+            kind in FIRST_7
+            and
             (a := self.simple_stmts())
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
+    def file_statements(self) -> Optional[list]:
+        # file_statements: file_statement+
+        mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_5:
+            return None
+        if (
+            (a := self._loop1_4())
+        ):
+            return list ( itertools . chain ( * a ) )
+        self._reset(mark)
+        return None
+
+    def file_statement(self) -> Optional[list]:
+        # file_statement: statement
+        mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_5:
+            return None
+        if (
+            (a := self.statement())
+        ):
+            return self . commit ( a )
+        self._reset(mark)
+        return None
+
     def statement_newline(self) -> Optional[list]:
         # statement_newline: compound_stmt NEWLINE | simple_stmts | NEWLINE | $
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_1:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            kind in FIRST_6
+            and
             (a := self.compound_stmt())
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return [a]
         self._reset(mark)
         if (
+            kind in FIRST_7
+            and
             (simple_stmts := self.simple_stmts())
         ):
             return simple_stmts
         self._reset(mark)
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
+            and
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return [ast . Pass ( lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )]
         self._reset(mark)
         if (
-            (_endmarker := self.expect('ENDMARKER'))
+            kind in FIRST_9
+            and
+            (_endmarker := self.terminal(tokenize.ENDMARKER))
         ):
             return None
         self._reset(mark)
         return None
 
-    @memoize
     def simple_stmts(self) -> Optional[list]:
         # simple_stmts: simple_stmt !';' NEWLINE | ';'.simple_stmt+ ';'? NEWLINE
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_7:
+            return None
         if (
             (a := self.simple_stmt())
             and
-            self.negative_lookahead(self.expect, ';')
+            self.negative_lookahead(self.terminal, KIND_SEMI)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return [a]
         self._reset(mark)
         if (
-            (a := self._gather_4())
+            (a := self._gather_5())
             and
-            (opt := self.expect(';'),)
+            (opt := self.terminal(KIND_SEMI),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def simple_stmt(self) -> Optional[Any]:
         # simple_stmt: assignment | star_expressions | &'return' return_stmt | &('import' | 'from') import_stmt | &'raise' raise_stmt | 'pass' | &'del' del_stmt | &'yield' yield_stmt | &'assert' assert_stmt | 'break' | 'continue' | &'global' global_stmt | &'nonlocal' nonlocal_stmt
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_7:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            kind in FIRST_10
+            and
             (assignment := self.assignment())
         ):
             return assignment
         self._reset(mark)
         if (
+            kind in FIRST_4
+            and
             (e := self.star_expressions())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
@@ -583,77 +1114,99 @@ class ParseltongueParser(Parser):
             return ast . Expr ( value = e , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'return')
+            kind in FIRST_11
+            and
+            self.positive_lookahead(self.terminal, KIND_return)
             and
             (return_stmt := self.return_stmt())
         ):
             return return_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self._tmp_6, )
+            kind in FIRST_12
+            and
+            self.positive_lookahead(self._tmp_7, )
             and
             (import_stmt := self.import_stmt())
         ):
             return import_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'raise')
+            kind in FIRST_13
+            and
+            self.positive_lookahead(self.terminal, KIND_raise)
             and
             (raise_stmt := self.raise_stmt())
         ):
             return raise_stmt
         self._reset(mark)
         if (
-            (literal := self.expect('pass'))
+            kind in FIRST_14
+            and
+            (literal := self.terminal(KIND_pass))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Pass ( lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'del')
+            kind in FIRST_15
+            and
+            self.positive_lookahead(self.terminal, KIND_del)
             and
             (del_stmt := self.del_stmt())
         ):
             return del_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'yield')
+            kind in FIRST_16
+            and
+            self.positive_lookahead(self.terminal, KIND_yield)
             and
             (yield_stmt := self.yield_stmt())
         ):
             return yield_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'assert')
+            kind in FIRST_17
+            and
+            self.positive_lookahead(self.terminal, KIND_assert)
             and
             (assert_stmt := self.assert_stmt())
         ):
             return assert_stmt
         self._reset(mark)
         if (
-            (literal := self.expect('break'))
+            kind in FIRST_18
+            and
+            (literal := self.terminal(KIND_break))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Break ( lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('continue'))
+            kind in FIRST_19
+            and
+            (literal := self.terminal(KIND_continue))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Continue ( lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'global')
+            kind in FIRST_20
+            and
+            self.positive_lookahead(self.terminal, KIND_global)
             and
             (global_stmt := self.global_stmt())
         ):
             return global_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'nonlocal')
+            kind in FIRST_21
+            and
+            self.positive_lookahead(self.terminal, KIND_nonlocal)
             and
             (nonlocal_stmt := self.nonlocal_stmt())
         ):
@@ -661,125 +1214,157 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def compound_stmt(self) -> Optional[Any]:
         # compound_stmt: &('def' | '@' | 'async') function_def | &'if' if_stmt | &'unless' unless_stmt | &('class' | '@') class_def | &('with' | 'async') with_stmt | &('for' | 'async') for_stmt | &'try' try_stmt | &'while' while_stmt | &'until' until_stmt | &'loop' loop_stmt | match_stmt
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_6:
+            return None
         if (
-            self.positive_lookahead(self._tmp_7, )
+            kind in FIRST_22
+            and
+            self.positive_lookahead(self._tmp_8, )
             and
             (function_def := self.function_def())
         ):
             return function_def
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'if')
+            kind in FIRST_23
+            and
+            self.positive_lookahead(self.terminal, KIND_if)
             and
             (if_stmt := self.if_stmt())
         ):
             return if_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'unless')
+            kind in FIRST_24
+            and
+            self.positive_lookahead(self.terminal, KIND_unless)
             and
             (unless_stmt := self.unless_stmt())
         ):
             return unless_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self._tmp_8, )
+            kind in FIRST_25
+            and
+            self.positive_lookahead(self._tmp_9, )
             and
             (class_def := self.class_def())
         ):
             return class_def
         self._reset(mark)
         if (
-            self.positive_lookahead(self._tmp_9, )
+            kind in FIRST_26
+            and
+            self.positive_lookahead(self._tmp_10, )
             and
             (with_stmt := self.with_stmt())
         ):
             return with_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self._tmp_10, )
+            kind in FIRST_27
+            and
+            self.positive_lookahead(self._tmp_11, )
             and
             (for_stmt := self.for_stmt())
         ):
             return for_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'try')
+            kind in FIRST_28
+            and
+            self.positive_lookahead(self.terminal, KIND_try)
             and
             (try_stmt := self.try_stmt())
         ):
             return try_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'while')
+            kind in FIRST_29
+            and
+            self.positive_lookahead(self.terminal, KIND_while)
             and
             (while_stmt := self.while_stmt())
         ):
             return while_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'until')
+            kind in FIRST_30
+            and
+            self.positive_lookahead(self.terminal, KIND_until)
             and
             (until_stmt := self.until_stmt())
         ):
             return until_stmt
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, 'loop')
+            kind in FIRST_31
+            and
+            self.positive_lookahead(self.terminal, KIND_loop)
             and
             (loop_stmt := self.loop_stmt())
         ):
             return loop_stmt
         self._reset(mark)
         if (
+            kind in FIRST_32
+            and
             (match_stmt := self.match_stmt())
         ):
             return match_stmt
         self._reset(mark)
         return None
 
-    @memoize
     def assignment(self) -> Optional[Any]:
         # assignment: NAME ':' expression ['=' annotated_rhs] | ('(' single_target ')' | single_subscript_attribute_target) ':' expression ['=' annotated_rhs] | ((star_targets '='))+ (yield_expr | star_expressions) !'=' TYPE_COMMENT? | single_target augassign ~ (yield_expr | star_expressions) | invalid_assignment
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_10:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            kind in FIRST_33
+            and
             (a := self.name())
             and
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
             (b := self.expression())
             and
-            (c := self._tmp_11(),)
+            (c := self._tmp_12(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return self . check_version ( ( 3 , 6 ) , "Variable annotation syntax is" , ast . AnnAssign ( target = ast . Name ( id = a . string , ctx = Store , lineno = a . start [0] , col_offset = a . start [1] , end_lineno = a . end [0] , end_col_offset = a . end [1] , ) , annotation = b , value = c , simple = 1 , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset , ) )
         self._reset(mark)
         if (
-            (a := self._tmp_12())
+            kind in FIRST_34
             and
-            (literal := self.expect(':'))
+            (a := self._tmp_13())
+            and
+            (literal := self.terminal(KIND_COLON))
             and
             (b := self.expression())
             and
-            (c := self._tmp_13(),)
+            (c := self._tmp_14(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return self . check_version ( ( 3 , 6 ) , "Variable annotation syntax is" , ast . AnnAssign ( target = a , annotation = b , value = c , simple = 0 , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset , ) )
         self._reset(mark)
         if (
-            (a := self._loop1_14())
+            kind in FIRST_35
+            and
+            (a := self._loop1_15())
             and
-            (b := self._tmp_15())
+            (b := self._tmp_16())
             and
-            self.negative_lookahead(self.expect, '=')
+            self.negative_lookahead(self.terminal, KIND_EQUAL)
             and
             (tc := self.type_comment(),)
         ):
@@ -789,13 +1374,15 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         cut = False
         if (
+            kind in FIRST_34
+            and
             (a := self.single_target())
             and
             (b := self.augassign())
             and
             (cut := True)
             and
-            (c := self._tmp_16())
+            (c := self._tmp_17())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -803,107 +1390,145 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         if cut: return None
         if (
+            self.call_invalid_rules
+            and
             (invalid_assignment := self.invalid_assignment())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def annotated_rhs(self) -> Optional[Any]:
         # annotated_rhs: yield_expr | star_expressions
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_10:
+            return None
         if (
+            kind in FIRST_16
+            and
             (yield_expr := self.yield_expr())
         ):
             return yield_expr
         self._reset(mark)
         if (
+            kind in FIRST_4
+            and
             (star_expressions := self.star_expressions())
         ):
             return star_expressions
         self._reset(mark)
         return None
 
-    @memoize
     def augassign(self) -> Optional[Any]:
         # augassign: '+=' | '-=' | '*=' | '@=' | '/=' | '%=' | '&=' | '|=' | '^=' | '<<=' | '>>=' | '**=' | '//='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_36:
+            return None
         if (
-            (literal := self.expect('+='))
+            kind in FIRST_37
+            and
+            (literal := self.terminal(KIND_PLUSEQUAL))
         ):
             return ast . Add ( )
         self._reset(mark)
         if (
-            (literal := self.expect('-='))
+            kind in FIRST_38
+            and
+            (literal := self.terminal(KIND_MINEQUAL))
         ):
             return ast . Sub ( )
         self._reset(mark)
         if (
-            (literal := self.expect('*='))
+            kind in FIRST_39
+            and
+            (literal := self.terminal(KIND_STAREQUAL))
         ):
             return ast . Mult ( )
         self._reset(mark)
         if (
-            (literal := self.expect('@='))
+            kind in FIRST_40
+            and
+            (literal := self.terminal(KIND_ATEQUAL))
         ):
             return self . check_version ( ( 3 , 5 ) , "The '@' operator is" , ast . MatMult ( ) )
         self._reset(mark)
         if (
-            (literal := self.expect('/='))
+            kind in FIRST_41
+            and
+            (literal := self.terminal(KIND_SLASHEQUAL))
         ):
             return ast . Div ( )
         self._reset(mark)
         if (
-            (literal := self.expect('%='))
+            kind in FIRST_42
+            and
+            (literal := self.terminal(KIND_PERCENTEQUAL))
         ):
             return ast . Mod ( )
         self._reset(mark)
         if (
-            (literal := self.expect('&='))
+            kind in FIRST_43
+            and
+            (literal := self.terminal(KIND_AMPEREQUAL))
         ):
             return ast . BitAnd ( )
         self._reset(mark)
         if (
-            (literal := self.expect('|='))
+            kind in FIRST_44
+            and
+            (literal := self.terminal(KIND_VBAREQUAL))
         ):
             return ast . BitOr ( )
         self._reset(mark)
         if (
-            (literal := self.expect('^='))
+            kind in FIRST_45
+            and
+            (literal := self.terminal(KIND_CIRCUMFLEXEQUAL))
         ):
             return ast . BitXor ( )
         self._reset(mark)
         if (
-            (literal := self.expect('<<='))
+            kind in FIRST_46
+            and
+            (literal := self.terminal(KIND_LEFTSHIFTEQUAL))
         ):
             return ast . LShift ( )
         self._reset(mark)
         if (
-            (literal := self.expect('>>='))
+            kind in FIRST_47
+            and
+            (literal := self.terminal(KIND_RIGHTSHIFTEQUAL))
         ):
             return ast . RShift ( )
         self._reset(mark)
         if (
-            (literal := self.expect('**='))
+            kind in FIRST_48
+            and
+            (literal := self.terminal(KIND_DOUBLESTAREQUAL))
         ):
             return ast . Pow ( )
         self._reset(mark)
         if (
-            (literal := self.expect('//='))
+            kind in FIRST_49
+            and
+            (literal := self.terminal(KIND_DOUBLESLASHEQUAL))
         ):
             return ast . FloorDiv ( )
         self._reset(mark)
         return None
 
-    @memoize
     def return_stmt(self) -> Optional[ast . Return]:
         # return_stmt: 'return' star_expressions?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_11:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('return'))
+            (literal := self.terminal(KIND_return))
             and
             (a := self.star_expressions(),)
         ):
@@ -913,25 +1538,27 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def raise_stmt(self) -> Optional[ast . Raise]:
         # raise_stmt: 'raise' expression ['from' expression] | 'raise'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_13:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('raise'))
+            (literal := self.terminal(KIND_raise))
             and
             (a := self.expression())
             and
-            (b := self._tmp_17(),)
+            (b := self._tmp_18(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Raise ( exc = a , cause = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('raise'))
+            (literal := self.terminal(KIND_raise))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -939,16 +1566,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def global_stmt(self) -> Optional[ast . Global]:
         # global_stmt: 'global' ','.NAME+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_20:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('global'))
+            (literal := self.terminal(KIND_global))
             and
-            (a := self._gather_18())
+            (a := self._gather_19())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -956,16 +1585,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def nonlocal_stmt(self) -> Optional[ast . Nonlocal]:
         # nonlocal_stmt: 'nonlocal' ','.NAME+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_21:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('nonlocal'))
+            (literal := self.terminal(KIND_nonlocal))
             and
-            (a := self._gather_20())
+            (a := self._gather_21())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -973,34 +1604,40 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def del_stmt(self) -> Optional[ast . Delete]:
         # del_stmt: 'del' del_targets &(';' | NEWLINE) | invalid_del_stmt
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_15:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('del'))
+            (literal := self.terminal(KIND_del))
             and
             (a := self.del_targets())
             and
-            self.positive_lookahead(self._tmp_22, )
+            self.positive_lookahead(self._tmp_23, )
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Delete ( targets = a , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_del_stmt := self.invalid_del_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def yield_stmt(self) -> Optional[ast . Expr]:
         # yield_stmt: yield_expr
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_16:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
@@ -1012,18 +1649,20 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def assert_stmt(self) -> Optional[ast . Assert]:
         # assert_stmt: 'assert' expression [',' expression]
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_17:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('assert'))
+            (literal := self.terminal(KIND_assert))
             and
             (a := self.expression())
             and
-            (b := self._tmp_23(),)
+            (b := self._tmp_24(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1031,30 +1670,38 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def import_stmt(self) -> Optional[ast . Import]:
         # import_stmt: import_name | import_from
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_12:
+            return None
         if (
+            kind in FIRST_50
+            and
             (import_name := self.import_name())
         ):
             return import_name
         self._reset(mark)
         if (
+            kind in FIRST_51
+            and
             (import_from := self.import_from())
         ):
             return import_from
         self._reset(mark)
         return None
 
-    @memoize
     def import_name(self) -> Optional[ast . Import]:
         # import_name: 'import' dotted_as_names
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_50:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('import'))
+            (literal := self.terminal(KIND_import))
             and
             (a := self.dotted_as_names())
         ):
@@ -1064,20 +1711,22 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def import_from(self) -> Optional[ast . ImportFrom]:
         # import_from: 'from' (('.' | '...'))* dotted_name 'import' import_from_targets | 'from' (('.' | '...'))+ 'import' import_from_targets
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_51:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('from'))
+            (literal := self.terminal(KIND_from))
             and
-            (a := self._loop0_24(),)
+            (a := self._loop0_25(),)
             and
             (b := self.dotted_name())
             and
-            (literal_1 := self.expect('import'))
+            (literal_1 := self.terminal(KIND_import))
             and
             (c := self.import_from_targets())
         ):
@@ -1086,11 +1735,11 @@ class ParseltongueParser(Parser):
             return ast . ImportFrom ( module = b , names = c , level = self . extract_import_level ( a ) , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('from'))
+            (literal := self.terminal(KIND_from))
             and
-            (a := self._loop1_25())
+            (a := self._loop1_26())
             and
-            (literal_1 := self.expect('import'))
+            (literal_1 := self.terminal(KIND_import))
             and
             (b := self.import_from_targets())
         ):
@@ -1100,65 +1749,81 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def import_from_targets(self) -> Optional[List [ast . alias]]:
         # import_from_targets: '(' import_from_as_names ','? ')' | import_from_as_names !',' | '*' | invalid_import_from_targets
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_52:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
             and
             (a := self.import_from_as_names())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return a
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (import_from_as_names := self.import_from_as_names())
             and
-            self.negative_lookahead(self.expect, ',')
+            self.negative_lookahead(self.terminal, KIND_COMMA)
         ):
             return import_from_as_names
         self._reset(mark)
         if (
-            (literal := self.expect('*'))
+            kind in FIRST_53
+            and
+            (literal := self.terminal(KIND_STAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return [ast . alias ( name = "*" , asname = None , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )]
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_33
+            and
             (invalid_import_from_targets := self.invalid_import_from_targets())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def import_from_as_names(self) -> Optional[List [ast . alias]]:
         # import_from_as_names: ','.import_from_as_name+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
-            (a := self._gather_26())
+            (a := self._gather_27())
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def import_from_as_name(self) -> Optional[ast . alias]:
         # import_from_as_name: NAME ['as' NAME]
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.name())
             and
-            (b := self._tmp_28(),)
+            (b := self._tmp_29(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1166,27 +1831,31 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def dotted_as_names(self) -> Optional[List [ast . alias]]:
         # dotted_as_names: ','.dotted_as_name+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
-            (a := self._gather_29())
+            (a := self._gather_30())
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def dotted_as_name(self) -> Optional[ast . alias]:
         # dotted_as_name: dotted_name ['as' NAME]
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.dotted_name())
             and
-            (b := self._tmp_31(),)
+            (b := self._tmp_32(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1198,10 +1867,13 @@ class ParseltongueParser(Parser):
     def dotted_name(self) -> Optional[str]:
         # dotted_name: dotted_name '.' NAME | NAME
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (a := self.dotted_name())
             and
-            (literal := self.expect('.'))
+            (literal := self.terminal(KIND_DOT))
             and
             (b := self.name())
         ):
@@ -1218,29 +1890,35 @@ class ParseltongueParser(Parser):
     def separator(self) -> Optional[Any]:
         # separator: ',' NEWLINE? | NEWLINE
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_54:
+            return None
         if (
-            (literal := self.expect(','))
+            kind in FIRST_55
+            and
+            (literal := self.terminal(KIND_COMMA))
             and
-            (opt := self.expect('NEWLINE'),)
+            (opt := self.terminal(tokenize.NEWLINE),)
         ):
             return [literal, opt]
         self._reset(mark)
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
+            and
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return _newline
         self._reset(mark)
         return None
 
-    @memoize
     def extra_separator(self) -> Optional[Any]:
         # extra_separator: ','? NEWLINE?
         # nullable=True
         mark = self._mark()
         if (
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
             and
-            (opt_1 := self.expect('NEWLINE'),)
+            (opt_1 := self.terminal(tokenize.NEWLINE),)
         ):
             return [opt, opt_1]
         self._reset(mark)
@@ -1250,32 +1928,43 @@ class ParseltongueParser(Parser):
     def colon_block(self) -> Optional[list]:
         # colon_block: ':' block | NEWLINE INDENT statements DEDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_56:
+            return None
         if (
-            (literal := self.expect(':'))
+            kind in FIRST_57
+            and
+            (literal := self.terminal(KIND_COLON))
             and
             (block := self.block())
         ):
             return [literal, block]
         self._reset(mark)
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
             and
-            (_indent := self.expect('INDENT'))
+            (_newline := self.terminal(tokenize.NEWLINE))
+            and
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (a := self.statements())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def colon_type_comment_block(self) -> Optional[list]:
         # colon_type_comment_block: ':' TYPE_COMMENT? block | TYPE_COMMENT? NEWLINE INDENT statements DEDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_58:
+            return None
         if (
-            (literal := self.expect(':'))
+            kind in FIRST_57
+            and
+            (literal := self.terminal(KIND_COLON))
             and
             (a := self.type_comment(),)
             and
@@ -1284,26 +1973,32 @@ class ParseltongueParser(Parser):
             return ( a , b )
         self._reset(mark)
         if (
+            kind in FIRST_59
+            and
             (a := self.type_comment(),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (b := self.statements())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return ( a , b )
         self._reset(mark)
         return None
 
-    @memoize
     def colon_func_type_comment_block(self) -> Optional[list]:
         # colon_func_type_comment_block: ':' func_type_comment? block | func_type_comment? NEWLINE INDENT statements DEDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_58:
+            return None
         if (
-            (literal := self.expect(':'))
+            kind in FIRST_57
+            and
+            (literal := self.terminal(KIND_COLON))
             and
             (a := self.func_type_comment(),)
             and
@@ -1312,15 +2007,17 @@ class ParseltongueParser(Parser):
             return ( a , b )
         self._reset(mark)
         if (
+            kind in FIRST_59
+            and
             (a := self.func_type_comment(),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (b := self.statements())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return ( a , b )
         self._reset(mark)
@@ -1330,70 +2027,87 @@ class ParseltongueParser(Parser):
     def block(self) -> Optional[list]:
         # block: NEWLINE INDENT statements DEDENT | simple_stmts | invalid_block
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_60:
+            return None
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
             and
-            (_indent := self.expect('INDENT'))
+            (_newline := self.terminal(tokenize.NEWLINE))
+            and
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (a := self.statements())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return a
         self._reset(mark)
         if (
+            kind in FIRST_7
+            and
             (simple_stmts := self.simple_stmts())
         ):
             return simple_stmts
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_8
+            and
             (invalid_block := self.invalid_block())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def decorators(self) -> Optional[Any]:
         # decorators: decorator+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_61:
+            return None
         if (
-            (_loop1_32 := self._loop1_32())
+            (_loop1_33 := self._loop1_33())
         ):
-            return _loop1_32
+            return _loop1_33
         self._reset(mark)
         return None
 
-    @memoize
     def decorator(self) -> Optional[Any]:
         # decorator: ('@' dec_maybe_call NEWLINE) | ('@' named_expression NEWLINE)
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_61:
+            return None
         if (
-            (a := self._tmp_33())
+            (a := self._tmp_34())
         ):
             return a
         self._reset(mark)
         if (
-            (a := self._tmp_34())
+            (a := self._tmp_35())
         ):
             return self . check_version ( ( 3 , 9 ) , "Generic decorator are" , a )
         self._reset(mark)
         return None
 
-    @memoize
     def dec_maybe_call(self) -> Optional[Any]:
         # dec_maybe_call: dec_primary '(' arguments? ')' | dec_primary
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (dn := self.dec_primary())
             and
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (z := self.arguments(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1410,12 +2124,15 @@ class ParseltongueParser(Parser):
     def dec_primary(self) -> Optional[Any]:
         # dec_primary: dec_primary '.' NAME | NAME
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.dec_primary())
             and
-            (literal := self.expect('.'))
+            (literal := self.terminal(KIND_DOT))
             and
             (b := self.name())
         ):
@@ -1432,11 +2149,15 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def class_def(self) -> Optional[ast . ClassDef]:
         # class_def: decorators class_def_raw | class_def_raw
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_25:
+            return None
         if (
+            kind in FIRST_61
+            and
             (a := self.decorators())
             and
             (b := self.class_def_raw())
@@ -1444,29 +2165,35 @@ class ParseltongueParser(Parser):
             return self . set_decorators ( b , a )
         self._reset(mark)
         if (
+            kind in FIRST_62
+            and
             (class_def_raw := self.class_def_raw())
         ):
             return class_def_raw
         self._reset(mark)
         return None
 
-    @memoize
     def class_def_raw(self) -> Optional[ast . ClassDef]:
         # class_def_raw: invalid_class_def_raw | 'class' NAME ['(' arguments? ')'] colon_block
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_62:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_class_def_raw := self.invalid_class_def_raw())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('class'))
+            (literal := self.terminal(KIND_class))
             and
             (a := self.name())
             and
-            (b := self._tmp_35(),)
+            (b := self._tmp_36(),)
             and
             (c := self.colon_block())
         ):
@@ -1476,11 +2203,15 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def function_def(self) -> Optional[Union [ast . FunctionDef , ast . AsyncFunctionDef]]:
         # function_def: decorators function_def_raw | function_def_raw
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_22:
+            return None
         if (
+            kind in FIRST_61
+            and
             (d := self.decorators())
             and
             (f := self.function_def_raw())
@@ -1488,35 +2219,43 @@ class ParseltongueParser(Parser):
             return self . set_decorators ( f , d )
         self._reset(mark)
         if (
+            kind in FIRST_63
+            and
             (f := self.function_def_raw())
         ):
             return self . set_decorators ( f , [] )
         self._reset(mark)
         return None
 
-    @memoize
     def function_def_raw(self) -> Optional[Union [ast . FunctionDef , ast . AsyncFunctionDef]]:
         # function_def_raw: invalid_def_raw | 'def' NAME '(' params? ')' ['->' expression] colon_func_type_comment_block | 'async' 'def' NAME '(' params? ')' ['->' expression] colon_func_type_comment_block
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_63:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_def_raw := self.invalid_def_raw())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('def'))
+            kind in FIRST_64
+            and
+            (literal := self.terminal(KIND_def))
             and
             (n := self.name())
             and
-            (literal_1 := self.expect('('))
+            (literal_1 := self.terminal(KIND_LPAR))
             and
             (params := self.params(),)
             and
-            (literal_2 := self.expect(')'))
+            (literal_2 := self.terminal(KIND_RPAR))
             and
-            (a := self._tmp_36(),)
+            (a := self._tmp_37(),)
             and
             (b := self.colon_func_type_comment_block())
         ):
@@ -1525,19 +2264,21 @@ class ParseltongueParser(Parser):
             return ast . FunctionDef ( name = n . string , args = params or self . make_arguments ( None , [] , None , [] , None ) , returns = a , body = b [1] , type_comment = b [0] , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset , )
         self._reset(mark)
         if (
-            (literal := self.expect('async'))
+            kind in FIRST_65
+            and
+            (literal := self.terminal(KIND_async))
             and
-            (literal_1 := self.expect('def'))
+            (literal_1 := self.terminal(KIND_def))
             and
             (n := self.name())
             and
-            (literal_2 := self.expect('('))
+            (literal_2 := self.terminal(KIND_LPAR))
             and
             (params := self.params(),)
             and
-            (literal_3 := self.expect(')'))
+            (literal_3 := self.terminal(KIND_RPAR))
             and
-            (a := self._tmp_37(),)
+            (a := self._tmp_38(),)
             and
             (b := self.colon_func_type_comment_block())
         ):
@@ -1547,11 +2288,17 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def params(self) -> Optional[Any]:
         # params: invalid_parameters | parameters
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_66:
+            return None
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_33
+            and
             (invalid_parameters := self.invalid_parameters())
         ):
             return None  # pragma: no cover
@@ -1563,149 +2310,179 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def parameters(self) -> Optional[ast . arguments]:
         # parameters: slash_no_default param_no_default* param_with_default* star_etc? | slash_with_default param_with_default* star_etc? | param_no_default+ param_with_default* star_etc? | param_with_default+ star_etc? | star_etc
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_66:
+            return None
         if (
+            kind in FIRST_33
+            and
             (a := self.slash_no_default())
             and
-            (b := self._loop0_38(),)
+            (b := self._loop0_39(),)
             and
-            (c := self._loop0_39(),)
+            (c := self._loop0_40(),)
             and
             (d := self.star_etc(),)
         ):
             return self . check_version ( ( 3 , 8 ) , "Positional only arguments are" , self . make_arguments ( a , [] , b , c , d ) )
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (a := self.slash_with_default())
             and
-            (b := self._loop0_40(),)
+            (b := self._loop0_41(),)
             and
             (c := self.star_etc(),)
         ):
             return self . check_version ( ( 3 , 8 ) , "Positional only arguments are" , self . make_arguments ( None , a , None , b , c ) , )
         self._reset(mark)
         if (
-            (a := self._loop1_41())
+            kind in FIRST_33
+            and
+            (a := self._loop1_42())
             and
-            (b := self._loop0_42(),)
+            (b := self._loop0_43(),)
             and
             (c := self.star_etc(),)
         ):
             return self . make_arguments ( None , [] , a , b , c )
         self._reset(mark)
         if (
-            (a := self._loop1_43())
+            kind in FIRST_33
+            and
+            (a := self._loop1_44())
             and
             (b := self.star_etc(),)
         ):
             return self . make_arguments ( None , [] , None , a , b )
         self._reset(mark)
         if (
+            kind in FIRST_67
+            and
             (a := self.star_etc())
         ):
             return self . make_arguments ( None , [] , None , None , a )
         self._reset(mark)
         return None
 
-    @memoize
     def slash_no_default(self) -> Optional[List [Tuple [ast . arg , None]]]:
         # slash_no_default: param_no_default+ '/' ',' | param_no_default+ '/' &')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
-            (a := self._loop1_44())
+            (a := self._loop1_45())
             and
-            (literal := self.expect('/'))
+            (literal := self.terminal(KIND_SLASH))
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
         ):
             return [( p , None ) for p in a]
         self._reset(mark)
         if (
-            (a := self._loop1_45())
+            (a := self._loop1_46())
             and
-            (literal := self.expect('/'))
+            (literal := self.terminal(KIND_SLASH))
             and
-            self.positive_lookahead(self.expect, ')')
+            self.positive_lookahead(self.terminal, KIND_RPAR)
         ):
             return [( p , None ) for p in a]
         self._reset(mark)
         return None
 
-    @memoize
     def slash_with_default(self) -> Optional[List [Tuple [ast . arg , Any]]]:
         # slash_with_default: param_no_default* param_with_default+ '/' ',' | param_no_default* param_with_default+ '/' &')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
-            (a := self._loop0_46(),)
+            (a := self._loop0_47(),)
             and
-            (b := self._loop1_47())
+            (b := self._loop1_48())
             and
-            (literal := self.expect('/'))
+            (literal := self.terminal(KIND_SLASH))
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
         ):
             return ( [( p , None ) for p in a] if a else [] ) + b
         self._reset(mark)
         if (
-            (a := self._loop0_48(),)
+            (a := self._loop0_49(),)
             and
-            (b := self._loop1_49())
+            (b := self._loop1_50())
             and
-            (literal := self.expect('/'))
+            (literal := self.terminal(KIND_SLASH))
             and
-            self.positive_lookahead(self.expect, ')')
+            self.positive_lookahead(self.terminal, KIND_RPAR)
         ):
             return ( [( p , None ) for p in a] if a else [] ) + b
         self._reset(mark)
         return None
 
-    @memoize
     def star_etc(self) -> Optional[Tuple [Optional [ast . arg] , List [Tuple [ast . arg , Any]] , Optional [ast . arg]]]:
         # star_etc: '*' param_no_default param_maybe_default* kwds? | '*' ',' param_maybe_default+ kwds? | kwds | invalid_star_etc
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_67:
+            return None
         if (
-            (literal := self.expect('*'))
+            kind in FIRST_53
+            and
+            (literal := self.terminal(KIND_STAR))
             and
             (a := self.param_no_default())
             and
-            (b := self._loop0_50(),)
+            (b := self._loop0_51(),)
             and
             (c := self.kwds(),)
         ):
             return ( a , b , c )
         self._reset(mark)
         if (
-            (literal := self.expect('*'))
+            kind in FIRST_53
+            and
+            (literal := self.terminal(KIND_STAR))
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
             and
-            (b := self._loop1_51())
+            (b := self._loop1_52())
             and
             (c := self.kwds(),)
         ):
             return ( None , b , c )
         self._reset(mark)
         if (
+            kind in FIRST_68
+            and
             (a := self.kwds())
         ):
             return ( None , [] , a )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_53
+            and
             (invalid_star_etc := self.invalid_star_etc())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def kwds(self) -> Optional[Any]:
         # kwds: '**' param_no_default
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_68:
+            return None
         if (
-            (literal := self.expect('**'))
+            (literal := self.terminal(KIND_DOUBLESTAR))
             and
             (a := self.param_no_default())
         ):
@@ -1717,10 +2494,13 @@ class ParseltongueParser(Parser):
     def param_no_default(self) -> Optional[ast . arg]:
         # param_no_default: param ',' TYPE_COMMENT? | param TYPE_COMMENT? &')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (a := self.param())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (tc := self.type_comment(),)
         ):
@@ -1731,7 +2511,7 @@ class ParseltongueParser(Parser):
             and
             (tc := self.type_comment(),)
             and
-            self.positive_lookahead(self.expect, ')')
+            self.positive_lookahead(self.terminal, KIND_RPAR)
         ):
             return self . set_arg_type_comment ( a , tc )
         self._reset(mark)
@@ -1741,12 +2521,15 @@ class ParseltongueParser(Parser):
     def param_with_default(self) -> Optional[Tuple [ast . arg , Any]]:
         # param_with_default: param default ',' TYPE_COMMENT? | param default TYPE_COMMENT? &')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (a := self.param())
             and
             (c := self.default())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (tc := self.type_comment(),)
         ):
@@ -1759,22 +2542,24 @@ class ParseltongueParser(Parser):
             and
             (tc := self.type_comment(),)
             and
-            self.positive_lookahead(self.expect, ')')
+            self.positive_lookahead(self.terminal, KIND_RPAR)
         ):
             return ( self . set_arg_type_comment ( a , tc ) , c )
         self._reset(mark)
         return None
 
-    @memoize
     def param_maybe_default(self) -> Optional[Tuple [ast . arg , Any]]:
         # param_maybe_default: param default? ',' TYPE_COMMENT? | param default? TYPE_COMMENT? &')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (a := self.param())
             and
             (c := self.default(),)
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (tc := self.type_comment(),)
         ):
@@ -1787,7 +2572,7 @@ class ParseltongueParser(Parser):
             and
             (tc := self.type_comment(),)
             and
-            self.positive_lookahead(self.expect, ')')
+            self.positive_lookahead(self.terminal, KIND_RPAR)
         ):
             return ( self . set_arg_type_comment ( a , tc ) , c )
         self._reset(mark)
@@ -1797,6 +2582,9 @@ class ParseltongueParser(Parser):
     def param(self) -> Optional[Any]:
         # param: NAME annotation?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
@@ -1810,12 +2598,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def annotation(self) -> Optional[Any]:
         # annotation: ':' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_57:
+            return None
         if (
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
             (a := self.expression())
         ):
@@ -1827,8 +2617,11 @@ class ParseltongueParser(Parser):
     def default(self) -> Optional[Any]:
         # default: '=' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_69:
+            return None
         if (
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
             and
             (a := self.expression())
         ):
@@ -1836,19 +2629,23 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def if_stmt(self) -> Optional[ast . If]:
         # if_stmt: invalid_if_stmt | 'if' named_expression colon_block elif_stmt | 'if' named_expression colon_block else_block?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_23:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_if_stmt := self.invalid_if_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('if'))
+            (literal := self.terminal(KIND_if))
             and
             (a := self.named_expression())
             and
@@ -1861,7 +2658,7 @@ class ParseltongueParser(Parser):
             return ast . If ( test = a , body = b , orelse = c or [] , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('if'))
+            (literal := self.terminal(KIND_if))
             and
             (a := self.named_expression())
             and
@@ -1875,19 +2672,23 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def unless_stmt(self) -> Optional[ast . If]:
         # unless_stmt: invalid_unless_stmt | 'unless' named_expression colon_block elif_stmt | 'unless' named_expression colon_block else_block?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_24:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_unless_stmt := self.invalid_unless_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('unless'))
+            (literal := self.terminal(KIND_unless))
             and
             (a := self.named_expression())
             and
@@ -1900,7 +2701,7 @@ class ParseltongueParser(Parser):
             return ast . If ( test = ast . UnaryOp ( op = ast . Not ( ) , operand = a ) , body = b , orelse = c or [] , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('unless'))
+            (literal := self.terminal(KIND_unless))
             and
             (a := self.named_expression())
             and
@@ -1914,19 +2715,23 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def elif_stmt(self) -> Optional[List [ast . If]]:
         # elif_stmt: invalid_elif_stmt | 'elif' named_expression colon_block elif_stmt | 'elif' named_expression colon_block else_block?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_70:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_elif_stmt := self.invalid_elif_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('elif'))
+            (literal := self.terminal(KIND_elif))
             and
             (a := self.named_expression())
             and
@@ -1939,7 +2744,7 @@ class ParseltongueParser(Parser):
             return [ast . If ( test = a , body = b , orelse = c , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )]
         self._reset(mark)
         if (
-            (literal := self.expect('elif'))
+            (literal := self.terminal(KIND_elif))
             and
             (a := self.named_expression())
             and
@@ -1953,19 +2758,23 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def else_block(self) -> Optional[list]:
         # else_block: invalid_else_stmt | 'else' ':'? block
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_71:
+            return None
         if (
+            self.call_invalid_rules
+            and
             (invalid_else_stmt := self.invalid_else_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('else'))
+            (literal := self.terminal(KIND_else))
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
             (b := self.block())
         ):
@@ -1973,19 +2782,23 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def while_stmt(self) -> Optional[ast . While]:
         # while_stmt: invalid_while_stmt | 'while' named_expression colon_block else_block?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_29:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_while_stmt := self.invalid_while_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('while'))
+            (literal := self.terminal(KIND_while))
             and
             (a := self.named_expression())
             and
@@ -1999,19 +2812,23 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def until_stmt(self) -> Optional[ast . While]:
         # until_stmt: invalid_until_stmt | 'until' named_expression colon_block else_block?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_30:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_until_stmt := self.invalid_until_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('until'))
+            (literal := self.terminal(KIND_until))
             and
             (a := self.named_expression())
             and
@@ -2025,19 +2842,23 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def loop_stmt(self) -> Optional[ast . While]:
         # loop_stmt: invalid_loop_stmt | 'loop' colon_block else_block?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_31:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_loop_stmt := self.invalid_loop_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('loop'))
+            (literal := self.terminal(KIND_loop))
             and
             (b := self.colon_block())
             and
@@ -2049,24 +2870,30 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def for_stmt(self) -> Optional[Union [ast . For , ast . AsyncFor]]:
         # for_stmt: invalid_for_stmt | 'for' star_targets 'in' ~ star_expressions colon_type_comment_block else_block? | 'async' 'for' star_targets 'in' ~ star_expressions colon_type_comment_block else_block? | invalid_for_target
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_27:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_for_stmt := self.invalid_for_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         cut = False
         if (
-            (literal := self.expect('for'))
+            kind in FIRST_72
+            and
+            (literal := self.terminal(KIND_for))
             and
             (t := self.star_targets())
             and
-            (literal_1 := self.expect('in'))
+            (literal_1 := self.terminal(KIND_in))
             and
             (cut := True)
             and
@@ -2083,13 +2910,15 @@ class ParseltongueParser(Parser):
         if cut: return None
         cut = False
         if (
-            (literal := self.expect('async'))
+            kind in FIRST_65
             and
-            (literal_1 := self.expect('for'))
+            (literal := self.terminal(KIND_async))
+            and
+            (literal_1 := self.terminal(KIND_for))
             and
             (t := self.star_targets())
             and
-            (literal_2 := self.expect('in'))
+            (literal_2 := self.terminal(KIND_in))
             and
             (cut := True)
             and
@@ -2105,33 +2934,41 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         if cut: return None
         if (
+            self.call_invalid_rules
+            and
             (invalid_for_target := self.invalid_for_target())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def with_stmt(self) -> Optional[Union [ast . With , ast . AsyncWith]]:
         # with_stmt: invalid_with_stmt_indent | 'with' '(' ','.with_item+ ','? ')' colon_block | 'with' ','.with_item+ colon_type_comment_block | 'async' 'with' '(' ','.with_item+ ','? ')' colon_block | 'async' 'with' ','.with_item+ colon_type_comment_block
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_26:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_with_stmt_indent := self.invalid_with_stmt_indent())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('with'))
+            kind in FIRST_73
+            and
+            (literal := self.terminal(KIND_with))
             and
-            (literal_1 := self.expect('('))
+            (literal_1 := self.terminal(KIND_LPAR))
             and
-            (a := self._gather_52())
+            (a := self._gather_53())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
             and
-            (literal_2 := self.expect(')'))
+            (literal_2 := self.terminal(KIND_RPAR))
             and
             (b := self.colon_block())
         ):
@@ -2140,9 +2977,11 @@ class ParseltongueParser(Parser):
             return self . check_version ( ( 3 , 9 ) , "Parenthesized with items" , ast . With ( items = a , body = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset ) )
         self._reset(mark)
         if (
-            (literal := self.expect('with'))
+            kind in FIRST_73
             and
-            (a := self._gather_54())
+            (literal := self.terminal(KIND_with))
+            and
+            (a := self._gather_55())
             and
             (b := self.colon_type_comment_block())
         ):
@@ -2151,17 +2990,19 @@ class ParseltongueParser(Parser):
             return ast . With ( items = a , body = b [1] , type_comment = b [0] , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('async'))
+            kind in FIRST_65
+            and
+            (literal := self.terminal(KIND_async))
             and
-            (literal_1 := self.expect('with'))
+            (literal_1 := self.terminal(KIND_with))
             and
-            (literal_2 := self.expect('('))
+            (literal_2 := self.terminal(KIND_LPAR))
             and
-            (a := self._gather_56())
+            (a := self._gather_57())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
             and
-            (literal_3 := self.expect(')'))
+            (literal_3 := self.terminal(KIND_RPAR))
             and
             (b := self.colon_block())
         ):
@@ -2170,11 +3011,13 @@ class ParseltongueParser(Parser):
             return self . check_version ( ( 3 , 9 ) , "Parenthesized with items" , ast . AsyncWith ( items = a , body = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset ) )
         self._reset(mark)
         if (
-            (literal := self.expect('async'))
+            kind in FIRST_65
             and
-            (literal_1 := self.expect('with'))
+            (literal := self.terminal(KIND_async))
             and
-            (a := self._gather_58())
+            (literal_1 := self.terminal(KIND_with))
+            and
+            (a := self._gather_59())
             and
             (b := self.colon_type_comment_block())
         ):
@@ -2184,22 +3027,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def with_item(self) -> Optional[ast . withitem]:
         # with_item: expression 'as' star_target &(',' | ')' | ':' | NEWLINE) | invalid_with_item | expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
             (e := self.expression())
             and
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             (t := self.star_target())
             and
-            self.positive_lookahead(self._tmp_60, )
+            self.positive_lookahead(self._tmp_61, )
         ):
             return ast . withitem ( context_expr = e , optional_vars = t )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_with_item := self.invalid_with_item())
         ):
             return None  # pragma: no cover
@@ -2211,21 +3058,25 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def try_stmt(self) -> Optional[ast . Try]:
         # try_stmt: invalid_try_stmt | 'try' ':'? block finally_block | 'try' ':'? block except_block+ else_block? finally_block?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_28:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_try_stmt := self.invalid_try_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('try'))
+            (literal := self.terminal(KIND_try))
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
             (b := self.block())
             and
@@ -2236,13 +3087,13 @@ class ParseltongueParser(Parser):
             return ast . Try ( body = b , handlers = [] , orelse = [] , finalbody = f , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('try'))
+            (literal := self.terminal(KIND_try))
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
             (b := self.block())
             and
-            (ex := self._loop1_61())
+            (ex := self._loop1_62())
             and
             (el := self.else_block(),)
             and
@@ -2254,23 +3105,27 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def except_block(self) -> Optional[ast . ExceptHandler]:
         # except_block: invalid_except_stmt_indent | 'except' expression ['as' NAME] colon_block | 'except' colon_block | invalid_except_stmt
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_74:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
             (invalid_except_stmt_indent := self.invalid_except_stmt_indent())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('except'))
+            (literal := self.terminal(KIND_except))
             and
             (e := self.expression())
             and
-            (t := self._tmp_62(),)
+            (t := self._tmp_63(),)
             and
             (b := self.colon_block())
         ):
@@ -2279,7 +3134,7 @@ class ParseltongueParser(Parser):
             return ast . ExceptHandler ( type = e , name = t , body = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('except'))
+            (literal := self.terminal(KIND_except))
             and
             (b := self.colon_block())
         ):
@@ -2288,25 +3143,31 @@ class ParseltongueParser(Parser):
             return ast . ExceptHandler ( type = None , name = None , body = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_except_stmt := self.invalid_except_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def finally_block(self) -> Optional[list]:
         # finally_block: invalid_finally_stmt | 'finally' ':'? block
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_75:
+            return None
         if (
+            self.call_invalid_rules
+            and
             (invalid_finally_stmt := self.invalid_finally_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect('finally'))
+            (literal := self.terminal(KIND_finally))
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
             (a := self.block())
         ):
@@ -2314,48 +3175,54 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def match_stmt(self) -> Optional["ast.Match"]:
         # match_stmt: "match" subject_expr ':' NEWLINE INDENT case_block+ DEDENT | invalid_match_stmt
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_32:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect("match"))
+            (literal := self.terminal(KIND_match))
             and
             (subject := self.subject_expr())
             and
-            (literal_1 := self.expect(':'))
+            (literal_1 := self.terminal(KIND_COLON))
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
-            (cases := self._loop1_63())
+            (cases := self._loop1_64())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Match ( subject = subject , cases = cases , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_match_stmt := self.invalid_match_stmt())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def subject_expr(self) -> Optional[Any]:
         # subject_expr: star_named_expression ',' star_named_expressions? | named_expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_4:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (value := self.star_named_expression())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (values := self.star_named_expressions(),)
         ):
@@ -2364,29 +3231,35 @@ class ParseltongueParser(Parser):
             return self . check_version ( ( 3 , 10 ) , "Pattern matching is" , ast . Tuple ( elts = [value] + ( values or [] ) , ctx = Load , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset ) )
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (e := self.named_expression())
         ):
             return self . check_version ( ( 3 , 10 ) , "Pattern matching is" , e )
         self._reset(mark)
         return None
 
-    @memoize
     def case_block(self) -> Optional["ast.match_case"]:
         # case_block: invalid_case_block | "case" patterns guard? ':' block
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_76:
+            return None
         if (
+            self.call_invalid_rules
+            and
             (invalid_case_block := self.invalid_case_block())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (literal := self.expect("case"))
+            (literal := self.terminal(KIND_case))
             and
             (pattern := self.patterns())
             and
             (guard := self.guard(),)
             and
-            (literal_1 := self.expect(':'))
+            (literal_1 := self.terminal(KIND_COLON))
             and
             (body := self.block())
         ):
@@ -2394,12 +3267,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def guard(self) -> Optional[Any]:
         # guard: 'if' named_expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_23:
+            return None
         if (
-            (literal := self.expect('if'))
+            (literal := self.terminal(KIND_if))
             and
             (guard := self.named_expression())
         ):
@@ -2407,10 +3282,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def patterns(self) -> Optional[Any]:
         # patterns: open_sequence_pattern | pattern
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_77:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
@@ -2421,16 +3298,20 @@ class ParseltongueParser(Parser):
             return ast . MatchSequence ( patterns = patterns , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_78
+            and
             (pattern := self.pattern())
         ):
             return pattern
         self._reset(mark)
         return None
 
-    @memoize
     def pattern(self) -> Optional[Any]:
         # pattern: as_pattern | or_pattern
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_78:
+            return None
         if (
             (as_pattern := self.as_pattern())
         ):
@@ -2443,16 +3324,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def as_pattern(self) -> Optional["ast.MatchAs"]:
         # as_pattern: or_pattern 'as' pattern_capture_target | invalid_as_pattern
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_78:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (pattern := self.or_pattern())
             and
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             (target := self.pattern_capture_target())
         ):
@@ -2461,20 +3344,24 @@ class ParseltongueParser(Parser):
             return ast . MatchAs ( pattern = pattern , name = target , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_as_pattern := self.invalid_as_pattern())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def or_pattern(self) -> Optional["ast.MatchOr"]:
         # or_pattern: '|'.closed_pattern+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_78:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (patterns := self._gather_64())
+            (patterns := self._gather_65())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2482,68 +3369,92 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def closed_pattern(self) -> Optional[Any]:
         # closed_pattern: literal_pattern | capture_pattern | wildcard_pattern | value_pattern | group_pattern | sequence_pattern | mapping_pattern | class_pattern
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_78:
+            return None
         if (
+            kind in FIRST_79
+            and
             (literal_pattern := self.literal_pattern())
         ):
             return literal_pattern
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (capture_pattern := self.capture_pattern())
         ):
             return capture_pattern
         self._reset(mark)
         if (
+            kind in FIRST_80
+            and
             (wildcard_pattern := self.wildcard_pattern())
         ):
             return wildcard_pattern
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (value_pattern := self.value_pattern())
         ):
             return value_pattern
         self._reset(mark)
         if (
+            kind in FIRST_3
+            and
             (group_pattern := self.group_pattern())
         ):
             return group_pattern
         self._reset(mark)
         if (
+            kind in FIRST_81
+            and
             (sequence_pattern := self.sequence_pattern())
         ):
             return sequence_pattern
         self._reset(mark)
         if (
+            kind in FIRST_82
+            and
             (mapping_pattern := self.mapping_pattern())
         ):
             return mapping_pattern
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (class_pattern := self.class_pattern())
         ):
             return class_pattern
         self._reset(mark)
         return None
 
-    @memoize
     def literal_pattern(self) -> Optional[Any]:
         # literal_pattern: signed_number !('+' | '-') | complex_number | strings | 'None' | 'True' | 'False'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_79:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            kind in FIRST_83
+            and
             (value := self.signed_number())
             and
-            self.negative_lookahead(self._tmp_66, )
+            self.negative_lookahead(self._tmp_67, )
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . MatchValue ( value = value , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_83
+            and
             (value := self.complex_number())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
@@ -2551,6 +3462,8 @@ class ParseltongueParser(Parser):
             return ast . MatchValue ( value = value , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_84
+            and
             (value := self.strings())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
@@ -2558,21 +3471,27 @@ class ParseltongueParser(Parser):
             return ast . MatchValue ( value = value , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('None'))
+            kind in FIRST_85
+            and
+            (literal := self.terminal(KIND_None))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . MatchSingleton ( value = None , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('True'))
+            kind in FIRST_86
+            and
+            (literal := self.terminal(KIND_True))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . MatchSingleton ( value = True , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('False'))
+            kind in FIRST_87
+            and
+            (literal := self.terminal(KIND_False))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2580,45 +3499,59 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def literal_expr(self) -> Optional[Any]:
         # literal_expr: signed_number !('+' | '-') | complex_number | strings | 'None' | 'True' | 'False'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_79:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            kind in FIRST_83
+            and
             (signed_number := self.signed_number())
             and
-            self.negative_lookahead(self._tmp_67, )
+            self.negative_lookahead(self._tmp_68, )
         ):
             return signed_number
         self._reset(mark)
         if (
+            kind in FIRST_83
+            and
             (complex_number := self.complex_number())
         ):
             return complex_number
         self._reset(mark)
         if (
+            kind in FIRST_84
+            and
             (strings := self.strings())
         ):
             return strings
         self._reset(mark)
         if (
-            (literal := self.expect('None'))
+            kind in FIRST_85
+            and
+            (literal := self.terminal(KIND_None))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Constant ( value = None , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('True'))
+            kind in FIRST_86
+            and
+            (literal := self.terminal(KIND_True))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Constant ( value = True , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('False'))
+            kind in FIRST_87
+            and
+            (literal := self.terminal(KIND_False))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2626,16 +3559,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def complex_number(self) -> Optional[Any]:
         # complex_number: signed_real_number '+' imaginary_number | signed_real_number '-' imaginary_number
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_83:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (real := self.signed_real_number())
             and
-            (literal := self.expect('+'))
+            (literal := self.terminal(KIND_PLUS))
             and
             (imag := self.imaginary_number())
         ):
@@ -2646,7 +3581,7 @@ class ParseltongueParser(Parser):
         if (
             (real := self.signed_real_number())
             and
-            (literal := self.expect('-'))
+            (literal := self.terminal(KIND_MINUS))
             and
             (imag := self.imaginary_number())
         ):
@@ -2656,23 +3591,29 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def signed_number(self) -> Optional[Any]:
         # signed_number: NUMBER | '-' NUMBER
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_83:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (a := self.number())
+            kind in FIRST_88
+            and
+            (a := self.terminal(tokenize.NUMBER))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Constant ( value = ast . literal_eval ( a . string ) , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('-'))
+            kind in FIRST_89
+            and
+            (literal := self.terminal(KIND_MINUS))
             and
-            (a := self.number())
+            (a := self.terminal(tokenize.NUMBER))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2680,19 +3621,25 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def signed_real_number(self) -> Optional[Any]:
         # signed_real_number: real_number | '-' real_number
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_83:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            kind in FIRST_88
+            and
             (real_number := self.real_number())
         ):
             return real_number
         self._reset(mark)
         if (
-            (literal := self.expect('-'))
+            kind in FIRST_89
+            and
+            (literal := self.terminal(KIND_MINUS))
             and
             (real := self.real_number())
         ):
@@ -2702,14 +3649,16 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def real_number(self) -> Optional[ast . Constant]:
         # real_number: NUMBER
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_88:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (real := self.number())
+            (real := self.terminal(tokenize.NUMBER))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2717,14 +3666,16 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def imaginary_number(self) -> Optional[ast . Constant]:
         # imaginary_number: NUMBER
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_88:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (imag := self.number())
+            (imag := self.terminal(tokenize.NUMBER))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2732,10 +3683,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def capture_pattern(self) -> Optional[Any]:
         # capture_pattern: pattern_capture_target
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
@@ -2747,29 +3700,33 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def pattern_capture_target(self) -> Optional[str]:
         # pattern_capture_target: !"_" NAME !('.' | '(' | '=')
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
-            self.negative_lookahead(self.expect, "_")
+            self.negative_lookahead(self.terminal, KIND__)
             and
             (name := self.name())
             and
-            self.negative_lookahead(self._tmp_68, )
+            self.negative_lookahead(self._tmp_69, )
         ):
             return name . string
         self._reset(mark)
         return None
 
-    @memoize
     def wildcard_pattern(self) -> Optional["ast.MatchAs"]:
         # wildcard_pattern: "_"
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_80:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect("_"))
+            (literal := self.terminal(KIND__))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2777,16 +3734,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def value_pattern(self) -> Optional["ast.MatchValue"]:
         # value_pattern: attr !('.' | '(' | '=')
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (attr := self.attr())
             and
-            self.negative_lookahead(self._tmp_69, )
+            self.negative_lookahead(self._tmp_70, )
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2798,12 +3757,15 @@ class ParseltongueParser(Parser):
     def attr(self) -> Optional[ast . Attribute]:
         # attr: name_or_attr '.' NAME
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (value := self.name_or_attr())
             and
-            (literal := self.expect('.'))
+            (literal := self.terminal(KIND_DOT))
             and
             (attr := self.name())
         ):
@@ -2817,6 +3779,9 @@ class ParseltongueParser(Parser):
     def name_or_attr(self) -> Optional[Any]:
         # name_or_attr: attr | NAME
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
@@ -2833,44 +3798,52 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def group_pattern(self) -> Optional[Any]:
         # group_pattern: '(' pattern ')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_3:
+            return None
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (pattern := self.pattern())
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return pattern
         self._reset(mark)
         return None
 
-    @memoize
     def sequence_pattern(self) -> Optional["ast.MatchSequence"]:
         # sequence_pattern: '[' maybe_sequence_pattern? ']' | '(' open_sequence_pattern? ')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_81:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('['))
+            kind in FIRST_90
+            and
+            (literal := self.terminal(KIND_LSQB))
             and
             (patterns := self.maybe_sequence_pattern(),)
             and
-            (literal_1 := self.expect(']'))
+            (literal_1 := self.terminal(KIND_RSQB))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . MatchSequence ( patterns = patterns or [] , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
             and
             (patterns := self.open_sequence_pattern(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2878,14 +3851,16 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def open_sequence_pattern(self) -> Optional[Any]:
         # open_sequence_pattern: maybe_star_pattern ',' maybe_sequence_pattern?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_77:
+            return None
         if (
             (pattern := self.maybe_star_pattern())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (patterns := self.maybe_sequence_pattern(),)
         ):
@@ -2893,43 +3868,53 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def maybe_sequence_pattern(self) -> Optional[Any]:
         # maybe_sequence_pattern: ','.maybe_star_pattern+ ','?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_77:
+            return None
         if (
-            (patterns := self._gather_70())
+            (patterns := self._gather_71())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
         ):
             return patterns
         self._reset(mark)
         return None
 
-    @memoize
     def maybe_star_pattern(self) -> Optional[Any]:
         # maybe_star_pattern: star_pattern | pattern
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_77:
+            return None
         if (
+            kind in FIRST_53
+            and
             (star_pattern := self.star_pattern())
         ):
             return star_pattern
         self._reset(mark)
         if (
+            kind in FIRST_78
+            and
             (pattern := self.pattern())
         ):
             return pattern
         self._reset(mark)
         return None
 
-    @memoize
     def star_pattern(self) -> Optional[Any]:
         # star_pattern: '*' pattern_capture_target | '*' wildcard_pattern
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_53:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('*'))
+            (literal := self.terminal(KIND_STAR))
             and
             (target := self.pattern_capture_target())
         ):
@@ -2938,7 +3923,7 @@ class ParseltongueParser(Parser):
             return ast . MatchStar ( name = target , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('*'))
+            (literal := self.terminal(KIND_STAR))
             and
             (wildcard_pattern := self.wildcard_pattern())
         ):
@@ -2948,59 +3933,61 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def mapping_pattern(self) -> Optional[Any]:
         # mapping_pattern: '{' '}' | '{' double_star_pattern ','? '}' | '{' items_pattern ',' double_star_pattern ','? '}' | '{' items_pattern ','? '}'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_82:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('{'))
+            (literal := self.terminal(KIND_LBRACE))
             and
-            (literal_1 := self.expect('}'))
+            (literal_1 := self.terminal(KIND_RBRACE))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . MatchMapping ( keys = [] , patterns = [] , rest = None , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('{'))
+            (literal := self.terminal(KIND_LBRACE))
             and
             (rest := self.double_star_pattern())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
             and
-            (literal_1 := self.expect('}'))
+            (literal_1 := self.terminal(KIND_RBRACE))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . MatchMapping ( keys = [] , patterns = [] , rest = rest , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('{'))
+            (literal := self.terminal(KIND_LBRACE))
             and
             (items := self.items_pattern())
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
             and
             (rest := self.double_star_pattern())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
             and
-            (literal_2 := self.expect('}'))
+            (literal_2 := self.terminal(KIND_RBRACE))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . MatchMapping ( keys = [k for k , _ in items] , patterns = [p for _ , p in items] , rest = rest , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset , )
         self._reset(mark)
         if (
-            (literal := self.expect('{'))
+            (literal := self.terminal(KIND_LBRACE))
             and
             (items := self.items_pattern())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
             and
-            (literal_1 := self.expect('}'))
+            (literal_1 := self.terminal(KIND_RBRACE))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3008,25 +3995,29 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def items_pattern(self) -> Optional[Any]:
         # items_pattern: ','.key_value_pattern+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_91:
+            return None
         if (
-            (_gather_72 := self._gather_72())
+            (_gather_73 := self._gather_73())
         ):
-            return _gather_72
+            return _gather_73
         self._reset(mark)
         return None
 
-    @memoize
     def key_value_pattern(self) -> Optional[Any]:
         # key_value_pattern: (literal_expr | attr) ':' pattern
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_91:
+            return None
         if (
-            (key := self._tmp_74())
+            (key := self._tmp_75())
             and
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
             (pattern := self.pattern())
         ):
@@ -3034,12 +4025,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def double_star_pattern(self) -> Optional[Any]:
         # double_star_pattern: '**' pattern_capture_target
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_68:
+            return None
         if (
-            (literal := self.expect('**'))
+            (literal := self.terminal(KIND_DOUBLESTAR))
             and
             (target := self.pattern_capture_target())
         ):
@@ -3047,18 +4040,20 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def class_pattern(self) -> Optional["ast.MatchClass"]:
         # class_pattern: name_or_attr '(' ')' | name_or_attr '(' positional_patterns ','? ')' | name_or_attr '(' keyword_patterns ','? ')' | name_or_attr '(' positional_patterns ',' keyword_patterns ','? ')' | invalid_class_pattern
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (cls := self.name_or_attr())
             and
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3067,13 +4062,13 @@ class ParseltongueParser(Parser):
         if (
             (cls := self.name_or_attr())
             and
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (patterns := self.positional_patterns())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3082,13 +4077,13 @@ class ParseltongueParser(Parser):
         if (
             (cls := self.name_or_attr())
             and
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (keywords := self.keyword_patterns())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3097,59 +4092,67 @@ class ParseltongueParser(Parser):
         if (
             (cls := self.name_or_attr())
             and
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (patterns := self.positional_patterns())
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
             and
             (keywords := self.keyword_patterns())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
             and
-            (literal_2 := self.expect(')'))
+            (literal_2 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . MatchClass ( cls = cls , patterns = patterns , kwd_attrs = [k for k , _ in keywords] , kwd_patterns = [p for _ , p in keywords] , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset , )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_class_pattern := self.invalid_class_pattern())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def positional_patterns(self) -> Optional[Any]:
         # positional_patterns: ','.pattern+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_78:
+            return None
         if (
-            (args := self._gather_75())
+            (args := self._gather_76())
         ):
             return args
         self._reset(mark)
         return None
 
-    @memoize
     def keyword_patterns(self) -> Optional[Any]:
         # keyword_patterns: ','.keyword_pattern+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
-            (_gather_77 := self._gather_77())
+            (_gather_78 := self._gather_78())
         ):
-            return _gather_77
+            return _gather_78
         self._reset(mark)
         return None
 
-    @memoize
     def keyword_pattern(self) -> Optional[Any]:
         # keyword_pattern: NAME '=' pattern
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (arg := self.name())
             and
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
             and
             (value := self.pattern())
         ):
@@ -3157,18 +4160,20 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def expressions(self) -> Optional[Any]:
         # expressions: expression ((',' expression))+ ','? | expression ',' | expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.expression())
             and
-            (b := self._loop1_79())
+            (b := self._loop1_80())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3177,7 +4182,7 @@ class ParseltongueParser(Parser):
         if (
             (a := self.expression())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3194,21 +4199,30 @@ class ParseltongueParser(Parser):
     def expression(self) -> Optional[Any]:
         # expression: invalid_expression | disjunction 'if' disjunction 'else' expression | disjunction | lambdef
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_92
+            and
             (invalid_expression := self.invalid_expression())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
+            kind in FIRST_92
+            and
             (a := self.disjunction())
             and
-            (literal := self.expect('if'))
+            (literal := self.terminal(KIND_if))
             and
             (b := self.disjunction())
             and
-            (literal_1 := self.expect('else'))
+            (literal_1 := self.terminal(KIND_else))
             and
             (c := self.expression())
         ):
@@ -3217,27 +4231,33 @@ class ParseltongueParser(Parser):
             return ast . IfExp ( body = a , test = b , orelse = c , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_92
+            and
             (disjunction := self.disjunction())
         ):
             return disjunction
         self._reset(mark)
         if (
+            kind in FIRST_93
+            and
             (lambdef := self.lambdef())
         ):
             return lambdef
         self._reset(mark)
         return None
 
-    @memoize
     def yield_expr(self) -> Optional[Any]:
         # yield_expr: 'yield' 'from' expression | 'yield' star_expressions?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_16:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('yield'))
+            (literal := self.terminal(KIND_yield))
             and
-            (literal_1 := self.expect('from'))
+            (literal_1 := self.terminal(KIND_from))
             and
             (a := self.expression())
         ):
@@ -3246,7 +4266,7 @@ class ParseltongueParser(Parser):
             return ast . YieldFrom ( value = a , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('yield'))
+            (literal := self.terminal(KIND_yield))
             and
             (a := self.star_expressions(),)
         ):
@@ -3256,18 +4276,20 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def star_expressions(self) -> Optional[Any]:
         # star_expressions: star_expression ((',' star_expression))+ ','? | star_expression ',' | star_expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_4:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.star_expression())
             and
-            (b := self._loop1_80())
+            (b := self._loop1_81())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3276,7 +4298,7 @@ class ParseltongueParser(Parser):
         if (
             (a := self.star_expression())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3293,10 +4315,15 @@ class ParseltongueParser(Parser):
     def star_expression(self) -> Optional[Any]:
         # star_expression: '*' bitwise_or | expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_4:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('*'))
+            kind in FIRST_53
+            and
+            (literal := self.terminal(KIND_STAR))
             and
             (a := self.bitwise_or())
         ):
@@ -3305,43 +4332,55 @@ class ParseltongueParser(Parser):
             return ast . Starred ( value = a , ctx = Load , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (expression := self.expression())
         ):
             return expression
         self._reset(mark)
         return None
 
-    @memoize
     def star_named_expressions(self) -> Optional[list]:
         # star_named_expressions: separator.star_named_expression+ extra_separator [INDENT star_named_expressions DEDENT] | INDENT separator.star_named_expression+ extra_separator DEDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_94:
+            return None
         if (
-            (a := self._gather_81())
+            kind in FIRST_4
+            and
+            (a := self._gather_82())
             and
             (extra_separator := self.extra_separator())
             and
-            (b := self._tmp_83(),)
+            (b := self._tmp_84(),)
         ):
             return a + ( b or [] )
         self._reset(mark)
         if (
-            (_indent := self.expect('INDENT'))
+            kind in FIRST_95
             and
-            (a := self._gather_84())
+            (_indent := self.terminal(tokenize.INDENT))
+            and
+            (a := self._gather_85())
             and
             (extra_separator := self.extra_separator())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def star_named_expressions_with_separator(self) -> Optional[list]:
         # star_named_expressions_with_separator: star_named_expression separator star_named_expressions | star_named_expression ',' | INDENT star_named_expression ',' DEDENT | INDENT star_named_expression separator separator.star_named_expressions+ extra_separator DEDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_94:
+            return None
         if (
+            kind in FIRST_4
+            and
             (a := self.star_named_expression())
             and
             (separator := self.separator())
@@ -3351,48 +4390,58 @@ class ParseltongueParser(Parser):
             return [a] + b
         self._reset(mark)
         if (
+            kind in FIRST_4
+            and
             (a := self.star_named_expression())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
         ):
             return [a]
         self._reset(mark)
         if (
-            (_indent := self.expect('INDENT'))
+            kind in FIRST_95
+            and
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (a := self.star_named_expression())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return [a]
         self._reset(mark)
         if (
-            (_indent := self.expect('INDENT'))
+            kind in FIRST_95
+            and
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (a := self.star_named_expression())
             and
             (separator := self.separator())
             and
-            (b := self._gather_86())
+            (b := self._gather_87())
             and
             (extra_separator := self.extra_separator())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return [a] + b
         self._reset(mark)
         return None
 
-    @memoize
     def star_named_expression(self) -> Optional[Any]:
         # star_named_expression: '*' bitwise_or | named_expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_4:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('*'))
+            kind in FIRST_53
+            and
+            (literal := self.terminal(KIND_STAR))
             and
             (a := self.bitwise_or())
         ):
@@ -3401,6 +4450,8 @@ class ParseltongueParser(Parser):
             return ast . Starred ( value = a , ctx = Load , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (named_expression := self.named_expression())
         ):
             return named_expression
@@ -3411,13 +4462,16 @@ class ParseltongueParser(Parser):
     def assignment_expression(self) -> Optional[Any]:
         # assignment_expression: NAME ':=' ~ expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         cut = False
         if (
             (a := self.name())
             and
-            (literal := self.expect(':='))
+            (literal := self.terminal(KIND_COLONEQUAL))
             and
             (cut := True)
             and
@@ -3434,12 +4488,19 @@ class ParseltongueParser(Parser):
     def named_expression(self) -> Optional[Any]:
         # named_expression: assignment_expression | invalid_named_expression | expression !':='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
+            kind in FIRST_33
+            and
             (assignment_expression := self.assignment_expression())
         ):
             return assignment_expression
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_named_expression := self.invalid_named_expression())
         ):
             return None  # pragma: no cover
@@ -3447,7 +4508,7 @@ class ParseltongueParser(Parser):
         if (
             (a := self.expression())
             and
-            self.negative_lookahead(self.expect, ':=')
+            self.negative_lookahead(self.terminal, KIND_COLONEQUAL)
         ):
             return a
         self._reset(mark)
@@ -3456,13 +4517,18 @@ class ParseltongueParser(Parser):
     @memoize
     def disjunction(self) -> Optional[Any]:
         # disjunction: conjunction (('or' conjunction))+ | conjunction
+        if self.precedence_climbing:
+            return self.climb_disjunction()
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_92:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.conjunction())
             and
-            (b := self._loop1_88())
+            (b := self._loop1_89())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3475,16 +4541,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def conjunction(self) -> Optional[Any]:
         # conjunction: inversion (('and' inversion))+ | inversion
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_92:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.inversion())
             and
-            (b := self._loop1_89())
+            (b := self._loop1_90())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3497,14 +4565,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def inversion(self) -> Optional[Any]:
         # inversion: 'not' inversion | comparison
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_92:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('not'))
+            kind in FIRST_96
+            and
+            (literal := self.terminal(KIND_not))
             and
             (a := self.inversion())
         ):
@@ -3513,22 +4585,26 @@ class ParseltongueParser(Parser):
             return ast . UnaryOp ( op = ast . Not ( ) , operand = a , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_97
+            and
             (comparison := self.comparison())
         ):
             return comparison
         self._reset(mark)
         return None
 
-    @memoize
     def comparison(self) -> Optional[Any]:
         # comparison: bitwise_or compare_op_bitwise_or_pair+ | bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_97:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.bitwise_or())
             and
-            (b := self._loop1_90())
+            (b := self._loop1_91())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3541,68 +4617,92 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def compare_op_bitwise_or_pair(self) -> Optional[Any]:
         # compare_op_bitwise_or_pair: eq_bitwise_or | noteq_bitwise_or | lte_bitwise_or | lt_bitwise_or | gte_bitwise_or | gt_bitwise_or | notin_bitwise_or | in_bitwise_or | isnot_bitwise_or | is_bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_98:
+            return None
         if (
+            kind in FIRST_99
+            and
             (eq_bitwise_or := self.eq_bitwise_or())
         ):
             return eq_bitwise_or
         self._reset(mark)
         if (
+            kind in FIRST_100
+            and
             (noteq_bitwise_or := self.noteq_bitwise_or())
         ):
             return noteq_bitwise_or
         self._reset(mark)
         if (
+            kind in FIRST_101
+            and
             (lte_bitwise_or := self.lte_bitwise_or())
         ):
             return lte_bitwise_or
         self._reset(mark)
         if (
+            kind in FIRST_102
+            and
             (lt_bitwise_or := self.lt_bitwise_or())
         ):
             return lt_bitwise_or
         self._reset(mark)
         if (
+            kind in FIRST_103
+            and
             (gte_bitwise_or := self.gte_bitwise_or())
         ):
             return gte_bitwise_or
         self._reset(mark)
         if (
+            kind in FIRST_104
+            and
             (gt_bitwise_or := self.gt_bitwise_or())
         ):
             return gt_bitwise_or
         self._reset(mark)
         if (
+            kind in FIRST_96
+            and
             (notin_bitwise_or := self.notin_bitwise_or())
         ):
             return notin_bitwise_or
         self._reset(mark)
         if (
+            kind in FIRST_105
+            and
             (in_bitwise_or := self.in_bitwise_or())
         ):
             return in_bitwise_or
         self._reset(mark)
         if (
+            kind in FIRST_106
+            and
             (isnot_bitwise_or := self.isnot_bitwise_or())
         ):
             return isnot_bitwise_or
         self._reset(mark)
         if (
+            kind in FIRST_106
+            and
             (is_bitwise_or := self.is_bitwise_or())
         ):
             return is_bitwise_or
         self._reset(mark)
         return None
 
-    @memoize
     def eq_bitwise_or(self) -> Optional[Any]:
         # eq_bitwise_or: '==' bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_99:
+            return None
         if (
-            (literal := self.expect('=='))
+            (literal := self.terminal(KIND_EQEQUAL))
             and
             (a := self.bitwise_or())
         ):
@@ -3610,12 +4710,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def noteq_bitwise_or(self) -> Optional[tuple]:
         # noteq_bitwise_or: '!=' bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_100:
+            return None
         if (
-            (literal := self.expect('!='))
+            (literal := self.terminal(KIND_NOTEQUAL))
             and
             (a := self.bitwise_or())
         ):
@@ -3623,12 +4725,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def lte_bitwise_or(self) -> Optional[Any]:
         # lte_bitwise_or: '<=' bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_101:
+            return None
         if (
-            (literal := self.expect('<='))
+            (literal := self.terminal(KIND_LESSEQUAL))
             and
             (a := self.bitwise_or())
         ):
@@ -3636,12 +4740,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def lt_bitwise_or(self) -> Optional[Any]:
         # lt_bitwise_or: '<' bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_102:
+            return None
         if (
-            (literal := self.expect('<'))
+            (literal := self.terminal(KIND_LESS))
             and
             (a := self.bitwise_or())
         ):
@@ -3649,12 +4755,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def gte_bitwise_or(self) -> Optional[Any]:
         # gte_bitwise_or: '>=' bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_103:
+            return None
         if (
-            (literal := self.expect('>='))
+            (literal := self.terminal(KIND_GREATEREQUAL))
             and
             (a := self.bitwise_or())
         ):
@@ -3662,12 +4770,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def gt_bitwise_or(self) -> Optional[Any]:
         # gt_bitwise_or: '>' bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_104:
+            return None
         if (
-            (literal := self.expect('>'))
+            (literal := self.terminal(KIND_GREATER))
             and
             (a := self.bitwise_or())
         ):
@@ -3675,14 +4785,16 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def notin_bitwise_or(self) -> Optional[Any]:
         # notin_bitwise_or: 'not' 'in' bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_96:
+            return None
         if (
-            (literal := self.expect('not'))
+            (literal := self.terminal(KIND_not))
             and
-            (literal_1 := self.expect('in'))
+            (literal_1 := self.terminal(KIND_in))
             and
             (a := self.bitwise_or())
         ):
@@ -3690,12 +4802,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def in_bitwise_or(self) -> Optional[Any]:
         # in_bitwise_or: 'in' bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_105:
+            return None
         if (
-            (literal := self.expect('in'))
+            (literal := self.terminal(KIND_in))
             and
             (a := self.bitwise_or())
         ):
@@ -3703,14 +4817,16 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def isnot_bitwise_or(self) -> Optional[Any]:
         # isnot_bitwise_or: 'is' 'not' bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_106:
+            return None
         if (
-            (literal := self.expect('is'))
+            (literal := self.terminal(KIND_is))
             and
-            (literal_1 := self.expect('not'))
+            (literal_1 := self.terminal(KIND_not))
             and
             (a := self.bitwise_or())
         ):
@@ -3718,12 +4834,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def is_bitwise_or(self) -> Optional[Any]:
         # is_bitwise_or: 'is' bitwise_or
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_106:
+            return None
         if (
-            (literal := self.expect('is'))
+            (literal := self.terminal(KIND_is))
             and
             (a := self.bitwise_or())
         ):
@@ -3735,12 +4853,15 @@ class ParseltongueParser(Parser):
     def bitwise_or(self) -> Optional[Any]:
         # bitwise_or: bitwise_or '|' bitwise_xor | bitwise_xor
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_97:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.bitwise_or())
             and
-            (literal := self.expect('|'))
+            (literal := self.terminal(KIND_VBAR))
             and
             (b := self.bitwise_xor())
         ):
@@ -3759,12 +4880,15 @@ class ParseltongueParser(Parser):
     def bitwise_xor(self) -> Optional[Any]:
         # bitwise_xor: bitwise_xor '^' bitwise_and | bitwise_and
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_97:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.bitwise_xor())
             and
-            (literal := self.expect('^'))
+            (literal := self.terminal(KIND_CIRCUMFLEX))
             and
             (b := self.bitwise_and())
         ):
@@ -3783,12 +4907,15 @@ class ParseltongueParser(Parser):
     def bitwise_and(self) -> Optional[Any]:
         # bitwise_and: bitwise_and '&' shift_expr | shift_expr
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_97:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.bitwise_and())
             and
-            (literal := self.expect('&'))
+            (literal := self.terminal(KIND_AMPER))
             and
             (b := self.shift_expr())
         ):
@@ -3807,12 +4934,15 @@ class ParseltongueParser(Parser):
     def shift_expr(self) -> Optional[Any]:
         # shift_expr: shift_expr '<<' sum | shift_expr '>>' sum | sum
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_97:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.shift_expr())
             and
-            (literal := self.expect('<<'))
+            (literal := self.terminal(KIND_LEFTSHIFT))
             and
             (b := self.sum())
         ):
@@ -3823,7 +4953,7 @@ class ParseltongueParser(Parser):
         if (
             (a := self.shift_expr())
             and
-            (literal := self.expect('>>'))
+            (literal := self.terminal(KIND_RIGHTSHIFT))
             and
             (b := self.sum())
         ):
@@ -3842,12 +4972,15 @@ class ParseltongueParser(Parser):
     def sum(self) -> Optional[Any]:
         # sum: sum '+' term | sum '-' term | term
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_97:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.sum())
             and
-            (literal := self.expect('+'))
+            (literal := self.terminal(KIND_PLUS))
             and
             (b := self.term())
         ):
@@ -3858,7 +4991,7 @@ class ParseltongueParser(Parser):
         if (
             (a := self.sum())
             and
-            (literal := self.expect('-'))
+            (literal := self.terminal(KIND_MINUS))
             and
             (b := self.term())
         ):
@@ -3877,12 +5010,15 @@ class ParseltongueParser(Parser):
     def term(self) -> Optional[Any]:
         # term: term '*' factor | term '/' factor | term '//' factor | term '%' factor | term '@' factor | factor
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_97:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.term())
             and
-            (literal := self.expect('*'))
+            (literal := self.terminal(KIND_STAR))
             and
             (b := self.factor())
         ):
@@ -3893,7 +5029,7 @@ class ParseltongueParser(Parser):
         if (
             (a := self.term())
             and
-            (literal := self.expect('/'))
+            (literal := self.terminal(KIND_SLASH))
             and
             (b := self.factor())
         ):
@@ -3904,7 +5040,7 @@ class ParseltongueParser(Parser):
         if (
             (a := self.term())
             and
-            (literal := self.expect('//'))
+            (literal := self.terminal(KIND_DOUBLESLASH))
             and
             (b := self.factor())
         ):
@@ -3915,7 +5051,7 @@ class ParseltongueParser(Parser):
         if (
             (a := self.term())
             and
-            (literal := self.expect('%'))
+            (literal := self.terminal(KIND_PERCENT))
             and
             (b := self.factor())
         ):
@@ -3926,7 +5062,7 @@ class ParseltongueParser(Parser):
         if (
             (a := self.term())
             and
-            (literal := self.expect('@'))
+            (literal := self.terminal(KIND_AT))
             and
             (b := self.factor())
         ):
@@ -3941,14 +5077,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def factor(self) -> Optional[Any]:
         # factor: '+' factor | '-' factor | '~' factor | power
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_97:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('+'))
+            kind in FIRST_107
+            and
+            (literal := self.terminal(KIND_PLUS))
             and
             (a := self.factor())
         ):
@@ -3957,7 +5097,9 @@ class ParseltongueParser(Parser):
             return ast . UnaryOp ( op = ast . UAdd ( ) , operand = a , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('-'))
+            kind in FIRST_89
+            and
+            (literal := self.terminal(KIND_MINUS))
             and
             (a := self.factor())
         ):
@@ -3966,7 +5108,9 @@ class ParseltongueParser(Parser):
             return ast . UnaryOp ( op = ast . USub ( ) , operand = a , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('~'))
+            kind in FIRST_108
+            and
+            (literal := self.terminal(KIND_TILDE))
             and
             (a := self.factor())
         ):
@@ -3975,22 +5119,26 @@ class ParseltongueParser(Parser):
             return ast . UnaryOp ( op = ast . Invert ( ) , operand = a , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_109
+            and
             (power := self.power())
         ):
             return power
         self._reset(mark)
         return None
 
-    @memoize
     def power(self) -> Optional[Any]:
         # power: await_primary '**' factor | await_primary
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_109:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.await_primary())
             and
-            (literal := self.expect('**'))
+            (literal := self.terminal(KIND_DOUBLESTAR))
             and
             (b := self.factor())
         ):
@@ -4005,14 +5153,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def await_primary(self) -> Optional[Any]:
         # await_primary: 'await' primary | primary
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_109:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('await'))
+            kind in FIRST_110
+            and
+            (literal := self.terminal(KIND_await))
             and
             (a := self.primary())
         ):
@@ -4021,6 +5173,8 @@ class ParseltongueParser(Parser):
             return self . check_version ( ( 3 , 5 ) , "Await expressions are" , ast . Await ( a , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset ) )
         self._reset(mark)
         if (
+            kind in FIRST_34
+            and
             (primary := self.primary())
         ):
             return primary
@@ -4031,12 +5185,15 @@ class ParseltongueParser(Parser):
     def primary(self) -> Optional[Any]:
         # primary: primary '.' NAME | primary genexp | primary '(' arguments? ')' | primary '[' slices ']' | atom
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_34:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.primary())
             and
-            (literal := self.expect('.'))
+            (literal := self.terminal(KIND_DOT))
             and
             (b := self.name())
         ):
@@ -4056,11 +5213,11 @@ class ParseltongueParser(Parser):
         if (
             (a := self.primary())
             and
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (b := self.arguments(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -4069,11 +5226,11 @@ class ParseltongueParser(Parser):
         if (
             (a := self.primary())
             and
-            (literal := self.expect('['))
+            (literal := self.terminal(KIND_LSQB))
             and
             (b := self.slices())
             and
-            (literal_1 := self.expect(']'))
+            (literal_1 := self.terminal(KIND_RSQB))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -4090,19 +5247,22 @@ class ParseltongueParser(Parser):
     def slices(self) -> Optional[Any]:
         # slices: slice !',' | ','.slice+ ','?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_111:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.slice())
             and
-            self.negative_lookahead(self.expect, ',')
+            self.negative_lookahead(self.terminal, KIND_COMMA)
         ):
             return a
         self._reset(mark)
         if (
-            (a := self._gather_91())
+            (a := self._gather_92())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -4110,26 +5270,30 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def slice(self) -> Optional[Any]:
         # slice: expression? ':' expression? [':' expression?] | named_expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_111:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.expression(),)
             and
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
             (b := self.expression(),)
             and
-            (c := self._tmp_93(),)
+            (c := self._tmp_94(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Slice ( lower = a , upper = b , step = c , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (a := self.named_expression())
         ):
             return a if sys . version_info >= ( 3 , 9 ) or isinstance ( a , ast . Slice ) else ast . Index ( value = a , lineno = a . lineno , col_offset = a . col_offset , end_lineno = a . end_lineno , end_col_offset = a . end_col_offset )
@@ -4140,9 +5304,14 @@ class ParseltongueParser(Parser):
     def atom(self) -> Optional[Any]:
         # atom: NAME | 'True' | 'False' | 'None' | &STRING strings | NUMBER | &'(' (tuple | group | genexp) | &'[' (list | listcomp) | &'{' (dict | set | dictcomp | setcomp) | '...'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_34:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            kind in FIRST_33
+            and
             (a := self.name())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
@@ -4150,63 +5319,81 @@ class ParseltongueParser(Parser):
             return ast . Name ( id = a . string , ctx = Load , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('True'))
+            kind in FIRST_86
+            and
+            (literal := self.terminal(KIND_True))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Constant ( value = True , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset ) if sys . version_info >= ( 3 , 9 ) else ast . Constant ( value = True , kind = None , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('False'))
+            kind in FIRST_87
+            and
+            (literal := self.terminal(KIND_False))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Constant ( value = False , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset ) if sys . version_info >= ( 3 , 9 ) else ast . Constant ( value = False , kind = None , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('None'))
+            kind in FIRST_85
+            and
+            (literal := self.terminal(KIND_None))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Constant ( value = None , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset ) if sys . version_info >= ( 3 , 9 ) else ast . Constant ( value = None , kind = None , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            self.positive_lookahead(self.string, )
+            kind in FIRST_84
+            and
+            self.positive_lookahead(self.terminal, tokenize.STRING)
             and
             (strings := self.strings())
         ):
             return strings
         self._reset(mark)
         if (
-            (a := self.number())
+            kind in FIRST_88
+            and
+            (a := self.terminal(tokenize.NUMBER))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Constant ( value = ast . literal_eval ( a . string ) , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset ) if sys . version_info >= ( 3 , 9 ) else ast . Constant ( value = ast . literal_eval ( a . string ) , kind = None , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, '(')
+            kind in FIRST_112
             and
-            (_tmp_94 := self._tmp_94())
+            self.positive_lookahead(self.terminal, KIND_LPAR)
+            and
+            (_tmp_95 := self._tmp_95())
         ):
-            return _tmp_94
+            return _tmp_95
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, '[')
+            kind in FIRST_112
             and
-            (_tmp_95 := self._tmp_95())
+            self.positive_lookahead(self.terminal, KIND_LSQB)
+            and
+            (_tmp_96 := self._tmp_96())
         ):
-            return _tmp_95
+            return _tmp_96
         self._reset(mark)
         if (
-            self.positive_lookahead(self.expect, '{')
+            kind in FIRST_112
             and
-            (_tmp_96 := self._tmp_96())
+            self.positive_lookahead(self.terminal, KIND_LBRACE)
+            and
+            (_tmp_97 := self._tmp_97())
         ):
-            return _tmp_96
+            return _tmp_97
         self._reset(mark)
         if (
-            (literal := self.expect('...'))
+            kind in FIRST_113
+            and
+            (literal := self.terminal(KIND_ELLIPSIS))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -4214,57 +5401,63 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def group(self) -> Optional[Any]:
         # group: '(' NEWLINE INDENT (yield_expr | named_expression) NEWLINE DEDENT ')' | '(' !NEWLINE (yield_expr | named_expression) ')' | invalid_group
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_3:
+            return None
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
-            (a := self._tmp_97())
+            (a := self._tmp_98())
             and
-            (_newline_1 := self.expect('NEWLINE'))
+            (_newline_1 := self.terminal(tokenize.NEWLINE))
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return a
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
-            self.negative_lookahead(self.expect, 'NEWLINE')
+            self.negative_lookahead(self.terminal, tokenize.NEWLINE)
             and
-            (a := self._tmp_98())
+            (a := self._tmp_99())
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return a
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_group := self.invalid_group())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def lambdef(self) -> Optional[Any]:
         # lambdef: 'lambda' lambda_params? ':' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_93:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('lambda'))
+            (literal := self.terminal(KIND_lambda))
             and
             (a := self.lambda_params(),)
             and
-            (literal_1 := self.expect(':'))
+            (literal_1 := self.terminal(KIND_COLON))
             and
             (b := self.expression())
         ):
@@ -4274,11 +5467,17 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def lambda_params(self) -> Optional[Any]:
         # lambda_params: invalid_lambda_parameters | lambda_parameters
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_66:
+            return None
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_33
+            and
             (invalid_lambda_parameters := self.invalid_lambda_parameters())
         ):
             return None  # pragma: no cover
@@ -4290,149 +5489,179 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def lambda_parameters(self) -> Optional[ast . arguments]:
         # lambda_parameters: lambda_slash_no_default lambda_param_no_default* lambda_param_with_default* lambda_star_etc? | lambda_slash_with_default lambda_param_with_default* lambda_star_etc? | lambda_param_no_default+ lambda_param_with_default* lambda_star_etc? | lambda_param_with_default+ lambda_star_etc? | lambda_star_etc
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_66:
+            return None
         if (
+            kind in FIRST_33
+            and
             (a := self.lambda_slash_no_default())
             and
-            (b := self._loop0_99(),)
+            (b := self._loop0_100(),)
             and
-            (c := self._loop0_100(),)
+            (c := self._loop0_101(),)
             and
             (d := self.lambda_star_etc(),)
         ):
             return self . make_arguments ( a , [] , b , c , d )
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (a := self.lambda_slash_with_default())
             and
-            (b := self._loop0_101(),)
+            (b := self._loop0_102(),)
             and
             (c := self.lambda_star_etc(),)
         ):
             return self . make_arguments ( None , a , None , b , c )
         self._reset(mark)
         if (
-            (a := self._loop1_102())
+            kind in FIRST_33
+            and
+            (a := self._loop1_103())
             and
-            (b := self._loop0_103(),)
+            (b := self._loop0_104(),)
             and
             (c := self.lambda_star_etc(),)
         ):
             return self . make_arguments ( None , [] , a , b , c )
         self._reset(mark)
         if (
-            (a := self._loop1_104())
+            kind in FIRST_33
+            and
+            (a := self._loop1_105())
             and
             (b := self.lambda_star_etc(),)
         ):
             return self . make_arguments ( None , [] , None , a , b )
         self._reset(mark)
         if (
+            kind in FIRST_67
+            and
             (a := self.lambda_star_etc())
         ):
             return self . make_arguments ( None , [] , None , [] , a )
         self._reset(mark)
         return None
 
-    @memoize
     def lambda_slash_no_default(self) -> Optional[List [Tuple [ast . arg , None]]]:
         # lambda_slash_no_default: lambda_param_no_default+ '/' ',' | lambda_param_no_default+ '/' &':'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
-            (a := self._loop1_105())
+            (a := self._loop1_106())
             and
-            (literal := self.expect('/'))
+            (literal := self.terminal(KIND_SLASH))
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
         ):
             return [( p , None ) for p in a]
         self._reset(mark)
         if (
-            (a := self._loop1_106())
+            (a := self._loop1_107())
             and
-            (literal := self.expect('/'))
+            (literal := self.terminal(KIND_SLASH))
             and
-            self.positive_lookahead(self.expect, ':')
+            self.positive_lookahead(self.terminal, KIND_COLON)
         ):
             return [( p , None ) for p in a]
         self._reset(mark)
         return None
 
-    @memoize
     def lambda_slash_with_default(self) -> Optional[List [Tuple [ast . arg , Any]]]:
         # lambda_slash_with_default: lambda_param_no_default* lambda_param_with_default+ '/' ',' | lambda_param_no_default* lambda_param_with_default+ '/' &':'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
-            (a := self._loop0_107(),)
+            (a := self._loop0_108(),)
             and
-            (b := self._loop1_108())
+            (b := self._loop1_109())
             and
-            (literal := self.expect('/'))
+            (literal := self.terminal(KIND_SLASH))
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
         ):
             return ( [( p , None ) for p in a] if a else [] ) + b
         self._reset(mark)
         if (
-            (a := self._loop0_109(),)
+            (a := self._loop0_110(),)
             and
-            (b := self._loop1_110())
+            (b := self._loop1_111())
             and
-            (literal := self.expect('/'))
+            (literal := self.terminal(KIND_SLASH))
             and
-            self.positive_lookahead(self.expect, ':')
+            self.positive_lookahead(self.terminal, KIND_COLON)
         ):
             return ( [( p , None ) for p in a] if a else [] ) + b
         self._reset(mark)
         return None
 
-    @memoize
     def lambda_star_etc(self) -> Optional[Tuple [Optional [ast . arg] , List [Tuple [ast . arg , Any]] , Optional [ast . arg]]]:
         # lambda_star_etc: '*' lambda_param_no_default lambda_param_maybe_default* lambda_kwds? | '*' ',' lambda_param_maybe_default+ lambda_kwds? | lambda_kwds | invalid_lambda_star_etc
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_67:
+            return None
         if (
-            (literal := self.expect('*'))
+            kind in FIRST_53
+            and
+            (literal := self.terminal(KIND_STAR))
             and
             (a := self.lambda_param_no_default())
             and
-            (b := self._loop0_111(),)
+            (b := self._loop0_112(),)
             and
             (c := self.lambda_kwds(),)
         ):
             return ( a , b , c )
         self._reset(mark)
         if (
-            (literal := self.expect('*'))
+            kind in FIRST_53
+            and
+            (literal := self.terminal(KIND_STAR))
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
             and
-            (b := self._loop1_112())
+            (b := self._loop1_113())
             and
             (c := self.lambda_kwds(),)
         ):
             return ( None , b , c )
         self._reset(mark)
         if (
+            kind in FIRST_68
+            and
             (a := self.lambda_kwds())
         ):
             return ( None , [] , a )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_53
+            and
             (invalid_lambda_star_etc := self.invalid_lambda_star_etc())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def lambda_kwds(self) -> Optional[ast . arg]:
         # lambda_kwds: '**' lambda_param_no_default
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_68:
+            return None
         if (
-            (literal := self.expect('**'))
+            (literal := self.terminal(KIND_DOUBLESTAR))
             and
             (a := self.lambda_param_no_default())
         ):
@@ -4444,17 +5673,20 @@ class ParseltongueParser(Parser):
     def lambda_param_no_default(self) -> Optional[ast . arg]:
         # lambda_param_no_default: lambda_param ',' | lambda_param &':'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (a := self.lambda_param())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
         ):
             return a
         self._reset(mark)
         if (
             (a := self.lambda_param())
             and
-            self.positive_lookahead(self.expect, ':')
+            self.positive_lookahead(self.terminal, KIND_COLON)
         ):
             return a
         self._reset(mark)
@@ -4464,12 +5696,15 @@ class ParseltongueParser(Parser):
     def lambda_param_with_default(self) -> Optional[Tuple [ast . arg , Any]]:
         # lambda_param_with_default: lambda_param default ',' | lambda_param default &':'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (a := self.lambda_param())
             and
             (c := self.default())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
         ):
             return ( a , c )
         self._reset(mark)
@@ -4478,22 +5713,24 @@ class ParseltongueParser(Parser):
             and
             (c := self.default())
             and
-            self.positive_lookahead(self.expect, ':')
+            self.positive_lookahead(self.terminal, KIND_COLON)
         ):
             return ( a , c )
         self._reset(mark)
         return None
 
-    @memoize
     def lambda_param_maybe_default(self) -> Optional[Tuple [ast . arg , Any]]:
         # lambda_param_maybe_default: lambda_param default? ',' | lambda_param default? &':'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (a := self.lambda_param())
             and
             (c := self.default(),)
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
         ):
             return ( a , c )
         self._reset(mark)
@@ -4502,7 +5739,7 @@ class ParseltongueParser(Parser):
             and
             (c := self.default(),)
             and
-            self.positive_lookahead(self.expect, ':')
+            self.positive_lookahead(self.terminal, KIND_COLON)
         ):
             return ( a , c )
         self._reset(mark)
@@ -4512,6 +5749,9 @@ class ParseltongueParser(Parser):
     def lambda_param(self) -> Optional[ast . arg]:
         # lambda_param: NAME
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
@@ -4523,31 +5763,35 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def strings(self) -> Optional[ast . Str]:
         # strings: STRING+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_84:
+            return None
         if (
-            (a := self._loop1_113())
+            (a := self._loop1_114())
         ):
             return self . generate_ast_for_string ( a )
         self._reset(mark)
         return None
 
-    @memoize
     def list(self) -> Optional[ast . List]:
         # list: '[' NEWLINE? star_named_expressions? ']'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_90:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('['))
+            (literal := self.terminal(KIND_LSQB))
             and
-            (opt := self.expect('NEWLINE'),)
+            (opt := self.terminal(tokenize.NEWLINE),)
             and
             (a := self.star_named_expressions(),)
             and
-            (literal_1 := self.expect(']'))
+            (literal_1 := self.terminal(KIND_RSQB))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -4555,20 +5799,22 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def tuple(self) -> Optional[ast . Tuple]:
         # tuple: '(' NEWLINE? star_named_expressions_with_separator? ')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_3:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
-            (opt := self.expect('NEWLINE'),)
+            (opt := self.terminal(tokenize.NEWLINE),)
             and
             (a := self.star_named_expressions_with_separator(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -4576,20 +5822,22 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def set(self) -> Optional[ast . Set]:
         # set: '{' NEWLINE? star_named_expressions '}'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_82:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('{'))
+            (literal := self.terminal(KIND_LBRACE))
             and
-            (opt := self.expect('NEWLINE'),)
+            (opt := self.terminal(tokenize.NEWLINE),)
             and
             (a := self.star_named_expressions())
             and
-            (literal_1 := self.expect('}'))
+            (literal_1 := self.terminal(KIND_RBRACE))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -4597,88 +5845,106 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def dict(self) -> Optional[ast . Dict]:
         # dict: '{' double_starred_kvpairs? '}' | '{' invalid_double_starred_kvpairs '}'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_82:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('{'))
+            (literal := self.terminal(KIND_LBRACE))
             and
             (a := self.double_starred_kvpairs(),)
             and
-            (literal_1 := self.expect('}'))
+            (literal_1 := self.terminal(KIND_RBRACE))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Dict ( keys = [kv [0] for kv in ( a or [] )] , values = [kv [1] for kv in ( a or [] )] , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('{'))
+            self.call_invalid_rules
+            and
+            (literal := self.terminal(KIND_LBRACE))
             and
             (invalid_double_starred_kvpairs := self.invalid_double_starred_kvpairs())
             and
-            (literal_1 := self.expect('}'))
+            (literal_1 := self.terminal(KIND_RBRACE))
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def double_starred_kvpairs(self) -> Optional[list]:
         # double_starred_kvpairs: separator.double_starred_kvpair+ extra_separator [INDENT double_starred_kvpairs DEDENT] | NEWLINE INDENT separator.double_starred_kvpair+ extra_separator DEDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_114:
+            return None
         if (
-            (a := self._gather_114())
+            kind in FIRST_115
+            and
+            (a := self._gather_115())
             and
             (extra_separator := self.extra_separator())
             and
-            (b := self._tmp_116(),)
+            (b := self._tmp_117(),)
         ):
             return a + ( b or [] )
         self._reset(mark)
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
             and
-            (_indent := self.expect('INDENT'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            (a := self._gather_117())
+            (_indent := self.terminal(tokenize.INDENT))
+            and
+            (a := self._gather_118())
             and
             (extra_separator := self.extra_separator())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def double_starred_kvpair(self) -> Optional[Any]:
         # double_starred_kvpair: '**' bitwise_or | kvpair
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_115:
+            return None
         if (
-            (literal := self.expect('**'))
+            kind in FIRST_68
+            and
+            (literal := self.terminal(KIND_DOUBLESTAR))
             and
             (a := self.bitwise_or())
         ):
             return ( None , a )
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (kvpair := self.kvpair())
         ):
             return kvpair
         self._reset(mark)
         return None
 
-    @memoize
     def kvpair(self) -> Optional[tuple]:
         # kvpair: expression ':' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
             (a := self.expression())
             and
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
             (b := self.expression())
         ):
@@ -4686,110 +5952,132 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def for_if_clauses(self) -> Optional[List [ast . comprehension]]:
         # for_if_clauses: for_if_clause+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_27:
+            return None
         if (
-            (a := self._loop1_119())
+            (a := self._loop1_120())
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def for_if_clause(self) -> Optional[ast . comprehension]:
         # for_if_clause: 'async' 'for' star_targets 'in' ~ disjunction (('if' disjunction))* | 'for' star_targets 'in' ~ disjunction (('if' disjunction))* | invalid_for_target
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_27:
+            return None
         cut = False
         if (
-            (literal := self.expect('async'))
+            kind in FIRST_65
+            and
+            (literal := self.terminal(KIND_async))
             and
-            (literal_1 := self.expect('for'))
+            (literal_1 := self.terminal(KIND_for))
             and
             (a := self.star_targets())
             and
-            (literal_2 := self.expect('in'))
+            (literal_2 := self.terminal(KIND_in))
             and
             (cut := True)
             and
             (b := self.disjunction())
             and
-            (c := self._loop0_120(),)
+            (c := self._loop0_121(),)
         ):
             return self . check_version ( ( 3 , 6 ) , "Async comprehensions are" , ast . comprehension ( target = a , iter = b , ifs = c , is_async = 1 ) )
         self._reset(mark)
         if cut: return None
         cut = False
         if (
-            (literal := self.expect('for'))
+            kind in FIRST_72
+            and
+            (literal := self.terminal(KIND_for))
             and
             (a := self.star_targets())
             and
-            (literal_1 := self.expect('in'))
+            (literal_1 := self.terminal(KIND_in))
             and
             (cut := True)
             and
             (b := self.disjunction())
             and
-            (c := self._loop0_121(),)
+            (c := self._loop0_122(),)
         ):
             return ast . comprehension ( target = a , iter = b , ifs = c , is_async = 0 )
         self._reset(mark)
         if cut: return None
         if (
+            self.call_invalid_rules
+            and
             (invalid_for_target := self.invalid_for_target())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def listcomp(self) -> Optional[ast . ListComp]:
         # listcomp: '[' named_expression for_if_clauses ']' | invalid_comprehension
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_112:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('['))
+            kind in FIRST_90
+            and
+            (literal := self.terminal(KIND_LSQB))
             and
             (a := self.named_expression())
             and
             (b := self.for_if_clauses())
             and
-            (literal_1 := self.expect(']'))
+            (literal_1 := self.terminal(KIND_RSQB))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . ListComp ( elt = a , generators = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_comprehension := self.invalid_comprehension())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def setcomp(self) -> Optional[ast . SetComp]:
         # setcomp: '{' named_expression for_if_clauses '}' | invalid_comprehension
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_112:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('{'))
+            kind in FIRST_82
+            and
+            (literal := self.terminal(KIND_LBRACE))
             and
             (a := self.named_expression())
             and
             (b := self.for_if_clauses())
             and
-            (literal_1 := self.expect('}'))
+            (literal_1 := self.terminal(KIND_RBRACE))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . SetComp ( elt = a , generators = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_comprehension := self.invalid_comprehension())
         ):
             return None  # pragma: no cover
@@ -4800,48 +6088,59 @@ class ParseltongueParser(Parser):
     def genexp(self) -> Optional[ast . GeneratorExp]:
         # genexp: '(' (assignment_expression | expression !':=') for_if_clauses ')' | invalid_comprehension
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_112:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
             and
-            (a := self._tmp_122())
+            (a := self._tmp_123())
             and
             (b := self.for_if_clauses())
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . GeneratorExp ( elt = a , generators = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_comprehension := self.invalid_comprehension())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def dictcomp(self) -> Optional[ast . DictComp]:
         # dictcomp: '{' kvpair for_if_clauses '}' | invalid_dict_comprehension
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_82:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('{'))
+            (literal := self.terminal(KIND_LBRACE))
             and
             (a := self.kvpair())
             and
             (b := self.for_if_clauses())
             and
-            (literal_1 := self.expect('}'))
+            (literal_1 := self.terminal(KIND_RBRACE))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . DictComp ( key = a [0] , value = a [1] , generators = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
             (invalid_dict_comprehension := self.invalid_dict_comprehension())
         ):
             return None  # pragma: no cover
@@ -4852,49 +6151,62 @@ class ParseltongueParser(Parser):
     def arguments(self) -> Optional[Tuple [list , list]]:
         # arguments: NEWLINE? args extra_separator [INDENT args extra_separator DEDENT] &')' | NEWLINE INDENT args extra_separator DEDENT &')' | invalid_arguments
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_116:
+            return None
         if (
-            (opt := self.expect('NEWLINE'),)
+            (opt := self.terminal(tokenize.NEWLINE),)
             and
             (a := self.args())
             and
             (extra_separator := self.extra_separator())
             and
-            (b := self._tmp_123(),)
+            (b := self._tmp_124(),)
             and
-            self.positive_lookahead(self.expect, ')')
+            self.positive_lookahead(self.terminal, KIND_RPAR)
         ):
             return a if b is None else ( a [0] + b [0] , a [1] + b [1] )
         self._reset(mark)
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
+            and
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (a := self.args())
             and
             (extra_separator := self.extra_separator())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
             and
-            self.positive_lookahead(self.expect, ')')
+            self.positive_lookahead(self.terminal, KIND_RPAR)
         ):
             return a
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_117
+            and
             (invalid_arguments := self.invalid_arguments())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         return None
 
-    @memoize
     def args(self) -> Optional[Tuple [list , list]]:
         # args: separator.(starred_expression | (assignment_expression | expression !':=') !'=')+ [separator kwargs] | kwargs
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_117:
+            return None
         if (
-            (a := self._gather_124())
+            kind in FIRST_4
             and
-            (b := self._tmp_126(),)
+            (a := self._gather_125())
+            and
+            (b := self._tmp_127(),)
         ):
             return ( a + ( [e for e in b if isinstance ( e , ast . Starred )] if b else [] ) , ( [e for e in b if not isinstance ( e , ast . Starred )] if b else [] ) )
         self._reset(mark)
@@ -4905,39 +6217,49 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def kwargs(self) -> Optional[list]:
         # kwargs: separator.kwarg_or_starred+ separator ','.kwarg_or_double_starred+ | separator.kwarg_or_starred+ | separator.kwarg_or_double_starred+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_117:
+            return None
         if (
-            (a := self._gather_127())
+            kind in FIRST_4
+            and
+            (a := self._gather_128())
             and
             (separator := self.separator())
             and
-            (b := self._gather_129())
+            (b := self._gather_130())
         ):
             return a + b
         self._reset(mark)
         if (
-            (_gather_131 := self._gather_131())
+            kind in FIRST_4
+            and
+            (_gather_132 := self._gather_132())
         ):
-            return _gather_131
+            return _gather_132
         self._reset(mark)
         if (
-            (_gather_133 := self._gather_133())
+            kind in FIRST_115
+            and
+            (_gather_134 := self._gather_134())
         ):
-            return _gather_133
+            return _gather_134
         self._reset(mark)
         return None
 
-    @memoize
     def starred_expression(self) -> Optional[Any]:
         # starred_expression: '*' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_53:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('*'))
+            (literal := self.terminal(KIND_STAR))
             and
             (a := self.expression())
         ):
@@ -4951,17 +6273,26 @@ class ParseltongueParser(Parser):
     def kwarg_or_starred(self) -> Optional[Any]:
         # kwarg_or_starred: invalid_kwarg | NAME '=' expression | starred_expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_4:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_2
+            and
             (invalid_kwarg := self.invalid_kwarg())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (a := self.name())
             and
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
             and
             (b := self.expression())
         ):
@@ -4970,27 +6301,37 @@ class ParseltongueParser(Parser):
             return ast . keyword ( arg = a . string , value = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_53
+            and
             (a := self.starred_expression())
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def kwarg_or_double_starred(self) -> Optional[Any]:
         # kwarg_or_double_starred: invalid_kwarg | NAME '=' expression | '**' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_115:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_2
+            and
             (invalid_kwarg := self.invalid_kwarg())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (a := self.name())
             and
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
             and
             (b := self.expression())
         ):
@@ -4999,7 +6340,9 @@ class ParseltongueParser(Parser):
             return ast . keyword ( arg = a . string , value = b , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('**'))
+            kind in FIRST_68
+            and
+            (literal := self.terminal(KIND_DOUBLESTAR))
             and
             (a := self.expression())
         ):
@@ -5009,25 +6352,27 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def star_targets(self) -> Optional[Any]:
         # star_targets: star_target !',' | star_target ((',' star_target))* ','?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_35:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.star_target())
             and
-            self.negative_lookahead(self.expect, ',')
+            self.negative_lookahead(self.terminal, KIND_COMMA)
         ):
             return a
         self._reset(mark)
         if (
             (a := self.star_target())
             and
-            (b := self._loop0_135(),)
+            (b := self._loop0_136(),)
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -5035,36 +6380,40 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def star_targets_list_seq(self) -> Optional[list]:
         # star_targets_list_seq: ','.star_target+ ','?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_35:
+            return None
         if (
-            (a := self._gather_136())
+            (a := self._gather_137())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def star_targets_tuple_seq(self) -> Optional[list]:
         # star_targets_tuple_seq: star_target ((',' star_target))+ ','? | star_target ','
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_35:
+            return None
         if (
             (a := self.star_target())
             and
-            (b := self._loop1_138())
+            (b := self._loop1_139())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
         ):
             return [a] + b
         self._reset(mark)
         if (
             (a := self.star_target())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
         ):
             return [a]
         self._reset(mark)
@@ -5074,34 +6423,43 @@ class ParseltongueParser(Parser):
     def star_target(self) -> Optional[Any]:
         # star_target: '*' (!'*' star_target) | target_with_star_atom
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_35:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (literal := self.expect('*'))
+            kind in FIRST_53
             and
-            (a := self._tmp_139())
+            (literal := self.terminal(KIND_STAR))
+            and
+            (a := self._tmp_140())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Starred ( value = self . set_expr_context ( a , Store ) , ctx = Store , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_34
+            and
             (target_with_star_atom := self.target_with_star_atom())
         ):
             return target_with_star_atom
         self._reset(mark)
         return None
 
-    @memoize
     def target_with_star_atom(self) -> Optional[Any]:
         # target_with_star_atom: t_primary '.' NAME !t_lookahead | t_primary '[' slices ']' !t_lookahead | star_atom
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_34:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.t_primary())
             and
-            (literal := self.expect('.'))
+            (literal := self.terminal(KIND_DOT))
             and
             (b := self.name())
             and
@@ -5114,11 +6472,11 @@ class ParseltongueParser(Parser):
         if (
             (a := self.t_primary())
             and
-            (literal := self.expect('['))
+            (literal := self.terminal(KIND_LSQB))
             and
             (b := self.slices())
             and
-            (literal_1 := self.expect(']'))
+            (literal_1 := self.terminal(KIND_RSQB))
             and
             self.negative_lookahead(self.t_lookahead, )
         ):
@@ -5127,19 +6485,25 @@ class ParseltongueParser(Parser):
             return ast . Subscript ( value = a , slice = b , ctx = Store , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_118
+            and
             (star_atom := self.star_atom())
         ):
             return star_atom
         self._reset(mark)
         return None
 
-    @memoize
     def star_atom(self) -> Optional[Any]:
         # star_atom: NAME | '(' target_with_star_atom ')' | '(' star_targets_tuple_seq? ')' | '[' star_targets_list_seq? ']'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_118:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            kind in FIRST_33
+            and
             (a := self.name())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
@@ -5147,31 +6511,37 @@ class ParseltongueParser(Parser):
             return ast . Name ( id = a . string , ctx = Store , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
             and
             (a := self.target_with_star_atom())
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return self . set_expr_context ( a , Store )
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
             and
             (a := self.star_targets_tuple_seq(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Tuple ( elts = a , ctx = Store , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('['))
+            kind in FIRST_90
+            and
+            (literal := self.terminal(KIND_LSQB))
             and
             (a := self.star_targets_list_seq(),)
             and
-            (literal_1 := self.expect(']'))
+            (literal_1 := self.terminal(KIND_RSQB))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -5179,10 +6549,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def single_target(self) -> Optional[Any]:
         # single_target: single_subscript_attribute_target | NAME | '(' single_target ')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_34:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
@@ -5191,6 +6563,8 @@ class ParseltongueParser(Parser):
             return single_subscript_attribute_target
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (a := self.name())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
@@ -5198,11 +6572,13 @@ class ParseltongueParser(Parser):
             return ast . Name ( id = a . string , ctx = Store , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
             and
             (a := self.single_target())
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return a
         self._reset(mark)
@@ -5212,12 +6588,15 @@ class ParseltongueParser(Parser):
     def single_subscript_attribute_target(self) -> Optional[Any]:
         # single_subscript_attribute_target: t_primary '.' NAME !t_lookahead | t_primary '[' slices ']' !t_lookahead
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_34:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.t_primary())
             and
-            (literal := self.expect('.'))
+            (literal := self.terminal(KIND_DOT))
             and
             (b := self.name())
             and
@@ -5230,11 +6609,11 @@ class ParseltongueParser(Parser):
         if (
             (a := self.t_primary())
             and
-            (literal := self.expect('['))
+            (literal := self.terminal(KIND_LSQB))
             and
             (b := self.slices())
             and
-            (literal_1 := self.expect(']'))
+            (literal_1 := self.terminal(KIND_RSQB))
             and
             self.negative_lookahead(self.t_lookahead, )
         ):
@@ -5248,12 +6627,15 @@ class ParseltongueParser(Parser):
     def t_primary(self) -> Optional[Any]:
         # t_primary: t_primary '.' NAME &t_lookahead | t_primary '[' slices ']' &t_lookahead | t_primary genexp &t_lookahead | t_primary '(' arguments? ')' &t_lookahead | atom &t_lookahead
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_34:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.t_primary())
             and
-            (literal := self.expect('.'))
+            (literal := self.terminal(KIND_DOT))
             and
             (b := self.name())
             and
@@ -5266,11 +6648,11 @@ class ParseltongueParser(Parser):
         if (
             (a := self.t_primary())
             and
-            (literal := self.expect('['))
+            (literal := self.terminal(KIND_LSQB))
             and
             (b := self.slices())
             and
-            (literal_1 := self.expect(']'))
+            (literal_1 := self.terminal(KIND_RSQB))
             and
             self.positive_lookahead(self.t_lookahead, )
         ):
@@ -5292,11 +6674,11 @@ class ParseltongueParser(Parser):
         if (
             (a := self.t_primary())
             and
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (b := self.arguments(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
             and
             self.positive_lookahead(self.t_lookahead, )
         ):
@@ -5317,46 +6699,59 @@ class ParseltongueParser(Parser):
     def t_lookahead(self) -> Optional[Any]:
         # t_lookahead: '(' | '[' | '.'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_119:
+            return None
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('['))
+            kind in FIRST_90
+            and
+            (literal := self.terminal(KIND_LSQB))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('.'))
+            kind in FIRST_120
+            and
+            (literal := self.terminal(KIND_DOT))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
     def del_targets(self) -> Optional[Any]:
         # del_targets: ','.del_target+ ','?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_34:
+            return None
         if (
-            (a := self._gather_140())
+            (a := self._gather_141())
             and
-            (opt := self.expect(','),)
+            (opt := self.terminal(KIND_COMMA),)
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def del_target(self) -> Optional[Any]:
         # del_target: t_primary '.' NAME !t_lookahead | t_primary '[' slices ']' !t_lookahead | del_t_atom
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_34:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (a := self.t_primary())
             and
-            (literal := self.expect('.'))
+            (literal := self.terminal(KIND_DOT))
             and
             (b := self.name())
             and
@@ -5369,11 +6764,11 @@ class ParseltongueParser(Parser):
         if (
             (a := self.t_primary())
             and
-            (literal := self.expect('['))
+            (literal := self.terminal(KIND_LSQB))
             and
             (b := self.slices())
             and
-            (literal_1 := self.expect(']'))
+            (literal_1 := self.terminal(KIND_RSQB))
             and
             self.negative_lookahead(self.t_lookahead, )
         ):
@@ -5382,19 +6777,25 @@ class ParseltongueParser(Parser):
             return ast . Subscript ( value = a , slice = b , ctx = Del , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_118
+            and
             (del_t_atom := self.del_t_atom())
         ):
             return del_t_atom
         self._reset(mark)
         return None
 
-    @memoize
     def del_t_atom(self) -> Optional[Any]:
         # del_t_atom: NAME | '(' del_target ')' | '(' del_targets? ')' | '[' del_targets? ']'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_118:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            kind in FIRST_33
+            and
             (a := self.name())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
@@ -5402,31 +6803,37 @@ class ParseltongueParser(Parser):
             return ast . Name ( id = a . string , ctx = Del , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
             and
             (a := self.del_target())
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return self . set_expr_context ( a , Del )
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
             and
             (a := self.del_targets(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return ast . Tuple ( elts = a , ctx = Del , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
-            (literal := self.expect('['))
+            kind in FIRST_90
+            and
+            (literal := self.terminal(KIND_LSQB))
             and
             (a := self.del_targets(),)
             and
-            (literal_1 := self.expect(']'))
+            (literal_1 := self.terminal(KIND_RSQB))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -5434,136 +6841,168 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def type_expressions(self) -> Optional[list]:
         # type_expressions: ','.expression+ ',' '*' expression ',' '**' expression | ','.expression+ ',' '*' expression | ','.expression+ ',' '**' expression | '*' expression ',' '**' expression | '*' expression | '**' expression | ','.expression+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_117:
+            return None
         if (
-            (a := self._gather_142())
+            kind in FIRST_2
             and
-            (literal := self.expect(','))
+            (a := self._gather_143())
             and
-            (literal_1 := self.expect('*'))
+            (literal := self.terminal(KIND_COMMA))
+            and
+            (literal_1 := self.terminal(KIND_STAR))
             and
             (b := self.expression())
             and
-            (literal_2 := self.expect(','))
+            (literal_2 := self.terminal(KIND_COMMA))
             and
-            (literal_3 := self.expect('**'))
+            (literal_3 := self.terminal(KIND_DOUBLESTAR))
             and
             (c := self.expression())
         ):
             return a + [b , c]
         self._reset(mark)
         if (
-            (a := self._gather_144())
+            kind in FIRST_2
+            and
+            (a := self._gather_145())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
-            (literal_1 := self.expect('*'))
+            (literal_1 := self.terminal(KIND_STAR))
             and
             (b := self.expression())
         ):
             return a + [b]
         self._reset(mark)
         if (
-            (a := self._gather_146())
+            kind in FIRST_2
             and
-            (literal := self.expect(','))
+            (a := self._gather_147())
             and
-            (literal_1 := self.expect('**'))
+            (literal := self.terminal(KIND_COMMA))
+            and
+            (literal_1 := self.terminal(KIND_DOUBLESTAR))
             and
             (b := self.expression())
         ):
             return a + [b]
         self._reset(mark)
         if (
-            (literal := self.expect('*'))
+            kind in FIRST_53
+            and
+            (literal := self.terminal(KIND_STAR))
             and
             (a := self.expression())
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
             and
-            (literal_2 := self.expect('**'))
+            (literal_2 := self.terminal(KIND_DOUBLESTAR))
             and
             (b := self.expression())
         ):
             return [a , b]
         self._reset(mark)
         if (
-            (literal := self.expect('*'))
+            kind in FIRST_53
+            and
+            (literal := self.terminal(KIND_STAR))
             and
             (a := self.expression())
         ):
             return [a]
         self._reset(mark)
         if (
-            (literal := self.expect('**'))
+            kind in FIRST_68
+            and
+            (literal := self.terminal(KIND_DOUBLESTAR))
             and
             (a := self.expression())
         ):
             return [a]
         self._reset(mark)
         if (
-            (a := self._gather_148())
+            kind in FIRST_2
+            and
+            (a := self._gather_149())
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def func_type_comment(self) -> Optional[Any]:
         # func_type_comment: NEWLINE TYPE_COMMENT &(NEWLINE INDENT) | invalid_double_type_comments | TYPE_COMMENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_59:
+            return None
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
+            and
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
             (t := self.type_comment())
             and
-            self.positive_lookahead(self._tmp_150, )
+            self.positive_lookahead(self._tmp_151, )
         ):
             return t . string
         self._reset(mark)
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_121
+            and
             (invalid_double_type_comments := self.invalid_double_type_comments())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
+            kind in FIRST_121
+            and
             (type_comment := self.type_comment())
         ):
             return type_comment
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_arguments(self) -> Optional[NoReturn]:
         # invalid_arguments: args ',' '*' | expression for_if_clauses ',' [args | expression for_if_clauses] | NAME '=' expression for_if_clauses | args for_if_clauses | args ',' expression for_if_clauses | args ',' args
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_117:
+            return None
         if (
             (a := self.args())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
-            (literal_1 := self.expect('*'))
+            (literal_1 := self.terminal(KIND_STAR))
         ):
             return self . store_syntax_error_known_location ( "iterable argument unpacking follows keyword argument unpacking" , a [1] [- 1] if a [1] else a [0] [- 1] , )
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (a := self.expression())
             and
             (b := self.for_if_clauses())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
-            (opt := self._tmp_151(),)
+            (opt := self._tmp_152(),)
         ):
             return self . store_syntax_error_known_range ( "Generator expression must be parenthesized" , a , b [- 1] . target )
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (a := self.name())
             and
-            (b := self.expect('='))
+            (b := self.terminal(KIND_EQUAL))
             and
             (expression := self.expression())
             and
@@ -5581,7 +7020,7 @@ class ParseltongueParser(Parser):
         if (
             (args := self.args())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (a := self.expression())
             and
@@ -5592,7 +7031,7 @@ class ParseltongueParser(Parser):
         if (
             (a := self.args())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (args := self.args())
         ):
@@ -5600,14 +7039,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_kwarg(self) -> Optional[NoReturn]:
         # invalid_kwarg: NAME '=' expression for_if_clauses | !(NAME '=') expression '='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
+            kind in FIRST_33
+            and
             (a := self.name())
             and
-            (b := self.expect('='))
+            (b := self.terminal(KIND_EQUAL))
             and
             (expression := self.expression())
             and
@@ -5616,30 +7059,34 @@ class ParseltongueParser(Parser):
             return self . store_syntax_error_known_range ( "invalid syntax. Maybe you meant '==' or ':=' instead of '='?" , a , b )
         self._reset(mark)
         if (
-            self.negative_lookahead(self._tmp_152, )
+            self.negative_lookahead(self._tmp_153, )
             and
             (a := self.expression())
             and
-            (b := self.expect('='))
+            (b := self.terminal(KIND_EQUAL))
         ):
             return self . store_syntax_error_known_range ( "expression cannot contain assignment, perhaps you meant \"==\"?" , a , b , )
         self._reset(mark)
         return None
 
-    @memoize
     def expression_without_invalid(self) -> Optional[ast . AST]:
         # expression_without_invalid: disjunction 'if' disjunction 'else' expression | disjunction | lambdef
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
+            kind in FIRST_92
+            and
             (a := self.disjunction())
             and
-            (literal := self.expect('if'))
+            (literal := self.terminal(KIND_if))
             and
             (b := self.disjunction())
             and
-            (literal_1 := self.expect('else'))
+            (literal_1 := self.terminal(KIND_else))
             and
             (c := self.expression())
         ):
@@ -5648,25 +7095,31 @@ class ParseltongueParser(Parser):
             return ast . IfExp ( body = b , test = a , orelse = c , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset )
         self._reset(mark)
         if (
+            kind in FIRST_92
+            and
             (disjunction := self.disjunction())
         ):
             return disjunction
         self._reset(mark)
         if (
+            kind in FIRST_93
+            and
             (lambdef := self.lambdef())
         ):
             return lambdef
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_legacy_expression(self) -> Optional[Any]:
         # invalid_legacy_expression: NAME !'(' expression_without_invalid
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (a := self.name())
             and
-            self.negative_lookahead(self.expect, '(')
+            self.negative_lookahead(self.terminal, KIND_LPAR)
             and
             (b := self.expression_without_invalid())
         ):
@@ -5674,17 +7127,23 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_expression(self) -> Optional[NoReturn]:
         # invalid_expression: invalid_legacy_expression | !(NAME STRING | SOFT_KEYWORD) disjunction expression_without_invalid | disjunction 'if' disjunction !('else' | ':')
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_92:
+            return None
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_33
+            and
             (invalid_legacy_expression := self.invalid_legacy_expression())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            self.negative_lookahead(self._tmp_153, )
+            self.negative_lookahead(self._tmp_154, )
             and
             (a := self.disjunction())
             and
@@ -5695,150 +7154,184 @@ class ParseltongueParser(Parser):
         if (
             (a := self.disjunction())
             and
-            (literal := self.expect('if'))
+            (literal := self.terminal(KIND_if))
             and
             (b := self.disjunction())
             and
-            self.negative_lookahead(self._tmp_154, )
+            self.negative_lookahead(self._tmp_155, )
         ):
             return self . store_syntax_error_known_range ( "expected 'else' after 'if' expression" , a , b )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_named_expression(self) -> Optional[NoReturn]:
         # invalid_named_expression: expression ':=' expression | NAME '=' bitwise_or !('=' | ':=') | !(list | tuple | genexp | 'True' | 'None' | 'False') bitwise_or '=' bitwise_or !('=' | ':=')
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
             (a := self.expression())
             and
-            (literal := self.expect(':='))
+            (literal := self.terminal(KIND_COLONEQUAL))
             and
             (expression := self.expression())
         ):
             return self . store_syntax_error_known_location ( f"cannot use assignment expressions with {self.get_expr_name(a)}" , a )
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (a := self.name())
             and
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
             and
             (b := self.bitwise_or())
             and
-            self.negative_lookahead(self._tmp_155, )
+            self.negative_lookahead(self._tmp_156, )
         ):
             return ( None if self . in_recursive_rule else self . store_syntax_error_known_range ( "invalid syntax. Maybe you meant '==' or ':=' instead of '='?" , a , b ) )
         self._reset(mark)
         if (
-            self.negative_lookahead(self._tmp_156, )
+            kind in FIRST_97
+            and
+            self.negative_lookahead(self._tmp_157, )
             and
             (a := self.bitwise_or())
             and
-            (b := self.expect('='))
+            (b := self.terminal(KIND_EQUAL))
             and
             (bitwise_or := self.bitwise_or())
             and
-            self.negative_lookahead(self._tmp_157, )
+            self.negative_lookahead(self._tmp_158, )
         ):
             return ( None if self . in_recursive_rule else self . store_syntax_error_known_range ( f"cannot assign to {self.get_expr_name(a)} here. Maybe you meant '==' instead of '='?" , a , b ) )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_assignment(self) -> Optional[NoReturn]:
         # invalid_assignment: invalid_ann_assign_target ':' expression | star_named_expression ',' star_named_expressions* ':' expression | expression ':' expression | ((star_targets '='))* star_expressions '=' | ((star_targets '='))* yield_expr '=' | star_expressions augassign (yield_expr | star_expressions)
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_10:
+            return None
         if (
+            self.call_invalid_rules
+            and
+            kind in FIRST_81
+            and
             (a := self.invalid_ann_assign_target())
             and
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
             (expression := self.expression())
         ):
             return self . store_syntax_error_known_location ( f"only single target (not {self.get_expr_name(a)}) can be annotated" , a )
         self._reset(mark)
         if (
+            kind in FIRST_4
+            and
             (a := self.star_named_expression())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
-            (_loop0_158 := self._loop0_158(),)
+            (_loop0_159 := self._loop0_159(),)
             and
-            (literal_1 := self.expect(':'))
+            (literal_1 := self.terminal(KIND_COLON))
             and
             (expression := self.expression())
         ):
             return self . store_syntax_error_known_location ( "only single target (not tuple) can be annotated" , a )
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (a := self.expression())
             and
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
             (expression := self.expression())
         ):
             return self . store_syntax_error_known_location ( "illegal target for annotation" , a )
         self._reset(mark)
         if (
-            (_loop0_159 := self._loop0_159(),)
+            kind in FIRST_4
+            and
+            (_loop0_160 := self._loop0_160(),)
             and
             (a := self.star_expressions())
             and
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
         ):
             return self . store_syntax_error_known_location ( f"cannot assign to {self.get_expr_name(a)}" , a )
         self._reset(mark)
         if (
-            (_loop0_160 := self._loop0_160(),)
+            kind in FIRST_122
+            and
+            (_loop0_161 := self._loop0_161(),)
             and
             (a := self.yield_expr())
             and
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
         ):
             return self . store_syntax_error_known_location ( "assignment to yield expression not possible" , a )
         self._reset(mark)
         if (
+            kind in FIRST_4
+            and
             (a := self.star_expressions())
             and
             (augassign := self.augassign())
             and
-            (_tmp_161 := self._tmp_161())
+            (_tmp_162 := self._tmp_162())
         ):
             return self . store_syntax_error_known_location ( f"{self.get_expr_name(a)} is an illegal expression for augmented assignment" , a )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_ann_assign_target(self) -> Optional[ast . AST]:
         # invalid_ann_assign_target: list | tuple | '(' invalid_ann_assign_target ')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_81:
+            return None
         if (
+            kind in FIRST_90
+            and
             (a := self.list())
         ):
             return a
         self._reset(mark)
         if (
+            kind in FIRST_3
+            and
             (a := self.tuple())
         ):
             return a
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            self.call_invalid_rules
+            and
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
             and
             (a := self.invalid_ann_assign_target())
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_del_stmt(self) -> Optional[NoReturn]:
         # invalid_del_stmt: 'del' star_expressions
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_15:
+            return None
         if (
-            (literal := self.expect('del'))
+            (literal := self.terminal(KIND_del))
             and
             (a := self.star_expressions())
         ):
@@ -5846,25 +7339,29 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_block(self) -> Optional[NoReturn]:
         # invalid_block: NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_8:
+            return None
         if (
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( "expected an indented block" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_comprehension(self) -> Optional[NoReturn]:
         # invalid_comprehension: ('[' | '(' | '{') starred_expression for_if_clauses | ('[' | '{') star_named_expression ',' star_named_expressions for_if_clauses | ('[' | '{') star_named_expression ',' for_if_clauses
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_112:
+            return None
         if (
-            (_tmp_162 := self._tmp_162())
+            (_tmp_163 := self._tmp_163())
             and
             (a := self.starred_expression())
             and
@@ -5873,11 +7370,13 @@ class ParseltongueParser(Parser):
             return self . raise_syntax_error_known_location ( "iterable unpacking cannot be used in comprehension" , a )
         self._reset(mark)
         if (
-            (_tmp_163 := self._tmp_163())
+            kind in FIRST_123
+            and
+            (_tmp_164 := self._tmp_164())
             and
             (a := self.star_named_expression())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (b := self.star_named_expressions())
             and
@@ -5886,11 +7385,13 @@ class ParseltongueParser(Parser):
             return self . raise_syntax_error_known_range ( "did you forget parentheses around the comprehension target?" , a , b [- 1] )
         self._reset(mark)
         if (
-            (_tmp_164 := self._tmp_164())
+            kind in FIRST_123
+            and
+            (_tmp_165 := self._tmp_165())
             and
             (a := self.star_named_expression())
             and
-            (b := self.expect(','))
+            (b := self.terminal(KIND_COMMA))
             and
             (for_if_clauses := self.for_if_clauses())
         ):
@@ -5898,31 +7399,37 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_dict_comprehension(self) -> Optional[NoReturn]:
         # invalid_dict_comprehension: '{' '**' bitwise_or for_if_clauses '}'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_82:
+            return None
         if (
-            (literal := self.expect('{'))
+            (literal := self.terminal(KIND_LBRACE))
             and
-            (a := self.expect('**'))
+            (a := self.terminal(KIND_DOUBLESTAR))
             and
             (bitwise_or := self.bitwise_or())
             and
             (for_if_clauses := self.for_if_clauses())
             and
-            (literal_1 := self.expect('}'))
+            (literal_1 := self.terminal(KIND_RBRACE))
         ):
             return self . raise_syntax_error_known_location ( "dict unpacking cannot be used in dict comprehension" , a )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_parameters(self) -> Optional[NoReturn]:
         # invalid_parameters: param_no_default* invalid_parameters_helper param_no_default
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
-            (_loop0_165 := self._loop0_165(),)
+            self.call_invalid_rules
+            and
+            (_loop0_166 := self._loop0_166(),)
             and
             (invalid_parameters_helper := self.invalid_parameters_helper())
             and
@@ -5932,28 +7439,34 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_parameters_helper(self) -> Optional[Any]:
         # invalid_parameters_helper: slash_with_default | param_with_default+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (a := self.slash_with_default())
         ):
             return [a]
         self._reset(mark)
         if (
-            (a := self._loop1_166())
+            (a := self._loop1_167())
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_lambda_parameters(self) -> Optional[NoReturn]:
         # invalid_lambda_parameters: lambda_param_no_default* invalid_lambda_parameters_helper lambda_param_no_default
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
-            (_loop0_167 := self._loop0_167(),)
+            self.call_invalid_rules
+            and
+            (_loop0_168 := self._loop0_168(),)
             and
             (invalid_lambda_parameters_helper := self.invalid_lambda_parameters_helper())
             and
@@ -5963,37 +7476,41 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_lambda_parameters_helper(self) -> Optional[NoReturn]:
         # invalid_lambda_parameters_helper: lambda_slash_with_default | lambda_param_with_default+
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (a := self.lambda_slash_with_default())
         ):
             return [a]
         self._reset(mark)
         if (
-            (a := self._loop1_168())
+            (a := self._loop1_169())
         ):
             return a
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_star_etc(self) -> Optional[NoReturn]:
         # invalid_star_etc: '*' (')' | ',' (')' | '**')) | '*' ',' TYPE_COMMENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_53:
+            return None
         if (
-            (a := self.expect('*'))
+            (a := self.terminal(KIND_STAR))
             and
-            (_tmp_169 := self._tmp_169())
+            (_tmp_170 := self._tmp_170())
         ):
             return self . store_syntax_error_known_location ( "named arguments must follow bare *" , a )
         self._reset(mark)
         if (
-            (literal := self.expect('*'))
+            (literal := self.terminal(KIND_STAR))
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
             and
             (type_comment := self.type_comment())
         ):
@@ -6001,63 +7518,71 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_lambda_star_etc(self) -> Optional[NoReturn]:
         # invalid_lambda_star_etc: '*' (':' | ',' (':' | '**'))
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_53:
+            return None
         if (
-            (literal := self.expect('*'))
+            (literal := self.terminal(KIND_STAR))
             and
-            (_tmp_170 := self._tmp_170())
+            (_tmp_171 := self._tmp_171())
         ):
             return self . raise_syntax_error ( "named arguments must follow bare *" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_double_type_comments(self) -> Optional[NoReturn]:
         # invalid_double_type_comments: TYPE_COMMENT NEWLINE TYPE_COMMENT NEWLINE INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_121:
+            return None
         if (
             (type_comment := self.type_comment())
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
             (type_comment_1 := self.type_comment())
             and
-            (_newline_1 := self.expect('NEWLINE'))
+            (_newline_1 := self.terminal(tokenize.NEWLINE))
             and
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
         ):
             return self . raise_syntax_error ( "Cannot have two type comments on def" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_with_item(self) -> Optional[NoReturn]:
         # invalid_with_item: expression 'as' expression &(',' | ')' | ':' | NEWLINE)
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
             (expression := self.expression())
             and
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             (a := self.expression())
             and
-            self.positive_lookahead(self._tmp_171, )
+            self.positive_lookahead(self._tmp_172, )
         ):
             return self . raise_syntax_error_known_location ( f"cannot assign to {self.get_expr_name(a)}" , a )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_for_target(self) -> Optional[NoReturn]:
         # invalid_for_target: 'async'? 'for' star_expressions
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_27:
+            return None
         if (
-            (opt := self.expect('async'),)
+            (opt := self.terminal(KIND_async),)
             and
-            (literal := self.expect('for'))
+            (literal := self.terminal(KIND_for))
             and
             (a := self.star_expressions())
         ):
@@ -6065,298 +7590,318 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_group(self) -> Optional[NoReturn]:
         # invalid_group: '(' starred_expression ')' | '(' NEWLINE INDENT starred_expression NEWLINE DEDENT ')' | '(' '**' expression ')' | '(' NEWLINE INDENT '**' expression NEWLINE DEDENT ')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_3:
+            return None
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (a := self.starred_expression())
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return self . raise_syntax_error_known_location ( "cannot use starred expression here" , a )
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (a := self.starred_expression())
             and
-            (_newline_1 := self.expect('NEWLINE'))
+            (_newline_1 := self.terminal(tokenize.NEWLINE))
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return self . raise_syntax_error_known_location ( "cannot use starred expression here" , a )
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
-            (a := self.expect('**'))
+            (a := self.terminal(KIND_DOUBLESTAR))
             and
             (expression := self.expression())
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return self . raise_syntax_error_known_location ( "cannot use double starred expression here" , a )
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
-            (a := self.expect('**'))
+            (a := self.terminal(KIND_DOUBLESTAR))
             and
             (expression := self.expression())
             and
-            (_newline_1 := self.expect('NEWLINE'))
+            (_newline_1 := self.terminal(tokenize.NEWLINE))
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return self . raise_syntax_error_known_location ( "cannot use double starred expression here" , a )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_import_from_targets(self) -> Optional[NoReturn]:
         # invalid_import_from_targets: import_from_as_names ',' NEWLINE
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (import_from_as_names := self.import_from_as_names())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return self . raise_syntax_error ( "trailing comma not allowed without surrounding parentheses" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_with_stmt_indent(self) -> Optional[NoReturn]:
         # invalid_with_stmt_indent: 'async'? 'with' ','.(expression ['as' star_target])+ ':'? NEWLINE !INDENT | 'async'? 'with' '(' ','.(expressions ['as' star_target])+ ','? ')' ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_26:
+            return None
         if (
-            (opt := self.expect('async'),)
+            (opt := self.terminal(KIND_async),)
             and
-            (a := self.expect('with'))
+            (a := self.terminal(KIND_with))
             and
-            (_gather_172 := self._gather_172())
+            (_gather_173 := self._gather_173())
             and
-            (opt_1 := self.expect(':'),)
+            (opt_1 := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'with' statement on line {a.start[0]}" )
         self._reset(mark)
         if (
-            (opt := self.expect('async'),)
+            (opt := self.terminal(KIND_async),)
             and
-            (a := self.expect('with'))
+            (a := self.terminal(KIND_with))
             and
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
-            (_gather_174 := self._gather_174())
+            (_gather_175 := self._gather_175())
             and
-            (opt_1 := self.expect(','),)
+            (opt_1 := self.terminal(KIND_COMMA),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
             and
-            (opt_2 := self.expect(':'),)
+            (opt_2 := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'with' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_try_stmt(self) -> Optional[NoReturn]:
         # invalid_try_stmt: 'try' ':'? NEWLINE !INDENT | 'try' colon_block !('except' | 'finally')
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_28:
+            return None
         if (
-            (a := self.expect('try'))
+            (a := self.terminal(KIND_try))
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected a block after 'try' statement on line {a.start[0]}" , )
         self._reset(mark)
         if (
-            (literal := self.expect('try'))
+            (literal := self.terminal(KIND_try))
             and
             (colon_block := self.colon_block())
             and
-            self.negative_lookahead(self._tmp_176, )
+            self.negative_lookahead(self._tmp_177, )
         ):
             return self . raise_syntax_error ( "expected 'except' or 'finally' block" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_except_stmt(self) -> Optional[None]:
         # invalid_except_stmt: 'except' expression ',' expressions ['as' NAME] (':' | NEWLINE)
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_74:
+            return None
         if (
-            (literal := self.expect('except'))
+            (literal := self.terminal(KIND_except))
             and
             (a := self.expression())
             and
-            (literal_1 := self.expect(','))
+            (literal_1 := self.terminal(KIND_COMMA))
             and
             (expressions := self.expressions())
             and
-            (opt := self._tmp_177(),)
+            (opt := self._tmp_178(),)
             and
-            (_tmp_178 := self._tmp_178())
+            (_tmp_179 := self._tmp_179())
         ):
             return self . raise_syntax_error_starting_from ( "exception group must be parenthesized" , a )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_finally_stmt(self) -> Optional[NoReturn]:
         # invalid_finally_stmt: 'finally' ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_75:
+            return None
         if (
-            (a := self.expect('finally'))
+            (a := self.terminal(KIND_finally))
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected a block after 'finally' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_except_stmt_indent(self) -> Optional[NoReturn]:
         # invalid_except_stmt_indent: 'except' expression ['as' NAME] ':'? NEWLINE !INDENT | 'except' ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_74:
+            return None
         if (
-            (a := self.expect('except'))
+            (a := self.terminal(KIND_except))
             and
             (expression := self.expression())
             and
-            (opt := self._tmp_179(),)
+            (opt := self._tmp_180(),)
             and
-            (opt_1 := self.expect(':'),)
+            (opt_1 := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'except' statement on line {a.start[0]}" )
         self._reset(mark)
         if (
-            (a := self.expect('except'))
+            (a := self.terminal(KIND_except))
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'except' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_match_stmt(self) -> Optional[NoReturn]:
         # invalid_match_stmt: "match" subject_expr !':' | "match" subject_expr ':' NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_32:
+            return None
         if (
-            (literal := self.expect("match"))
+            (literal := self.terminal(KIND_match))
             and
             (subject_expr := self.subject_expr())
             and
-            self.negative_lookahead(self.expect, ':')
+            self.negative_lookahead(self.terminal, KIND_COLON)
         ):
             return self . check_version ( ( 3 , 10 ) , "Pattern matching is" , self . raise_syntax_error ( "expected ':'" ) )
         self._reset(mark)
         if (
-            (a := self.expect("match"))
+            (a := self.terminal(KIND_match))
             and
             (subject := self.subject_expr())
             and
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . check_version ( ( 3 , 10 ) , "Pattern matching is" , self . raise_indentation_error ( f"expected an indented block after 'match' statement on line {a.start[0]}" ) )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_case_block(self) -> Optional[NoReturn]:
         # invalid_case_block: "case" patterns guard? !':' | "case" patterns guard? ':' NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_76:
+            return None
         if (
-            (literal := self.expect("case"))
+            (literal := self.terminal(KIND_case))
             and
             (patterns := self.patterns())
             and
             (opt := self.guard(),)
             and
-            self.negative_lookahead(self.expect, ':')
+            self.negative_lookahead(self.terminal, KIND_COLON)
         ):
             return self . store_syntax_error ( "expected ':'" )
         self._reset(mark)
         if (
-            (a := self.expect("case"))
+            (a := self.terminal(KIND_case))
             and
             (patterns := self.patterns())
             and
             (opt := self.guard(),)
             and
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'case' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_as_pattern(self) -> Optional[NoReturn]:
         # invalid_as_pattern: or_pattern 'as' "_" | or_pattern 'as' !NAME expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_78:
+            return None
         if (
             (or_pattern := self.or_pattern())
             and
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
-            (a := self.expect("_"))
+            (a := self.terminal(KIND__))
         ):
             return self . raise_syntax_error_known_location ( "cannot use '_' as a target" , a )
         self._reset(mark)
         if (
             (or_pattern := self.or_pattern())
             and
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             self.negative_lookahead(self.name, )
             and
@@ -6366,14 +7911,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_class_pattern(self) -> Optional[NoReturn]:
         # invalid_class_pattern: name_or_attr '(' invalid_class_argument_pattern
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
+            self.call_invalid_rules
+            and
             (name_or_attr := self.name_or_attr())
             and
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (a := self.invalid_class_argument_pattern())
         ):
@@ -6381,16 +7930,18 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_class_argument_pattern(self) -> Optional[list]:
         # invalid_class_argument_pattern: [positional_patterns ','] keyword_patterns ',' positional_patterns
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_78:
+            return None
         if (
-            (opt := self._tmp_180(),)
+            (opt := self._tmp_181(),)
             and
             (keyword_patterns := self.keyword_patterns())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (a := self.positional_patterns())
         ):
@@ -6398,277 +7949,313 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_if_stmt(self) -> Optional[NoReturn]:
         # invalid_if_stmt: 'if' named_expression ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_23:
+            return None
         if (
-            (a := self.expect('if'))
+            (a := self.terminal(KIND_if))
             and
             (a_1 := self.named_expression())
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'if' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_unless_stmt(self) -> Optional[NoReturn]:
         # invalid_unless_stmt: 'unless' named_expression ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_24:
+            return None
         if (
-            (a := self.expect('unless'))
+            (a := self.terminal(KIND_unless))
             and
             (a_1 := self.named_expression())
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'unless' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_elif_stmt(self) -> Optional[NoReturn]:
         # invalid_elif_stmt: 'elif' named_expression ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_70:
+            return None
         if (
-            (a := self.expect('elif'))
+            (a := self.terminal(KIND_elif))
             and
             (named_expression := self.named_expression())
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'elif' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_else_stmt(self) -> Optional[NoReturn]:
         # invalid_else_stmt: 'else' ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_71:
+            return None
         if (
-            (a := self.expect('else'))
+            (a := self.terminal(KIND_else))
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'else' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_while_stmt(self) -> Optional[NoReturn]:
         # invalid_while_stmt: 'while' named_expression ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_29:
+            return None
         if (
-            (a := self.expect('while'))
+            (a := self.terminal(KIND_while))
             and
             (named_expression := self.named_expression())
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'while' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_until_stmt(self) -> Optional[NoReturn]:
         # invalid_until_stmt: 'until' named_expression ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_30:
+            return None
         if (
-            (a := self.expect('until'))
+            (a := self.terminal(KIND_until))
             and
             (named_expression := self.named_expression())
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'until' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_loop_stmt(self) -> Optional[NoReturn]:
         # invalid_loop_stmt: 'loop' named_expression ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_31:
+            return None
         if (
-            (a := self.expect('loop'))
+            (a := self.terminal(KIND_loop))
             and
             (named_expression := self.named_expression())
             and
-            (opt := self.expect(':'),)
+            (opt := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'loop' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_for_stmt(self) -> Optional[NoReturn]:
         # invalid_for_stmt: 'async'? 'for' star_targets 'in' star_expressions ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_27:
+            return None
         if (
-            (opt := self.expect('async'),)
+            (opt := self.terminal(KIND_async),)
             and
-            (a := self.expect('for'))
+            (a := self.terminal(KIND_for))
             and
             (star_targets := self.star_targets())
             and
-            (literal := self.expect('in'))
+            (literal := self.terminal(KIND_in))
             and
             (star_expressions := self.star_expressions())
             and
-            (opt_1 := self.expect(':'),)
+            (opt_1 := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after 'for' statement on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_def_raw(self) -> Optional[NoReturn]:
         # invalid_def_raw: 'async'? 'def' NAME '(' params? ')' ['->' expression] ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_63:
+            return None
         if (
-            (opt := self.expect('async'),)
+            (opt := self.terminal(KIND_async),)
             and
-            (a := self.expect('def'))
+            (a := self.terminal(KIND_def))
             and
             (name := self.name())
             and
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (opt_1 := self.params(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
             and
-            (opt_2 := self._tmp_181(),)
+            (opt_2 := self._tmp_182(),)
             and
-            (opt_3 := self.expect(':'),)
+            (opt_3 := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after function definition on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_class_def_raw(self) -> Optional[NoReturn]:
         # invalid_class_def_raw: 'class' NAME ['(' arguments? ')'] ':'? NEWLINE !INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_62:
+            return None
         if (
-            (a := self.expect('class'))
+            (a := self.terminal(KIND_class))
             and
             (name := self.name())
             and
-            (opt := self._tmp_182(),)
+            (opt := self._tmp_183(),)
             and
-            (opt_1 := self.expect(':'),)
+            (opt_1 := self.terminal(KIND_COLON),)
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            self.negative_lookahead(self.expect, 'INDENT')
+            self.negative_lookahead(self.terminal, tokenize.INDENT)
         ):
             return self . raise_indentation_error ( f"expected an indented block after class definition on line {a.start[0]}" )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_double_starred_kvpairs(self) -> Optional[None]:
         # invalid_double_starred_kvpairs: ((double_starred_kvpair separator))+ extra_separator [INDENT ((double_starred_kvpair separator))*] invalid_kvpair | NEWLINE INDENT ((double_starred_kvpair separator))+ invalid_kvpair | expression ':' '*' bitwise_or | expression ':' &('}' | ',')
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_114:
+            return None
         if (
-            (_loop1_183 := self._loop1_183())
+            self.call_invalid_rules
+            and
+            kind in FIRST_115
+            and
+            (_loop1_184 := self._loop1_184())
             and
             (extra_separator := self.extra_separator())
             and
-            (opt := self._tmp_184(),)
+            (opt := self._tmp_185(),)
             and
             (invalid_kvpair := self.invalid_kvpair())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
-            (_newline := self.expect('NEWLINE'))
+            self.call_invalid_rules
+            and
+            kind in FIRST_8
             and
-            (_indent := self.expect('INDENT'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            (_loop1_185 := self._loop1_185())
+            (_indent := self.terminal(tokenize.INDENT))
+            and
+            (_loop1_186 := self._loop1_186())
             and
             (invalid_kvpair := self.invalid_kvpair())
         ):
             return None  # pragma: no cover
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (expression := self.expression())
             and
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
-            (a := self.expect('*'))
+            (a := self.terminal(KIND_STAR))
             and
             (bitwise_or := self.bitwise_or())
         ):
             return self . store_syntax_error_starting_from ( "cannot use a starred expression in a dictionary value" , a )
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (expression := self.expression())
             and
-            (a := self.expect(':'))
+            (a := self.terminal(KIND_COLON))
             and
-            self.positive_lookahead(self._tmp_186, )
+            self.positive_lookahead(self._tmp_187, )
         ):
             return self . store_syntax_error_known_location ( "expression expected after dictionary key and ':'" , a )
         self._reset(mark)
         return None
 
-    @memoize
     def invalid_kvpair(self) -> Optional[None]:
         # invalid_kvpair: expression !(':') | expression ':' '*' bitwise_or | expression ':'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
             (a := self.expression())
             and
-            self.negative_lookahead(self.expect, ':')
+            self.negative_lookahead(self.terminal, KIND_COLON)
         ):
             return self . _store_syntax_error ( "':' expected after dictionary key" , ( a . lineno , a . col_offset - 1 ) , ( a . end_lineno , a . end_col_offset , - 1 ) )
         self._reset(mark)
         if (
             (expression := self.expression())
             and
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
-            (a := self.expect('*'))
+            (a := self.terminal(KIND_STAR))
             and
             (bitwise_or := self.bitwise_or())
         ):
@@ -6677,39 +8264,36 @@ class ParseltongueParser(Parser):
         if (
             (expression := self.expression())
             and
-            (a := self.expect(':'))
+            (a := self.terminal(KIND_COLON))
         ):
             return self . store_syntax_error_known_location ( "expression expected after dictionary key and ':'" , a )
         self._reset(mark)
         return None
 
-    @memoize
     def _loop0_1(self) -> Optional[Any]:
         # _loop0_1: NEWLINE
         mark = self._mark()
         children = []
         while (
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             children.append(_newline)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
     def _loop0_2(self) -> Optional[Any]:
         # _loop0_2: NEWLINE
         mark = self._mark()
         children = []
         while (
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             children.append(_newline)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
     def _loop1_3(self) -> Optional[Any]:
         # _loop1_3: statement
         mark = self._mark()
@@ -6722,13 +8306,24 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_5(self) -> Optional[Any]:
-        # _loop0_5: ';' simple_stmt
+    def _loop1_4(self) -> Optional[Any]:
+        # _loop1_4: file_statement
+        mark = self._mark()
+        children = []
+        while (
+            (file_statement := self.file_statement())
+        ):
+            children.append(file_statement)
+            mark = self._mark()
+        self._reset(mark)
+        return children
+
+    def _loop0_6(self) -> Optional[Any]:
+        # _loop0_6: ';' simple_stmt
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(';'))
+            (literal := self.terminal(KIND_SEMI))
             and
             (elem := self.simple_stmt())
         ):
@@ -6737,112 +8332,145 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_4(self) -> Optional[Any]:
-        # _gather_4: simple_stmt _loop0_5
+    def _gather_5(self) -> Optional[Any]:
+        # _gather_5: simple_stmt _loop0_6
         mark = self._mark()
         if (
             (elem := self.simple_stmt())
             is not None
             and
-            (seq := self._loop0_5())
+            (seq := self._loop0_6())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_6(self) -> Optional[Any]:
-        # _tmp_6: 'import' | 'from'
+    def _tmp_7(self) -> Optional[Any]:
+        # _tmp_7: 'import' | 'from'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_12:
+            return None
         if (
-            (literal := self.expect('import'))
+            kind in FIRST_50
+            and
+            (literal := self.terminal(KIND_import))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('from'))
+            kind in FIRST_51
+            and
+            (literal := self.terminal(KIND_from))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_7(self) -> Optional[Any]:
-        # _tmp_7: 'def' | '@' | 'async'
+    def _tmp_8(self) -> Optional[Any]:
+        # _tmp_8: 'def' | '@' | 'async'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_22:
+            return None
         if (
-            (literal := self.expect('def'))
+            kind in FIRST_64
+            and
+            (literal := self.terminal(KIND_def))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('@'))
+            kind in FIRST_61
+            and
+            (literal := self.terminal(KIND_AT))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('async'))
+            kind in FIRST_65
+            and
+            (literal := self.terminal(KIND_async))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_8(self) -> Optional[Any]:
-        # _tmp_8: 'class' | '@'
+    def _tmp_9(self) -> Optional[Any]:
+        # _tmp_9: 'class' | '@'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_25:
+            return None
         if (
-            (literal := self.expect('class'))
+            kind in FIRST_62
+            and
+            (literal := self.terminal(KIND_class))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('@'))
+            kind in FIRST_61
+            and
+            (literal := self.terminal(KIND_AT))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_9(self) -> Optional[Any]:
-        # _tmp_9: 'with' | 'async'
+    def _tmp_10(self) -> Optional[Any]:
+        # _tmp_10: 'with' | 'async'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_26:
+            return None
         if (
-            (literal := self.expect('with'))
+            kind in FIRST_73
+            and
+            (literal := self.terminal(KIND_with))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('async'))
+            kind in FIRST_65
+            and
+            (literal := self.terminal(KIND_async))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_10(self) -> Optional[Any]:
-        # _tmp_10: 'for' | 'async'
+    def _tmp_11(self) -> Optional[Any]:
+        # _tmp_11: 'for' | 'async'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_27:
+            return None
         if (
-            (literal := self.expect('for'))
+            kind in FIRST_72
+            and
+            (literal := self.terminal(KIND_for))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('async'))
+            kind in FIRST_65
+            and
+            (literal := self.terminal(KIND_async))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_11(self) -> Optional[Any]:
-        # _tmp_11: '=' annotated_rhs
+    def _tmp_12(self) -> Optional[Any]:
+        # _tmp_12: '=' annotated_rhs
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_69:
+            return None
         if (
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
             and
             (d := self.annotated_rhs())
         ):
@@ -6850,16 +8478,20 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_12(self) -> Optional[Any]:
-        # _tmp_12: '(' single_target ')' | single_subscript_attribute_target
+    def _tmp_13(self) -> Optional[Any]:
+        # _tmp_13: '(' single_target ')' | single_subscript_attribute_target
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_34:
+            return None
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
             and
             (b := self.single_target())
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return b
         self._reset(mark)
@@ -6870,12 +8502,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_13(self) -> Optional[Any]:
-        # _tmp_13: '=' annotated_rhs
+    def _tmp_14(self) -> Optional[Any]:
+        # _tmp_14: '=' annotated_rhs
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_69:
+            return None
         if (
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
             and
             (d := self.annotated_rhs())
         ):
@@ -6883,57 +8517,70 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop1_14(self) -> Optional[Any]:
-        # _loop1_14: (star_targets '=')
+    def _loop1_15(self) -> Optional[Any]:
+        # _loop1_15: (star_targets '=')
         mark = self._mark()
         children = []
         while (
-            (_tmp_187 := self._tmp_187())
+            (_tmp_188 := self._tmp_188())
         ):
-            children.append(_tmp_187)
+            children.append(_tmp_188)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _tmp_15(self) -> Optional[Any]:
-        # _tmp_15: yield_expr | star_expressions
+    def _tmp_16(self) -> Optional[Any]:
+        # _tmp_16: yield_expr | star_expressions
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_10:
+            return None
         if (
+            kind in FIRST_16
+            and
             (yield_expr := self.yield_expr())
         ):
             return yield_expr
         self._reset(mark)
         if (
+            kind in FIRST_4
+            and
             (star_expressions := self.star_expressions())
         ):
             return star_expressions
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_16(self) -> Optional[Any]:
-        # _tmp_16: yield_expr | star_expressions
+    def _tmp_17(self) -> Optional[Any]:
+        # _tmp_17: yield_expr | star_expressions
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_10:
+            return None
         if (
+            kind in FIRST_16
+            and
             (yield_expr := self.yield_expr())
         ):
             return yield_expr
         self._reset(mark)
         if (
+            kind in FIRST_4
+            and
             (star_expressions := self.star_expressions())
         ):
             return star_expressions
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_17(self) -> Optional[Any]:
-        # _tmp_17: 'from' expression
+    def _tmp_18(self) -> Optional[Any]:
+        # _tmp_18: 'from' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_51:
+            return None
         if (
-            (literal := self.expect('from'))
+            (literal := self.terminal(KIND_from))
             and
             (z := self.expression())
         ):
@@ -6941,13 +8588,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_19(self) -> Optional[Any]:
-        # _loop0_19: ',' NAME
+    def _loop0_20(self) -> Optional[Any]:
+        # _loop0_20: ',' NAME
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.name())
         ):
@@ -6956,28 +8602,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_18(self) -> Optional[Any]:
-        # _gather_18: NAME _loop0_19
+    def _gather_19(self) -> Optional[Any]:
+        # _gather_19: NAME _loop0_20
         mark = self._mark()
         if (
             (elem := self.name())
             is not None
             and
-            (seq := self._loop0_19())
+            (seq := self._loop0_20())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_21(self) -> Optional[Any]:
-        # _loop0_21: ',' NAME
+    def _loop0_22(self) -> Optional[Any]:
+        # _loop0_22: ',' NAME
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.name())
         ):
@@ -6986,43 +8630,50 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_20(self) -> Optional[Any]:
-        # _gather_20: NAME _loop0_21
+    def _gather_21(self) -> Optional[Any]:
+        # _gather_21: NAME _loop0_22
         mark = self._mark()
         if (
             (elem := self.name())
             is not None
             and
-            (seq := self._loop0_21())
+            (seq := self._loop0_22())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_22(self) -> Optional[Any]:
-        # _tmp_22: ';' | NEWLINE
+    def _tmp_23(self) -> Optional[Any]:
+        # _tmp_23: ';' | NEWLINE
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_124:
+            return None
         if (
-            (literal := self.expect(';'))
+            kind in FIRST_125
+            and
+            (literal := self.terminal(KIND_SEMI))
         ):
             return literal
         self._reset(mark)
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
+            and
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return _newline
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_23(self) -> Optional[Any]:
-        # _tmp_23: ',' expression
+    def _tmp_24(self) -> Optional[Any]:
+        # _tmp_24: ',' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_55:
+            return None
         if (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (z := self.expression())
         ):
@@ -7030,39 +8681,36 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_24(self) -> Optional[Any]:
-        # _loop0_24: ('.' | '...')
+    def _loop0_25(self) -> Optional[Any]:
+        # _loop0_25: ('.' | '...')
         mark = self._mark()
         children = []
         while (
-            (_tmp_188 := self._tmp_188())
+            (_tmp_189 := self._tmp_189())
         ):
-            children.append(_tmp_188)
+            children.append(_tmp_189)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_25(self) -> Optional[Any]:
-        # _loop1_25: ('.' | '...')
+    def _loop1_26(self) -> Optional[Any]:
+        # _loop1_26: ('.' | '...')
         mark = self._mark()
         children = []
         while (
-            (_tmp_189 := self._tmp_189())
+            (_tmp_190 := self._tmp_190())
         ):
-            children.append(_tmp_189)
+            children.append(_tmp_190)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_27(self) -> Optional[Any]:
-        # _loop0_27: ',' import_from_as_name
+    def _loop0_28(self) -> Optional[Any]:
+        # _loop0_28: ',' import_from_as_name
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.import_from_as_name())
         ):
@@ -7071,27 +8719,28 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_26(self) -> Optional[Any]:
-        # _gather_26: import_from_as_name _loop0_27
+    def _gather_27(self) -> Optional[Any]:
+        # _gather_27: import_from_as_name _loop0_28
         mark = self._mark()
         if (
             (elem := self.import_from_as_name())
             is not None
             and
-            (seq := self._loop0_27())
+            (seq := self._loop0_28())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_28(self) -> Optional[Any]:
-        # _tmp_28: 'as' NAME
+    def _tmp_29(self) -> Optional[Any]:
+        # _tmp_29: 'as' NAME
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_126:
+            return None
         if (
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             (z := self.name())
         ):
@@ -7099,13 +8748,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_30(self) -> Optional[Any]:
-        # _loop0_30: ',' dotted_as_name
+    def _loop0_31(self) -> Optional[Any]:
+        # _loop0_31: ',' dotted_as_name
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.dotted_as_name())
         ):
@@ -7114,27 +8762,28 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_29(self) -> Optional[Any]:
-        # _gather_29: dotted_as_name _loop0_30
+    def _gather_30(self) -> Optional[Any]:
+        # _gather_30: dotted_as_name _loop0_31
         mark = self._mark()
         if (
             (elem := self.dotted_as_name())
             is not None
             and
-            (seq := self._loop0_30())
+            (seq := self._loop0_31())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_31(self) -> Optional[Any]:
-        # _tmp_31: 'as' NAME
+    def _tmp_32(self) -> Optional[Any]:
+        # _tmp_32: 'as' NAME
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_126:
+            return None
         if (
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             (z := self.name())
         ):
@@ -7142,9 +8791,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop1_32(self) -> Optional[Any]:
-        # _loop1_32: decorator
+    def _loop1_33(self) -> Optional[Any]:
+        # _loop1_33: decorator
         mark = self._mark()
         children = []
         while (
@@ -7155,57 +8803,65 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _tmp_33(self) -> Optional[Any]:
-        # _tmp_33: '@' dec_maybe_call NEWLINE
+    def _tmp_34(self) -> Optional[Any]:
+        # _tmp_34: '@' dec_maybe_call NEWLINE
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_61:
+            return None
         if (
-            (literal := self.expect('@'))
+            (literal := self.terminal(KIND_AT))
             and
             (f := self.dec_maybe_call())
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return f
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_34(self) -> Optional[Any]:
-        # _tmp_34: '@' named_expression NEWLINE
+    def _tmp_35(self) -> Optional[Any]:
+        # _tmp_35: '@' named_expression NEWLINE
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_61:
+            return None
         if (
-            (literal := self.expect('@'))
+            (literal := self.terminal(KIND_AT))
             and
             (f := self.named_expression())
             and
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return f
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_35(self) -> Optional[Any]:
-        # _tmp_35: '(' arguments? ')'
+    def _tmp_36(self) -> Optional[Any]:
+        # _tmp_36: '(' arguments? ')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_3:
+            return None
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (z := self.arguments(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return z
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_36(self) -> Optional[Any]:
-        # _tmp_36: '->' expression
+    def _tmp_37(self) -> Optional[Any]:
+        # _tmp_37: '->' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_127:
+            return None
         if (
-            (literal := self.expect('->'))
+            (literal := self.terminal(KIND_RARROW))
             and
             (z := self.expression())
         ):
@@ -7213,12 +8869,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_37(self) -> Optional[Any]:
-        # _tmp_37: '->' expression
+    def _tmp_38(self) -> Optional[Any]:
+        # _tmp_38: '->' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_127:
+            return None
         if (
-            (literal := self.expect('->'))
+            (literal := self.terminal(KIND_RARROW))
             and
             (z := self.expression())
         ):
@@ -7226,9 +8884,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_38(self) -> Optional[Any]:
-        # _loop0_38: param_no_default
+    def _loop0_39(self) -> Optional[Any]:
+        # _loop0_39: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7239,9 +8896,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_39(self) -> Optional[Any]:
-        # _loop0_39: param_with_default
+    def _loop0_40(self) -> Optional[Any]:
+        # _loop0_40: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7252,9 +8908,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_40(self) -> Optional[Any]:
-        # _loop0_40: param_with_default
+    def _loop0_41(self) -> Optional[Any]:
+        # _loop0_41: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7265,9 +8920,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_41(self) -> Optional[Any]:
-        # _loop1_41: param_no_default
+    def _loop1_42(self) -> Optional[Any]:
+        # _loop1_42: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7278,9 +8932,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_42(self) -> Optional[Any]:
-        # _loop0_42: param_with_default
+    def _loop0_43(self) -> Optional[Any]:
+        # _loop0_43: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7291,9 +8944,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_43(self) -> Optional[Any]:
-        # _loop1_43: param_with_default
+    def _loop1_44(self) -> Optional[Any]:
+        # _loop1_44: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7304,9 +8956,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_44(self) -> Optional[Any]:
-        # _loop1_44: param_no_default
+    def _loop1_45(self) -> Optional[Any]:
+        # _loop1_45: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7317,9 +8968,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_45(self) -> Optional[Any]:
-        # _loop1_45: param_no_default
+    def _loop1_46(self) -> Optional[Any]:
+        # _loop1_46: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7330,9 +8980,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_46(self) -> Optional[Any]:
-        # _loop0_46: param_no_default
+    def _loop0_47(self) -> Optional[Any]:
+        # _loop0_47: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7343,9 +8992,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_47(self) -> Optional[Any]:
-        # _loop1_47: param_with_default
+    def _loop1_48(self) -> Optional[Any]:
+        # _loop1_48: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7356,9 +9004,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_48(self) -> Optional[Any]:
-        # _loop0_48: param_no_default
+    def _loop0_49(self) -> Optional[Any]:
+        # _loop0_49: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7369,9 +9016,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_49(self) -> Optional[Any]:
-        # _loop1_49: param_with_default
+    def _loop1_50(self) -> Optional[Any]:
+        # _loop1_50: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7382,9 +9028,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_50(self) -> Optional[Any]:
-        # _loop0_50: param_maybe_default
+    def _loop0_51(self) -> Optional[Any]:
+        # _loop0_51: param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -7395,9 +9040,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_51(self) -> Optional[Any]:
-        # _loop1_51: param_maybe_default
+    def _loop1_52(self) -> Optional[Any]:
+        # _loop1_52: param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -7408,13 +9052,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_53(self) -> Optional[Any]:
-        # _loop0_53: ',' with_item
+    def _loop0_54(self) -> Optional[Any]:
+        # _loop0_54: ',' with_item
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.with_item())
         ):
@@ -7423,28 +9066,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_52(self) -> Optional[Any]:
-        # _gather_52: with_item _loop0_53
+    def _gather_53(self) -> Optional[Any]:
+        # _gather_53: with_item _loop0_54
         mark = self._mark()
         if (
             (elem := self.with_item())
             is not None
             and
-            (seq := self._loop0_53())
+            (seq := self._loop0_54())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_55(self) -> Optional[Any]:
-        # _loop0_55: ',' with_item
+    def _loop0_56(self) -> Optional[Any]:
+        # _loop0_56: ',' with_item
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.with_item())
         ):
@@ -7453,28 +9094,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_54(self) -> Optional[Any]:
-        # _gather_54: with_item _loop0_55
+    def _gather_55(self) -> Optional[Any]:
+        # _gather_55: with_item _loop0_56
         mark = self._mark()
         if (
             (elem := self.with_item())
             is not None
             and
-            (seq := self._loop0_55())
+            (seq := self._loop0_56())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_57(self) -> Optional[Any]:
-        # _loop0_57: ',' with_item
+    def _loop0_58(self) -> Optional[Any]:
+        # _loop0_58: ',' with_item
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.with_item())
         ):
@@ -7483,28 +9122,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_56(self) -> Optional[Any]:
-        # _gather_56: with_item _loop0_57
+    def _gather_57(self) -> Optional[Any]:
+        # _gather_57: with_item _loop0_58
         mark = self._mark()
         if (
             (elem := self.with_item())
             is not None
             and
-            (seq := self._loop0_57())
+            (seq := self._loop0_58())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_59(self) -> Optional[Any]:
-        # _loop0_59: ',' with_item
+    def _loop0_60(self) -> Optional[Any]:
+        # _loop0_60: ',' with_item
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.with_item())
         ):
@@ -7513,50 +9150,58 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_58(self) -> Optional[Any]:
-        # _gather_58: with_item _loop0_59
+    def _gather_59(self) -> Optional[Any]:
+        # _gather_59: with_item _loop0_60
         mark = self._mark()
         if (
             (elem := self.with_item())
             is not None
             and
-            (seq := self._loop0_59())
+            (seq := self._loop0_60())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_60(self) -> Optional[Any]:
-        # _tmp_60: ',' | ')' | ':' | NEWLINE
+    def _tmp_61(self) -> Optional[Any]:
+        # _tmp_61: ',' | ')' | ':' | NEWLINE
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_128:
+            return None
         if (
-            (literal := self.expect(','))
+            kind in FIRST_55
+            and
+            (literal := self.terminal(KIND_COMMA))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect(')'))
+            kind in FIRST_129
+            and
+            (literal := self.terminal(KIND_RPAR))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect(':'))
+            kind in FIRST_57
+            and
+            (literal := self.terminal(KIND_COLON))
         ):
             return literal
         self._reset(mark)
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
+            and
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return _newline
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop1_61(self) -> Optional[Any]:
-        # _loop1_61: except_block
+    def _loop1_62(self) -> Optional[Any]:
+        # _loop1_62: except_block
         mark = self._mark()
         children = []
         while (
@@ -7567,12 +9212,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _tmp_62(self) -> Optional[Any]:
-        # _tmp_62: 'as' NAME
+    def _tmp_63(self) -> Optional[Any]:
+        # _tmp_63: 'as' NAME
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_126:
+            return None
         if (
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             (z := self.name())
         ):
@@ -7580,9 +9227,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop1_63(self) -> Optional[Any]:
-        # _loop1_63: case_block
+    def _loop1_64(self) -> Optional[Any]:
+        # _loop1_64: case_block
         mark = self._mark()
         children = []
         while (
@@ -7593,13 +9239,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_65(self) -> Optional[Any]:
-        # _loop0_65: '|' closed_pattern
+    def _loop0_66(self) -> Optional[Any]:
+        # _loop0_66: '|' closed_pattern
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect('|'))
+            (literal := self.terminal(KIND_VBAR))
             and
             (elem := self.closed_pattern())
         ):
@@ -7608,102 +9253,128 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_64(self) -> Optional[Any]:
-        # _gather_64: closed_pattern _loop0_65
+    def _gather_65(self) -> Optional[Any]:
+        # _gather_65: closed_pattern _loop0_66
         mark = self._mark()
         if (
             (elem := self.closed_pattern())
             is not None
             and
-            (seq := self._loop0_65())
+            (seq := self._loop0_66())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_66(self) -> Optional[Any]:
-        # _tmp_66: '+' | '-'
+    def _tmp_67(self) -> Optional[Any]:
+        # _tmp_67: '+' | '-'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_130:
+            return None
         if (
-            (literal := self.expect('+'))
+            kind in FIRST_107
+            and
+            (literal := self.terminal(KIND_PLUS))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('-'))
+            kind in FIRST_89
+            and
+            (literal := self.terminal(KIND_MINUS))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_67(self) -> Optional[Any]:
-        # _tmp_67: '+' | '-'
+    def _tmp_68(self) -> Optional[Any]:
+        # _tmp_68: '+' | '-'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_130:
+            return None
         if (
-            (literal := self.expect('+'))
+            kind in FIRST_107
+            and
+            (literal := self.terminal(KIND_PLUS))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('-'))
+            kind in FIRST_89
+            and
+            (literal := self.terminal(KIND_MINUS))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_68(self) -> Optional[Any]:
-        # _tmp_68: '.' | '(' | '='
+    def _tmp_69(self) -> Optional[Any]:
+        # _tmp_69: '.' | '(' | '='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_131:
+            return None
         if (
-            (literal := self.expect('.'))
+            kind in FIRST_120
+            and
+            (literal := self.terminal(KIND_DOT))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('='))
+            kind in FIRST_69
+            and
+            (literal := self.terminal(KIND_EQUAL))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_69(self) -> Optional[Any]:
-        # _tmp_69: '.' | '(' | '='
+    def _tmp_70(self) -> Optional[Any]:
+        # _tmp_70: '.' | '(' | '='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_131:
+            return None
         if (
-            (literal := self.expect('.'))
+            kind in FIRST_120
+            and
+            (literal := self.terminal(KIND_DOT))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('='))
+            kind in FIRST_69
+            and
+            (literal := self.terminal(KIND_EQUAL))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_71(self) -> Optional[Any]:
-        # _loop0_71: ',' maybe_star_pattern
+    def _loop0_72(self) -> Optional[Any]:
+        # _loop0_72: ',' maybe_star_pattern
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.maybe_star_pattern())
         ):
@@ -7712,28 +9383,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_70(self) -> Optional[Any]:
-        # _gather_70: maybe_star_pattern _loop0_71
+    def _gather_71(self) -> Optional[Any]:
+        # _gather_71: maybe_star_pattern _loop0_72
         mark = self._mark()
         if (
             (elem := self.maybe_star_pattern())
             is not None
             and
-            (seq := self._loop0_71())
+            (seq := self._loop0_72())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_73(self) -> Optional[Any]:
-        # _loop0_73: ',' key_value_pattern
+    def _loop0_74(self) -> Optional[Any]:
+        # _loop0_74: ',' key_value_pattern
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.key_value_pattern())
         ):
@@ -7742,44 +9411,48 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_72(self) -> Optional[Any]:
-        # _gather_72: key_value_pattern _loop0_73
+    def _gather_73(self) -> Optional[Any]:
+        # _gather_73: key_value_pattern _loop0_74
         mark = self._mark()
         if (
             (elem := self.key_value_pattern())
             is not None
             and
-            (seq := self._loop0_73())
+            (seq := self._loop0_74())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_74(self) -> Optional[Any]:
-        # _tmp_74: literal_expr | attr
+    def _tmp_75(self) -> Optional[Any]:
+        # _tmp_75: literal_expr | attr
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_91:
+            return None
         if (
+            kind in FIRST_79
+            and
             (literal_expr := self.literal_expr())
         ):
             return literal_expr
         self._reset(mark)
         if (
+            kind in FIRST_33
+            and
             (attr := self.attr())
         ):
             return attr
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_76(self) -> Optional[Any]:
-        # _loop0_76: ',' pattern
+    def _loop0_77(self) -> Optional[Any]:
+        # _loop0_77: ',' pattern
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.pattern())
         ):
@@ -7788,28 +9461,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_75(self) -> Optional[Any]:
-        # _gather_75: pattern _loop0_76
+    def _gather_76(self) -> Optional[Any]:
+        # _gather_76: pattern _loop0_77
         mark = self._mark()
         if (
             (elem := self.pattern())
             is not None
             and
-            (seq := self._loop0_76())
+            (seq := self._loop0_77())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_78(self) -> Optional[Any]:
-        # _loop0_78: ',' keyword_pattern
+    def _loop0_79(self) -> Optional[Any]:
+        # _loop0_79: ',' keyword_pattern
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.keyword_pattern())
         ):
@@ -7818,50 +9489,46 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_77(self) -> Optional[Any]:
-        # _gather_77: keyword_pattern _loop0_78
+    def _gather_78(self) -> Optional[Any]:
+        # _gather_78: keyword_pattern _loop0_79
         mark = self._mark()
         if (
             (elem := self.keyword_pattern())
             is not None
             and
-            (seq := self._loop0_78())
+            (seq := self._loop0_79())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop1_79(self) -> Optional[Any]:
-        # _loop1_79: (',' expression)
+    def _loop1_80(self) -> Optional[Any]:
+        # _loop1_80: (',' expression)
         mark = self._mark()
         children = []
         while (
-            (_tmp_190 := self._tmp_190())
+            (_tmp_191 := self._tmp_191())
         ):
-            children.append(_tmp_190)
+            children.append(_tmp_191)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_80(self) -> Optional[Any]:
-        # _loop1_80: (',' star_expression)
+    def _loop1_81(self) -> Optional[Any]:
+        # _loop1_81: (',' star_expression)
         mark = self._mark()
         children = []
         while (
-            (_tmp_191 := self._tmp_191())
+            (_tmp_192 := self._tmp_192())
         ):
-            children.append(_tmp_191)
+            children.append(_tmp_192)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_82(self) -> Optional[Any]:
-        # _loop0_82: separator star_named_expression
+    def _loop0_83(self) -> Optional[Any]:
+        # _loop0_83: separator star_named_expression
         mark = self._mark()
         children = []
         while (
@@ -7874,39 +9541,39 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_81(self) -> Optional[Any]:
-        # _gather_81: star_named_expression _loop0_82
+    def _gather_82(self) -> Optional[Any]:
+        # _gather_82: star_named_expression _loop0_83
         mark = self._mark()
         if (
             (elem := self.star_named_expression())
             is not None
             and
-            (seq := self._loop0_82())
+            (seq := self._loop0_83())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_83(self) -> Optional[Any]:
-        # _tmp_83: INDENT star_named_expressions DEDENT
+    def _tmp_84(self) -> Optional[Any]:
+        # _tmp_84: INDENT star_named_expressions DEDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_95:
+            return None
         if (
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (star_named_expressions := self.star_named_expressions())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return [_indent, star_named_expressions, _dedent]
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_85(self) -> Optional[Any]:
-        # _loop0_85: separator star_named_expression
+    def _loop0_86(self) -> Optional[Any]:
+        # _loop0_86: separator star_named_expression
         mark = self._mark()
         children = []
         while (
@@ -7919,24 +9586,22 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_84(self) -> Optional[Any]:
-        # _gather_84: star_named_expression _loop0_85
+    def _gather_85(self) -> Optional[Any]:
+        # _gather_85: star_named_expression _loop0_86
         mark = self._mark()
         if (
             (elem := self.star_named_expression())
             is not None
             and
-            (seq := self._loop0_85())
+            (seq := self._loop0_86())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_87(self) -> Optional[Any]:
-        # _loop0_87: separator star_named_expressions
+    def _loop0_88(self) -> Optional[Any]:
+        # _loop0_88: separator star_named_expressions
         mark = self._mark()
         children = []
         while (
@@ -7949,50 +9614,46 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_86(self) -> Optional[Any]:
-        # _gather_86: star_named_expressions _loop0_87
+    def _gather_87(self) -> Optional[Any]:
+        # _gather_87: star_named_expressions _loop0_88
         mark = self._mark()
         if (
             (elem := self.star_named_expressions())
             is not None
             and
-            (seq := self._loop0_87())
+            (seq := self._loop0_88())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop1_88(self) -> Optional[Any]:
-        # _loop1_88: ('or' conjunction)
+    def _loop1_89(self) -> Optional[Any]:
+        # _loop1_89: ('or' conjunction)
         mark = self._mark()
         children = []
         while (
-            (_tmp_192 := self._tmp_192())
+            (_tmp_193 := self._tmp_193())
         ):
-            children.append(_tmp_192)
+            children.append(_tmp_193)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_89(self) -> Optional[Any]:
-        # _loop1_89: ('and' inversion)
+    def _loop1_90(self) -> Optional[Any]:
+        # _loop1_90: ('and' inversion)
         mark = self._mark()
         children = []
         while (
-            (_tmp_193 := self._tmp_193())
+            (_tmp_194 := self._tmp_194())
         ):
-            children.append(_tmp_193)
+            children.append(_tmp_194)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_90(self) -> Optional[Any]:
-        # _loop1_90: compare_op_bitwise_or_pair
+    def _loop1_91(self) -> Optional[Any]:
+        # _loop1_91: compare_op_bitwise_or_pair
         mark = self._mark()
         children = []
         while (
@@ -8003,13 +9664,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_92(self) -> Optional[Any]:
-        # _loop0_92: ',' slice
+    def _loop0_93(self) -> Optional[Any]:
+        # _loop0_93: ',' slice
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.slice())
         ):
@@ -8018,27 +9678,28 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_91(self) -> Optional[Any]:
-        # _gather_91: slice _loop0_92
+    def _gather_92(self) -> Optional[Any]:
+        # _gather_92: slice _loop0_93
         mark = self._mark()
         if (
             (elem := self.slice())
             is not None
             and
-            (seq := self._loop0_92())
+            (seq := self._loop0_93())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_93(self) -> Optional[Any]:
-        # _tmp_93: ':' expression?
+    def _tmp_94(self) -> Optional[Any]:
+        # _tmp_94: ':' expression?
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_57:
+            return None
         if (
-            (literal := self.expect(':'))
+            (literal := self.terminal(KIND_COLON))
             and
             (d := self.expression(),)
         ):
@@ -8046,16 +9707,22 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_94(self) -> Optional[Any]:
-        # _tmp_94: tuple | group | genexp
+    def _tmp_95(self) -> Optional[Any]:
+        # _tmp_95: tuple | group | genexp
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_112:
+            return None
         if (
+            kind in FIRST_3
+            and
             (tuple := self.tuple())
         ):
             return tuple
         self._reset(mark)
         if (
+            kind in FIRST_3
+            and
             (group := self.group())
         ):
             return group
@@ -8067,11 +9734,15 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_95(self) -> Optional[Any]:
-        # _tmp_95: list | listcomp
+    def _tmp_96(self) -> Optional[Any]:
+        # _tmp_96: list | listcomp
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_112:
+            return None
         if (
+            kind in FIRST_90
+            and
             (list := self.list())
         ):
             return list
@@ -8083,21 +9754,29 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_96(self) -> Optional[Any]:
-        # _tmp_96: dict | set | dictcomp | setcomp
+    def _tmp_97(self) -> Optional[Any]:
+        # _tmp_97: dict | set | dictcomp | setcomp
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_112:
+            return None
         if (
+            kind in FIRST_82
+            and
             (dict := self.dict())
         ):
             return dict
         self._reset(mark)
         if (
+            kind in FIRST_82
+            and
             (set := self.set())
         ):
             return set
         self._reset(mark)
         if (
+            kind in FIRST_82
+            and
             (dictcomp := self.dictcomp())
         ):
             return dictcomp
@@ -8109,41 +9788,52 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_97(self) -> Optional[Any]:
-        # _tmp_97: yield_expr | named_expression
+    def _tmp_98(self) -> Optional[Any]:
+        # _tmp_98: yield_expr | named_expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_132:
+            return None
         if (
+            kind in FIRST_16
+            and
             (yield_expr := self.yield_expr())
         ):
             return yield_expr
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (named_expression := self.named_expression())
         ):
             return named_expression
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_98(self) -> Optional[Any]:
-        # _tmp_98: yield_expr | named_expression
+    def _tmp_99(self) -> Optional[Any]:
+        # _tmp_99: yield_expr | named_expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_132:
+            return None
         if (
+            kind in FIRST_16
+            and
             (yield_expr := self.yield_expr())
         ):
             return yield_expr
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (named_expression := self.named_expression())
         ):
             return named_expression
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_99(self) -> Optional[Any]:
-        # _loop0_99: lambda_param_no_default
+    def _loop0_100(self) -> Optional[Any]:
+        # _loop0_100: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8154,9 +9844,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_100(self) -> Optional[Any]:
-        # _loop0_100: lambda_param_with_default
+    def _loop0_101(self) -> Optional[Any]:
+        # _loop0_101: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8167,9 +9856,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_101(self) -> Optional[Any]:
-        # _loop0_101: lambda_param_with_default
+    def _loop0_102(self) -> Optional[Any]:
+        # _loop0_102: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8180,9 +9868,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_102(self) -> Optional[Any]:
-        # _loop1_102: lambda_param_no_default
+    def _loop1_103(self) -> Optional[Any]:
+        # _loop1_103: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8193,9 +9880,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_103(self) -> Optional[Any]:
-        # _loop0_103: lambda_param_with_default
+    def _loop0_104(self) -> Optional[Any]:
+        # _loop0_104: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8206,9 +9892,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_104(self) -> Optional[Any]:
-        # _loop1_104: lambda_param_with_default
+    def _loop1_105(self) -> Optional[Any]:
+        # _loop1_105: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8219,9 +9904,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_105(self) -> Optional[Any]:
-        # _loop1_105: lambda_param_no_default
+    def _loop1_106(self) -> Optional[Any]:
+        # _loop1_106: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8232,9 +9916,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_106(self) -> Optional[Any]:
-        # _loop1_106: lambda_param_no_default
+    def _loop1_107(self) -> Optional[Any]:
+        # _loop1_107: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8245,9 +9928,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_107(self) -> Optional[Any]:
-        # _loop0_107: lambda_param_no_default
+    def _loop0_108(self) -> Optional[Any]:
+        # _loop0_108: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8258,9 +9940,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_108(self) -> Optional[Any]:
-        # _loop1_108: lambda_param_with_default
+    def _loop1_109(self) -> Optional[Any]:
+        # _loop1_109: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8271,9 +9952,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_109(self) -> Optional[Any]:
-        # _loop0_109: lambda_param_no_default
+    def _loop0_110(self) -> Optional[Any]:
+        # _loop0_110: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8284,9 +9964,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_110(self) -> Optional[Any]:
-        # _loop1_110: lambda_param_with_default
+    def _loop1_111(self) -> Optional[Any]:
+        # _loop1_111: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8297,9 +9976,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_111(self) -> Optional[Any]:
-        # _loop0_111: lambda_param_maybe_default
+    def _loop0_112(self) -> Optional[Any]:
+        # _loop0_112: lambda_param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -8310,9 +9988,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_112(self) -> Optional[Any]:
-        # _loop1_112: lambda_param_maybe_default
+    def _loop1_113(self) -> Optional[Any]:
+        # _loop1_113: lambda_param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -8323,22 +10000,20 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_113(self) -> Optional[Any]:
-        # _loop1_113: STRING
+    def _loop1_114(self) -> Optional[Any]:
+        # _loop1_114: STRING
         mark = self._mark()
         children = []
         while (
-            (string := self.string())
+            (string := self.terminal(tokenize.STRING))
         ):
             children.append(string)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_115(self) -> Optional[Any]:
-        # _loop0_115: separator double_starred_kvpair
+    def _loop0_116(self) -> Optional[Any]:
+        # _loop0_116: separator double_starred_kvpair
         mark = self._mark()
         children = []
         while (
@@ -8351,39 +10026,39 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_114(self) -> Optional[Any]:
-        # _gather_114: double_starred_kvpair _loop0_115
+    def _gather_115(self) -> Optional[Any]:
+        # _gather_115: double_starred_kvpair _loop0_116
         mark = self._mark()
         if (
             (elem := self.double_starred_kvpair())
             is not None
             and
-            (seq := self._loop0_115())
+            (seq := self._loop0_116())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_116(self) -> Optional[Any]:
-        # _tmp_116: INDENT double_starred_kvpairs DEDENT
+    def _tmp_117(self) -> Optional[Any]:
+        # _tmp_117: INDENT double_starred_kvpairs DEDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_95:
+            return None
         if (
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (double_starred_kvpairs := self.double_starred_kvpairs())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return [_indent, double_starred_kvpairs, _dedent]
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_118(self) -> Optional[Any]:
-        # _loop0_118: separator double_starred_kvpair
+    def _loop0_119(self) -> Optional[Any]:
+        # _loop0_119: separator double_starred_kvpair
         mark = self._mark()
         children = []
         while (
@@ -8396,24 +10071,22 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_117(self) -> Optional[Any]:
-        # _gather_117: double_starred_kvpair _loop0_118
+    def _gather_118(self) -> Optional[Any]:
+        # _gather_118: double_starred_kvpair _loop0_119
         mark = self._mark()
         if (
             (elem := self.double_starred_kvpair())
             is not None
             and
-            (seq := self._loop0_118())
+            (seq := self._loop0_119())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop1_119(self) -> Optional[Any]:
-        # _loop1_119: for_if_clause
+    def _loop1_120(self) -> Optional[Any]:
+        # _loop1_120: for_if_clause
         mark = self._mark()
         children = []
         while (
@@ -8424,37 +10097,39 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_120(self) -> Optional[Any]:
-        # _loop0_120: ('if' disjunction)
+    def _loop0_121(self) -> Optional[Any]:
+        # _loop0_121: ('if' disjunction)
         mark = self._mark()
         children = []
         while (
-            (_tmp_194 := self._tmp_194())
+            (_tmp_195 := self._tmp_195())
         ):
-            children.append(_tmp_194)
+            children.append(_tmp_195)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_121(self) -> Optional[Any]:
-        # _loop0_121: ('if' disjunction)
+    def _loop0_122(self) -> Optional[Any]:
+        # _loop0_122: ('if' disjunction)
         mark = self._mark()
         children = []
         while (
-            (_tmp_195 := self._tmp_195())
+            (_tmp_196 := self._tmp_196())
         ):
-            children.append(_tmp_195)
+            children.append(_tmp_196)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _tmp_122(self) -> Optional[Any]:
-        # _tmp_122: assignment_expression | expression !':='
+    def _tmp_123(self) -> Optional[Any]:
+        # _tmp_123: assignment_expression | expression !':='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
+            kind in FIRST_33
+            and
             (assignment_expression := self.assignment_expression())
         ):
             return assignment_expression
@@ -8462,63 +10137,65 @@ class ParseltongueParser(Parser):
         if (
             (expression := self.expression())
             and
-            self.negative_lookahead(self.expect, ':=')
+            self.negative_lookahead(self.terminal, KIND_COLONEQUAL)
         ):
             return expression
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_123(self) -> Optional[Any]:
-        # _tmp_123: INDENT args extra_separator DEDENT
+    def _tmp_124(self) -> Optional[Any]:
+        # _tmp_124: INDENT args extra_separator DEDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_95:
+            return None
         if (
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
             (x := self.args())
             and
             (extra_separator := self.extra_separator())
             and
-            (_dedent := self.expect('DEDENT'))
+            (_dedent := self.terminal(tokenize.DEDENT))
         ):
             return x
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_125(self) -> Optional[Any]:
-        # _loop0_125: separator (starred_expression | (assignment_expression | expression !':=') !'=')
+    def _loop0_126(self) -> Optional[Any]:
+        # _loop0_126: separator (starred_expression | (assignment_expression | expression !':=') !'=')
         mark = self._mark()
         children = []
         while (
             (separator := self.separator())
             and
-            (elem := self._tmp_196())
+            (elem := self._tmp_197())
         ):
             children.append(elem)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_124(self) -> Optional[Any]:
-        # _gather_124: (starred_expression | (assignment_expression | expression !':=') !'=') _loop0_125
+    def _gather_125(self) -> Optional[Any]:
+        # _gather_125: (starred_expression | (assignment_expression | expression !':=') !'=') _loop0_126
         mark = self._mark()
         if (
-            (elem := self._tmp_196())
+            (elem := self._tmp_197())
             is not None
             and
-            (seq := self._loop0_125())
+            (seq := self._loop0_126())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_126(self) -> Optional[Any]:
-        # _tmp_126: separator kwargs
+    def _tmp_127(self) -> Optional[Any]:
+        # _tmp_127: separator kwargs
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_54:
+            return None
         if (
             (separator := self.separator())
             and
@@ -8528,9 +10205,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_128(self) -> Optional[Any]:
-        # _loop0_128: separator kwarg_or_starred
+    def _loop0_129(self) -> Optional[Any]:
+        # _loop0_129: separator kwarg_or_starred
         mark = self._mark()
         children = []
         while (
@@ -8543,28 +10219,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_127(self) -> Optional[Any]:
-        # _gather_127: kwarg_or_starred _loop0_128
+    def _gather_128(self) -> Optional[Any]:
+        # _gather_128: kwarg_or_starred _loop0_129
         mark = self._mark()
         if (
             (elem := self.kwarg_or_starred())
             is not None
             and
-            (seq := self._loop0_128())
+            (seq := self._loop0_129())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_130(self) -> Optional[Any]:
-        # _loop0_130: ',' kwarg_or_double_starred
+    def _loop0_131(self) -> Optional[Any]:
+        # _loop0_131: ',' kwarg_or_double_starred
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.kwarg_or_double_starred())
         ):
@@ -8573,24 +10247,22 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_129(self) -> Optional[Any]:
-        # _gather_129: kwarg_or_double_starred _loop0_130
+    def _gather_130(self) -> Optional[Any]:
+        # _gather_130: kwarg_or_double_starred _loop0_131
         mark = self._mark()
         if (
             (elem := self.kwarg_or_double_starred())
             is not None
             and
-            (seq := self._loop0_130())
+            (seq := self._loop0_131())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_132(self) -> Optional[Any]:
-        # _loop0_132: separator kwarg_or_starred
+    def _loop0_133(self) -> Optional[Any]:
+        # _loop0_133: separator kwarg_or_starred
         mark = self._mark()
         children = []
         while (
@@ -8603,24 +10275,22 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_131(self) -> Optional[Any]:
-        # _gather_131: kwarg_or_starred _loop0_132
+    def _gather_132(self) -> Optional[Any]:
+        # _gather_132: kwarg_or_starred _loop0_133
         mark = self._mark()
         if (
             (elem := self.kwarg_or_starred())
             is not None
             and
-            (seq := self._loop0_132())
+            (seq := self._loop0_133())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_134(self) -> Optional[Any]:
-        # _loop0_134: separator kwarg_or_double_starred
+    def _loop0_135(self) -> Optional[Any]:
+        # _loop0_135: separator kwarg_or_double_starred
         mark = self._mark()
         children = []
         while (
@@ -8633,41 +10303,38 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_133(self) -> Optional[Any]:
-        # _gather_133: kwarg_or_double_starred _loop0_134
+    def _gather_134(self) -> Optional[Any]:
+        # _gather_134: kwarg_or_double_starred _loop0_135
         mark = self._mark()
         if (
             (elem := self.kwarg_or_double_starred())
             is not None
             and
-            (seq := self._loop0_134())
+            (seq := self._loop0_135())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_135(self) -> Optional[Any]:
-        # _loop0_135: (',' star_target)
+    def _loop0_136(self) -> Optional[Any]:
+        # _loop0_136: (',' star_target)
         mark = self._mark()
         children = []
         while (
-            (_tmp_197 := self._tmp_197())
+            (_tmp_198 := self._tmp_198())
         ):
-            children.append(_tmp_197)
+            children.append(_tmp_198)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_137(self) -> Optional[Any]:
-        # _loop0_137: ',' star_target
+    def _loop0_138(self) -> Optional[Any]:
+        # _loop0_138: ',' star_target
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.star_target())
         ):
@@ -8676,40 +10343,40 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_136(self) -> Optional[Any]:
-        # _gather_136: star_target _loop0_137
+    def _gather_137(self) -> Optional[Any]:
+        # _gather_137: star_target _loop0_138
         mark = self._mark()
         if (
             (elem := self.star_target())
             is not None
             and
-            (seq := self._loop0_137())
+            (seq := self._loop0_138())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop1_138(self) -> Optional[Any]:
-        # _loop1_138: (',' star_target)
+    def _loop1_139(self) -> Optional[Any]:
+        # _loop1_139: (',' star_target)
         mark = self._mark()
         children = []
         while (
-            (_tmp_198 := self._tmp_198())
+            (_tmp_199 := self._tmp_199())
         ):
-            children.append(_tmp_198)
+            children.append(_tmp_199)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _tmp_139(self) -> Optional[Any]:
-        # _tmp_139: !'*' star_target
+    def _tmp_140(self) -> Optional[Any]:
+        # _tmp_140: !'*' star_target
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_35:
+            return None
         if (
-            self.negative_lookahead(self.expect, '*')
+            self.negative_lookahead(self.terminal, KIND_STAR)
             and
             (star_target := self.star_target())
         ):
@@ -8717,13 +10384,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_141(self) -> Optional[Any]:
-        # _loop0_141: ',' del_target
+    def _loop0_142(self) -> Optional[Any]:
+        # _loop0_142: ',' del_target
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.del_target())
         ):
@@ -8732,28 +10398,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_140(self) -> Optional[Any]:
-        # _gather_140: del_target _loop0_141
+    def _gather_141(self) -> Optional[Any]:
+        # _gather_141: del_target _loop0_142
         mark = self._mark()
         if (
             (elem := self.del_target())
             is not None
             and
-            (seq := self._loop0_141())
+            (seq := self._loop0_142())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_143(self) -> Optional[Any]:
-        # _loop0_143: ',' expression
+    def _loop0_144(self) -> Optional[Any]:
+        # _loop0_144: ',' expression
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.expression())
         ):
@@ -8762,28 +10426,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_142(self) -> Optional[Any]:
-        # _gather_142: expression _loop0_143
+    def _gather_143(self) -> Optional[Any]:
+        # _gather_143: expression _loop0_144
         mark = self._mark()
         if (
             (elem := self.expression())
             is not None
             and
-            (seq := self._loop0_143())
+            (seq := self._loop0_144())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_145(self) -> Optional[Any]:
-        # _loop0_145: ',' expression
+    def _loop0_146(self) -> Optional[Any]:
+        # _loop0_146: ',' expression
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.expression())
         ):
@@ -8792,28 +10454,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_144(self) -> Optional[Any]:
-        # _gather_144: expression _loop0_145
+    def _gather_145(self) -> Optional[Any]:
+        # _gather_145: expression _loop0_146
         mark = self._mark()
         if (
             (elem := self.expression())
             is not None
             and
-            (seq := self._loop0_145())
+            (seq := self._loop0_146())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_147(self) -> Optional[Any]:
-        # _loop0_147: ',' expression
+    def _loop0_148(self) -> Optional[Any]:
+        # _loop0_148: ',' expression
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.expression())
         ):
@@ -8822,28 +10482,26 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_146(self) -> Optional[Any]:
-        # _gather_146: expression _loop0_147
+    def _gather_147(self) -> Optional[Any]:
+        # _gather_147: expression _loop0_148
         mark = self._mark()
         if (
             (elem := self.expression())
             is not None
             and
-            (seq := self._loop0_147())
+            (seq := self._loop0_148())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_149(self) -> Optional[Any]:
-        # _loop0_149: ',' expression
+    def _loop0_150(self) -> Optional[Any]:
+        # _loop0_150: ',' expression
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (elem := self.expression())
         ):
@@ -8852,44 +10510,49 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_148(self) -> Optional[Any]:
-        # _gather_148: expression _loop0_149
+    def _gather_149(self) -> Optional[Any]:
+        # _gather_149: expression _loop0_150
         mark = self._mark()
         if (
             (elem := self.expression())
             is not None
             and
-            (seq := self._loop0_149())
+            (seq := self._loop0_150())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_150(self) -> Optional[Any]:
-        # _tmp_150: NEWLINE INDENT
+    def _tmp_151(self) -> Optional[Any]:
+        # _tmp_151: NEWLINE INDENT
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_8:
+            return None
         if (
-            (_newline := self.expect('NEWLINE'))
+            (_newline := self.terminal(tokenize.NEWLINE))
             and
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
         ):
             return [_newline, _indent]
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_151(self) -> Optional[Any]:
-        # _tmp_151: args | expression for_if_clauses
+    def _tmp_152(self) -> Optional[Any]:
+        # _tmp_152: args | expression for_if_clauses
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_117:
+            return None
         if (
             (args := self.args())
         ):
             return args
         self._reset(mark)
         if (
+            kind in FIRST_2
+            and
             (expression := self.expression())
             and
             (for_if_clauses := self.for_if_clauses())
@@ -8898,27 +10561,31 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_152(self) -> Optional[Any]:
-        # _tmp_152: NAME '='
+    def _tmp_153(self) -> Optional[Any]:
+        # _tmp_153: NAME '='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (name := self.name())
             and
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
         ):
             return [name, literal]
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_153(self) -> Optional[Any]:
-        # _tmp_153: NAME STRING | SOFT_KEYWORD
+    def _tmp_154(self) -> Optional[Any]:
+        # _tmp_154: NAME STRING | SOFT_KEYWORD
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_33:
+            return None
         if (
             (name := self.name())
             and
-            (string := self.string())
+            (string := self.terminal(tokenize.STRING))
         ):
             return [name, string]
         self._reset(mark)
@@ -8929,93 +10596,124 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_154(self) -> Optional[Any]:
-        # _tmp_154: 'else' | ':'
+    def _tmp_155(self) -> Optional[Any]:
+        # _tmp_155: 'else' | ':'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_133:
+            return None
         if (
-            (literal := self.expect('else'))
+            kind in FIRST_71
+            and
+            (literal := self.terminal(KIND_else))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect(':'))
+            kind in FIRST_57
+            and
+            (literal := self.terminal(KIND_COLON))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_155(self) -> Optional[Any]:
-        # _tmp_155: '=' | ':='
+    def _tmp_156(self) -> Optional[Any]:
+        # _tmp_156: '=' | ':='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_134:
+            return None
         if (
-            (literal := self.expect('='))
+            kind in FIRST_69
+            and
+            (literal := self.terminal(KIND_EQUAL))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect(':='))
+            kind in FIRST_135
+            and
+            (literal := self.terminal(KIND_COLONEQUAL))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_156(self) -> Optional[Any]:
-        # _tmp_156: list | tuple | genexp | 'True' | 'None' | 'False'
+    def _tmp_157(self) -> Optional[Any]:
+        # _tmp_157: list | tuple | genexp | 'True' | 'None' | 'False'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_136:
+            return None
         if (
+            kind in FIRST_90
+            and
             (list := self.list())
         ):
             return list
         self._reset(mark)
         if (
+            kind in FIRST_3
+            and
             (tuple := self.tuple())
         ):
             return tuple
         self._reset(mark)
         if (
+            kind in FIRST_112
+            and
             (genexp := self.genexp())
         ):
             return genexp
         self._reset(mark)
         if (
-            (literal := self.expect('True'))
+            kind in FIRST_86
+            and
+            (literal := self.terminal(KIND_True))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('None'))
+            kind in FIRST_85
+            and
+            (literal := self.terminal(KIND_None))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('False'))
+            kind in FIRST_87
+            and
+            (literal := self.terminal(KIND_False))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_157(self) -> Optional[Any]:
-        # _tmp_157: '=' | ':='
+    def _tmp_158(self) -> Optional[Any]:
+        # _tmp_158: '=' | ':='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_134:
+            return None
         if (
-            (literal := self.expect('='))
+            kind in FIRST_69
+            and
+            (literal := self.terminal(KIND_EQUAL))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect(':='))
+            kind in FIRST_135
+            and
+            (literal := self.terminal(KIND_COLONEQUAL))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_158(self) -> Optional[Any]:
-        # _loop0_158: star_named_expressions
+    def _loop0_159(self) -> Optional[Any]:
+        # _loop0_159: star_named_expressions
         mark = self._mark()
         children = []
         while (
@@ -9026,104 +10724,127 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_159(self) -> Optional[Any]:
-        # _loop0_159: (star_targets '=')
+    def _loop0_160(self) -> Optional[Any]:
+        # _loop0_160: (star_targets '=')
         mark = self._mark()
         children = []
         while (
-            (_tmp_199 := self._tmp_199())
+            (_tmp_200 := self._tmp_200())
         ):
-            children.append(_tmp_199)
+            children.append(_tmp_200)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_160(self) -> Optional[Any]:
-        # _loop0_160: (star_targets '=')
+    def _loop0_161(self) -> Optional[Any]:
+        # _loop0_161: (star_targets '=')
         mark = self._mark()
         children = []
         while (
-            (_tmp_200 := self._tmp_200())
+            (_tmp_201 := self._tmp_201())
         ):
-            children.append(_tmp_200)
+            children.append(_tmp_201)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _tmp_161(self) -> Optional[Any]:
-        # _tmp_161: yield_expr | star_expressions
+    def _tmp_162(self) -> Optional[Any]:
+        # _tmp_162: yield_expr | star_expressions
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_10:
+            return None
         if (
+            kind in FIRST_16
+            and
             (yield_expr := self.yield_expr())
         ):
             return yield_expr
         self._reset(mark)
         if (
+            kind in FIRST_4
+            and
             (star_expressions := self.star_expressions())
         ):
             return star_expressions
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_162(self) -> Optional[Any]:
-        # _tmp_162: '[' | '(' | '{'
+    def _tmp_163(self) -> Optional[Any]:
+        # _tmp_163: '[' | '(' | '{'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_112:
+            return None
         if (
-            (literal := self.expect('['))
+            kind in FIRST_90
+            and
+            (literal := self.terminal(KIND_LSQB))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('('))
+            kind in FIRST_3
+            and
+            (literal := self.terminal(KIND_LPAR))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('{'))
+            kind in FIRST_82
+            and
+            (literal := self.terminal(KIND_LBRACE))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_163(self) -> Optional[Any]:
-        # _tmp_163: '[' | '{'
+    def _tmp_164(self) -> Optional[Any]:
+        # _tmp_164: '[' | '{'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_123:
+            return None
         if (
-            (literal := self.expect('['))
+            kind in FIRST_90
+            and
+            (literal := self.terminal(KIND_LSQB))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('{'))
+            kind in FIRST_82
+            and
+            (literal := self.terminal(KIND_LBRACE))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_164(self) -> Optional[Any]:
-        # _tmp_164: '[' | '{'
+    def _tmp_165(self) -> Optional[Any]:
+        # _tmp_165: '[' | '{'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_123:
+            return None
         if (
-            (literal := self.expect('['))
+            kind in FIRST_90
+            and
+            (literal := self.terminal(KIND_LSQB))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('{'))
+            kind in FIRST_82
+            and
+            (literal := self.terminal(KIND_LBRACE))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_165(self) -> Optional[Any]:
-        # _loop0_165: param_no_default
+    def _loop0_166(self) -> Optional[Any]:
+        # _loop0_166: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -9134,9 +10855,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_166(self) -> Optional[Any]:
-        # _loop1_166: param_with_default
+    def _loop1_167(self) -> Optional[Any]:
+        # _loop1_167: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -9147,9 +10867,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop0_167(self) -> Optional[Any]:
-        # _loop0_167: lambda_param_no_default
+    def _loop0_168(self) -> Optional[Any]:
+        # _loop0_168: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -9160,9 +10879,8 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _loop1_168(self) -> Optional[Any]:
-        # _loop1_168: lambda_param_with_default
+    def _loop1_169(self) -> Optional[Any]:
+        # _loop1_169: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -9173,150 +10891,176 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return children
 
-    @memoize
-    def _tmp_169(self) -> Optional[Any]:
-        # _tmp_169: ')' | ',' (')' | '**')
+    def _tmp_170(self) -> Optional[Any]:
+        # _tmp_170: ')' | ',' (')' | '**')
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_137:
+            return None
         if (
-            (literal := self.expect(')'))
+            kind in FIRST_129
+            and
+            (literal := self.terminal(KIND_RPAR))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect(','))
+            kind in FIRST_55
             and
-            (_tmp_201 := self._tmp_201())
+            (literal := self.terminal(KIND_COMMA))
+            and
+            (_tmp_202 := self._tmp_202())
         ):
-            return [literal, _tmp_201]
+            return [literal, _tmp_202]
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_170(self) -> Optional[Any]:
-        # _tmp_170: ':' | ',' (':' | '**')
+    def _tmp_171(self) -> Optional[Any]:
+        # _tmp_171: ':' | ',' (':' | '**')
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_138:
+            return None
         if (
-            (literal := self.expect(':'))
+            kind in FIRST_57
+            and
+            (literal := self.terminal(KIND_COLON))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect(','))
+            kind in FIRST_55
             and
-            (_tmp_202 := self._tmp_202())
+            (literal := self.terminal(KIND_COMMA))
+            and
+            (_tmp_203 := self._tmp_203())
         ):
-            return [literal, _tmp_202]
+            return [literal, _tmp_203]
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_171(self) -> Optional[Any]:
-        # _tmp_171: ',' | ')' | ':' | NEWLINE
+    def _tmp_172(self) -> Optional[Any]:
+        # _tmp_172: ',' | ')' | ':' | NEWLINE
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_128:
+            return None
         if (
-            (literal := self.expect(','))
+            kind in FIRST_55
+            and
+            (literal := self.terminal(KIND_COMMA))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect(')'))
+            kind in FIRST_129
+            and
+            (literal := self.terminal(KIND_RPAR))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect(':'))
+            kind in FIRST_57
+            and
+            (literal := self.terminal(KIND_COLON))
         ):
             return literal
         self._reset(mark)
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
+            and
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return _newline
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_173(self) -> Optional[Any]:
-        # _loop0_173: ',' (expression ['as' star_target])
+    def _loop0_174(self) -> Optional[Any]:
+        # _loop0_174: ',' (expression ['as' star_target])
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
-            (elem := self._tmp_203())
+            (elem := self._tmp_204())
         ):
             children.append(elem)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_172(self) -> Optional[Any]:
-        # _gather_172: (expression ['as' star_target]) _loop0_173
+    def _gather_173(self) -> Optional[Any]:
+        # _gather_173: (expression ['as' star_target]) _loop0_174
         mark = self._mark()
         if (
-            (elem := self._tmp_203())
+            (elem := self._tmp_204())
             is not None
             and
-            (seq := self._loop0_173())
+            (seq := self._loop0_174())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_175(self) -> Optional[Any]:
-        # _loop0_175: ',' (expressions ['as' star_target])
+    def _loop0_176(self) -> Optional[Any]:
+        # _loop0_176: ',' (expressions ['as' star_target])
         mark = self._mark()
         children = []
         while (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
-            (elem := self._tmp_204())
+            (elem := self._tmp_205())
         ):
             children.append(elem)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _gather_174(self) -> Optional[Any]:
-        # _gather_174: (expressions ['as' star_target]) _loop0_175
+    def _gather_175(self) -> Optional[Any]:
+        # _gather_175: (expressions ['as' star_target]) _loop0_176
         mark = self._mark()
         if (
-            (elem := self._tmp_204())
+            (elem := self._tmp_205())
             is not None
             and
-            (seq := self._loop0_175())
+            (seq := self._loop0_176())
             is not None
         ):
             return [elem] + seq
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_176(self) -> Optional[Any]:
-        # _tmp_176: 'except' | 'finally'
+    def _tmp_177(self) -> Optional[Any]:
+        # _tmp_177: 'except' | 'finally'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_139:
+            return None
         if (
-            (literal := self.expect('except'))
+            kind in FIRST_74
+            and
+            (literal := self.terminal(KIND_except))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('finally'))
+            kind in FIRST_75
+            and
+            (literal := self.terminal(KIND_finally))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_177(self) -> Optional[Any]:
-        # _tmp_177: 'as' NAME
+    def _tmp_178(self) -> Optional[Any]:
+        # _tmp_178: 'as' NAME
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_126:
+            return None
         if (
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             (name := self.name())
         ):
@@ -9324,28 +11068,36 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_178(self) -> Optional[Any]:
-        # _tmp_178: ':' | NEWLINE
+    def _tmp_179(self) -> Optional[Any]:
+        # _tmp_179: ':' | NEWLINE
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_56:
+            return None
         if (
-            (literal := self.expect(':'))
+            kind in FIRST_57
+            and
+            (literal := self.terminal(KIND_COLON))
         ):
             return literal
         self._reset(mark)
         if (
-            (_newline := self.expect('NEWLINE'))
+            kind in FIRST_8
+            and
+            (_newline := self.terminal(tokenize.NEWLINE))
         ):
             return _newline
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_179(self) -> Optional[Any]:
-        # _tmp_179: 'as' NAME
+    def _tmp_180(self) -> Optional[Any]:
+        # _tmp_180: 'as' NAME
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_126:
+            return None
         if (
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             (name := self.name())
         ):
@@ -9353,25 +11105,29 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_180(self) -> Optional[Any]:
-        # _tmp_180: positional_patterns ','
+    def _tmp_181(self) -> Optional[Any]:
+        # _tmp_181: positional_patterns ','
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_78:
+            return None
         if (
             (positional_patterns := self.positional_patterns())
             and
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
         ):
             return [positional_patterns, literal]
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_181(self) -> Optional[Any]:
-        # _tmp_181: '->' expression
+    def _tmp_182(self) -> Optional[Any]:
+        # _tmp_182: '->' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_127:
+            return None
         if (
-            (literal := self.expect('->'))
+            (literal := self.terminal(KIND_RARROW))
             and
             (expression := self.expression())
         ):
@@ -9379,127 +11135,151 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_182(self) -> Optional[Any]:
-        # _tmp_182: '(' arguments? ')'
+    def _tmp_183(self) -> Optional[Any]:
+        # _tmp_183: '(' arguments? ')'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_3:
+            return None
         if (
-            (literal := self.expect('('))
+            (literal := self.terminal(KIND_LPAR))
             and
             (opt := self.arguments(),)
             and
-            (literal_1 := self.expect(')'))
+            (literal_1 := self.terminal(KIND_RPAR))
         ):
             return [literal, opt, literal_1]
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop1_183(self) -> Optional[Any]:
-        # _loop1_183: (double_starred_kvpair separator)
+    def _loop1_184(self) -> Optional[Any]:
+        # _loop1_184: (double_starred_kvpair separator)
         mark = self._mark()
         children = []
         while (
-            (_tmp_205 := self._tmp_205())
+            (_tmp_206 := self._tmp_206())
         ):
-            children.append(_tmp_205)
+            children.append(_tmp_206)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _tmp_184(self) -> Optional[Any]:
-        # _tmp_184: INDENT ((double_starred_kvpair separator))*
+    def _tmp_185(self) -> Optional[Any]:
+        # _tmp_185: INDENT ((double_starred_kvpair separator))*
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_95:
+            return None
         if (
-            (_indent := self.expect('INDENT'))
+            (_indent := self.terminal(tokenize.INDENT))
             and
-            (_loop0_206 := self._loop0_206(),)
+            (_loop0_207 := self._loop0_207(),)
         ):
-            return [_indent, _loop0_206]
+            return [_indent, _loop0_207]
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop1_185(self) -> Optional[Any]:
-        # _loop1_185: (double_starred_kvpair separator)
+    def _loop1_186(self) -> Optional[Any]:
+        # _loop1_186: (double_starred_kvpair separator)
         mark = self._mark()
         children = []
         while (
-            (_tmp_207 := self._tmp_207())
+            (_tmp_208 := self._tmp_208())
         ):
-            children.append(_tmp_207)
+            children.append(_tmp_208)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _tmp_186(self) -> Optional[Any]:
-        # _tmp_186: '}' | ','
+    def _tmp_187(self) -> Optional[Any]:
+        # _tmp_187: '}' | ','
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_140:
+            return None
         if (
-            (literal := self.expect('}'))
+            kind in FIRST_141
+            and
+            (literal := self.terminal(KIND_RBRACE))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect(','))
+            kind in FIRST_55
+            and
+            (literal := self.terminal(KIND_COMMA))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_187(self) -> Optional[Any]:
-        # _tmp_187: star_targets '='
+    def _tmp_188(self) -> Optional[Any]:
+        # _tmp_188: star_targets '='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_35:
+            return None
         if (
             (z := self.star_targets())
             and
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
         ):
             return z
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_188(self) -> Optional[Any]:
-        # _tmp_188: '.' | '...'
+    def _tmp_189(self) -> Optional[Any]:
+        # _tmp_189: '.' | '...'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_142:
+            return None
         if (
-            (literal := self.expect('.'))
+            kind in FIRST_120
+            and
+            (literal := self.terminal(KIND_DOT))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('...'))
+            kind in FIRST_113
+            and
+            (literal := self.terminal(KIND_ELLIPSIS))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_189(self) -> Optional[Any]:
-        # _tmp_189: '.' | '...'
+    def _tmp_190(self) -> Optional[Any]:
+        # _tmp_190: '.' | '...'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_142:
+            return None
         if (
-            (literal := self.expect('.'))
+            kind in FIRST_120
+            and
+            (literal := self.terminal(KIND_DOT))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('...'))
+            kind in FIRST_113
+            and
+            (literal := self.terminal(KIND_ELLIPSIS))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_190(self) -> Optional[Any]:
-        # _tmp_190: ',' expression
+    def _tmp_191(self) -> Optional[Any]:
+        # _tmp_191: ',' expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_55:
+            return None
         if (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (c := self.expression())
         ):
@@ -9507,12 +11287,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_191(self) -> Optional[Any]:
-        # _tmp_191: ',' star_expression
+    def _tmp_192(self) -> Optional[Any]:
+        # _tmp_192: ',' star_expression
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_55:
+            return None
         if (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (c := self.star_expression())
         ):
@@ -9520,12 +11302,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_192(self) -> Optional[Any]:
-        # _tmp_192: 'or' conjunction
+    def _tmp_193(self) -> Optional[Any]:
+        # _tmp_193: 'or' conjunction
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_143:
+            return None
         if (
-            (literal := self.expect('or'))
+            (literal := self.terminal(KIND_or))
             and
             (c := self.conjunction())
         ):
@@ -9533,12 +11317,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_193(self) -> Optional[Any]:
-        # _tmp_193: 'and' inversion
+    def _tmp_194(self) -> Optional[Any]:
+        # _tmp_194: 'and' inversion
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_144:
+            return None
         if (
-            (literal := self.expect('and'))
+            (literal := self.terminal(KIND_and))
             and
             (c := self.inversion())
         ):
@@ -9546,12 +11332,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_194(self) -> Optional[Any]:
-        # _tmp_194: 'if' disjunction
+    def _tmp_195(self) -> Optional[Any]:
+        # _tmp_195: 'if' disjunction
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_23:
+            return None
         if (
-            (literal := self.expect('if'))
+            (literal := self.terminal(KIND_if))
             and
             (z := self.disjunction())
         ):
@@ -9559,12 +11347,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_195(self) -> Optional[Any]:
-        # _tmp_195: 'if' disjunction
+    def _tmp_196(self) -> Optional[Any]:
+        # _tmp_196: 'if' disjunction
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_23:
+            return None
         if (
-            (literal := self.expect('if'))
+            (literal := self.terminal(KIND_if))
             and
             (z := self.disjunction())
         ):
@@ -9572,30 +11362,38 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_196(self) -> Optional[Any]:
-        # _tmp_196: starred_expression | (assignment_expression | expression !':=') !'='
+    def _tmp_197(self) -> Optional[Any]:
+        # _tmp_197: starred_expression | (assignment_expression | expression !':=') !'='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_4:
+            return None
         if (
+            kind in FIRST_53
+            and
             (starred_expression := self.starred_expression())
         ):
             return starred_expression
         self._reset(mark)
         if (
-            (_tmp_208 := self._tmp_208())
+            kind in FIRST_2
+            and
+            (_tmp_209 := self._tmp_209())
             and
-            self.negative_lookahead(self.expect, '=')
+            self.negative_lookahead(self.terminal, KIND_EQUAL)
         ):
-            return _tmp_208
+            return _tmp_209
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_197(self) -> Optional[Any]:
-        # _tmp_197: ',' star_target
+    def _tmp_198(self) -> Optional[Any]:
+        # _tmp_198: ',' star_target
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_55:
+            return None
         if (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (c := self.star_target())
         ):
@@ -9603,12 +11401,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_198(self) -> Optional[Any]:
-        # _tmp_198: ',' star_target
+    def _tmp_199(self) -> Optional[Any]:
+        # _tmp_199: ',' star_target
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_55:
+            return None
         if (
-            (literal := self.expect(','))
+            (literal := self.terminal(KIND_COMMA))
             and
             (c := self.star_target())
         ):
@@ -9616,94 +11416,116 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_199(self) -> Optional[Any]:
-        # _tmp_199: star_targets '='
+    def _tmp_200(self) -> Optional[Any]:
+        # _tmp_200: star_targets '='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_35:
+            return None
         if (
             (star_targets := self.star_targets())
             and
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
         ):
             return [star_targets, literal]
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_200(self) -> Optional[Any]:
-        # _tmp_200: star_targets '='
+    def _tmp_201(self) -> Optional[Any]:
+        # _tmp_201: star_targets '='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_35:
+            return None
         if (
             (star_targets := self.star_targets())
             and
-            (literal := self.expect('='))
+            (literal := self.terminal(KIND_EQUAL))
         ):
             return [star_targets, literal]
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_201(self) -> Optional[Any]:
-        # _tmp_201: ')' | '**'
+    def _tmp_202(self) -> Optional[Any]:
+        # _tmp_202: ')' | '**'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_145:
+            return None
         if (
-            (literal := self.expect(')'))
+            kind in FIRST_129
+            and
+            (literal := self.terminal(KIND_RPAR))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('**'))
+            kind in FIRST_68
+            and
+            (literal := self.terminal(KIND_DOUBLESTAR))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_202(self) -> Optional[Any]:
-        # _tmp_202: ':' | '**'
+    def _tmp_203(self) -> Optional[Any]:
+        # _tmp_203: ':' | '**'
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_146:
+            return None
         if (
-            (literal := self.expect(':'))
+            kind in FIRST_57
+            and
+            (literal := self.terminal(KIND_COLON))
         ):
             return literal
         self._reset(mark)
         if (
-            (literal := self.expect('**'))
+            kind in FIRST_68
+            and
+            (literal := self.terminal(KIND_DOUBLESTAR))
         ):
             return literal
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_203(self) -> Optional[Any]:
-        # _tmp_203: expression ['as' star_target]
+    def _tmp_204(self) -> Optional[Any]:
+        # _tmp_204: expression ['as' star_target]
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
             (expression := self.expression())
             and
-            (opt := self._tmp_209(),)
+            (opt := self._tmp_210(),)
         ):
             return [expression, opt]
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_204(self) -> Optional[Any]:
-        # _tmp_204: expressions ['as' star_target]
+    def _tmp_205(self) -> Optional[Any]:
+        # _tmp_205: expressions ['as' star_target]
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
             (expressions := self.expressions())
             and
-            (opt := self._tmp_210(),)
+            (opt := self._tmp_211(),)
         ):
             return [expressions, opt]
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_205(self) -> Optional[Any]:
-        # _tmp_205: double_starred_kvpair separator
+    def _tmp_206(self) -> Optional[Any]:
+        # _tmp_206: double_starred_kvpair separator
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_115:
+            return None
         if (
             (double_starred_kvpair := self.double_starred_kvpair())
             and
@@ -9713,23 +11535,24 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _loop0_206(self) -> Optional[Any]:
-        # _loop0_206: (double_starred_kvpair separator)
+    def _loop0_207(self) -> Optional[Any]:
+        # _loop0_207: (double_starred_kvpair separator)
         mark = self._mark()
         children = []
         while (
-            (_tmp_211 := self._tmp_211())
+            (_tmp_212 := self._tmp_212())
         ):
-            children.append(_tmp_211)
+            children.append(_tmp_212)
             mark = self._mark()
         self._reset(mark)
         return children
 
-    @memoize
-    def _tmp_207(self) -> Optional[Any]:
-        # _tmp_207: double_starred_kvpair separator
+    def _tmp_208(self) -> Optional[Any]:
+        # _tmp_208: double_starred_kvpair separator
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_115:
+            return None
         if (
             (double_starred_kvpair := self.double_starred_kvpair())
             and
@@ -9739,11 +11562,15 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_208(self) -> Optional[Any]:
-        # _tmp_208: assignment_expression | expression !':='
+    def _tmp_209(self) -> Optional[Any]:
+        # _tmp_209: assignment_expression | expression !':='
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_2:
+            return None
         if (
+            kind in FIRST_33
+            and
             (assignment_expression := self.assignment_expression())
         ):
             return assignment_expression
@@ -9751,18 +11578,20 @@ class ParseltongueParser(Parser):
         if (
             (expression := self.expression())
             and
-            self.negative_lookahead(self.expect, ':=')
+            self.negative_lookahead(self.terminal, KIND_COLONEQUAL)
         ):
             return expression
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_209(self) -> Optional[Any]:
-        # _tmp_209: 'as' star_target
+    def _tmp_210(self) -> Optional[Any]:
+        # _tmp_210: 'as' star_target
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_126:
+            return None
         if (
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             (star_target := self.star_target())
         ):
@@ -9770,12 +11599,14 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_210(self) -> Optional[Any]:
-        # _tmp_210: 'as' star_target
+    def _tmp_211(self) -> Optional[Any]:
+        # _tmp_211: 'as' star_target
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_126:
+            return None
         if (
-            (literal := self.expect('as'))
+            (literal := self.terminal(KIND_as))
             and
             (star_target := self.star_target())
         ):
@@ -9783,10 +11614,12 @@ class ParseltongueParser(Parser):
         self._reset(mark)
         return None
 
-    @memoize
-    def _tmp_211(self) -> Optional[Any]:
-        # _tmp_211: double_starred_kvpair separator
+    def _tmp_212(self) -> Optional[Any]:
+        # _tmp_212: double_starred_kvpair separator
         mark = self._mark()
+        kind = self._tokenizer.peek_kind()
+        if kind not in FIRST_115:
+            return None
         if (
             (double_starred_kvpair := self.double_starred_kvpair())
             and
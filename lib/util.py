@@ -1,13 +1,77 @@
-import os
+import contextlib, mmap, os, tempfile
+
+def map_file(filename):
+    """Memory-map given filename read-only, or read it if it can't be mapped
+  (e.g. empty files)
+  """
+    with open(filename, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return f.read()
+
+@contextlib.contextmanager
+def source_bytes(filename, mapped=True):
+    """Context manager giving the contents of given filename, memory-mapped
+  (see `map_file`) or else read as bytes, and closing any mapping on exit.
+  Mapping avoids copying the file, but if the file gets truncated while
+  mapped, reading the lost pages kills the process (SIGBUS), so don't map
+  files that may get rewritten meanwhile.
+  """
+    if mapped:
+        source = map_file(filename)
+    else:
+        with open(filename, 'rb') as f:
+            source = f.read()
+    try:
+        yield source
+    finally:
+        if isinstance(source, mmap.mmap):
+            source.close()
 
 def detect_newline(filename):
     """Detect newline character sequence in given filename by reading first line
   """
     with open(filename, 'rb') as f:
-        line = f.readline()
-        for newline in [b'\r\n', b'\n', b'\r']:
-            if line.endswith(newline):
-                return newline.decode('ascii')
+        return detect_newline_bytes(f.readline())
+
+def detect_newline_bytes(data):
+    """Detect newline character sequence from first line of given bytes
+  """
+    line = data[:data.find(b'\n') + 1 or len(data)]
+    for newline in [b'\r\n', b'\n', b'\r']:
+        if line.endswith(newline):
+            return newline.decode('ascii')
+
+def read_bytes(filename):
+    """Contents of given filename as bytes, or None if it doesn't exist
+  """
+    try:
+        with open(filename, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def write_atomic(filename, data, mode_filename=None):
+    """Replace the contents of given filename with given bytes, by writing
+  a temporary file in the same directory and renaming it into place, so
+  readers never see a partially written file.  If `mode_filename` is given,
+  the new file gets its permissions (see `copy_mode`).
+  """
+    (directory, basename) = os.path.split(filename)
+    (fd, temp) = tempfile.mkstemp(dir=directory or '.', prefix='.' + basename + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if mode_filename is not None:
+            copy_mode(mode_filename, temp)
+        os.replace(temp, filename)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+        raise
 
 def copy_mode(old_filename, new_filename):
     os.chmod(new_filename, os.stat(old_filename).st_mode)
@@ -0,0 +1,76 @@
+import os, time
+POLL_INTERVAL = 0.5
+SETTLE_DELAY = 0.05
+
+def pt_files(directory):
+    """All Parseltongue (.pt) files within given directory, recursively"""
+    for (root, dirs, files) in os.walk(directory):
+        for filename in files:
+            if filename.endswith('.pt'):
+                yield os.path.join(root, filename)
+
+def changes(directory):
+    """Generate lists of .pt files within given directory that have been
+  created or modified, as they change.  Uses inotify (via the optional
+  inotify_simple package) when available, else polls file stats."""
+    try:
+        import inotify_simple
+    except ImportError:
+        return poll_changes(directory)
+    try:
+        return inotify_changes(directory, inotify_simple)
+    except OSError:
+        return poll_changes(directory)
+
+def poll_changes(directory, interval=POLL_INTERVAL):
+
+    def snapshot():
+        stats = {}
+        for filename in pt_files(directory):
+            try:
+                stat = os.stat(filename)
+            except FileNotFoundError:
+                continue
+            stats[filename] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def generate(stats):
+        while True:
+            time.sleep(interval)
+            new_stats = snapshot()
+            changed = [filename for (filename, stat) in new_stats.items() if stats.get(filename) != stat]
+            stats = new_stats
+            if changed:
+                yield changed
+    return generate(snapshot())
+
+def inotify_changes(directory, inotify_simple):
+    flags = inotify_simple.flags
+    mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE
+    inotify = inotify_simple.INotify()
+    directories = {}
+
+    def watch(root):
+        for (subdir, dirs, files) in os.walk(root):
+            directories[inotify.add_watch(subdir, mask)] = subdir
+
+    def generate():
+        with inotify:
+            while True:
+                changed = []
+                for event in inotify.read(read_delay=SETTLE_DELAY * 1000):
+                    path = os.path.join(directories.get(event.wd, directory), event.name)
+                    if event.mask & flags.ISDIR:
+                        if event.mask & (flags.CREATE | flags.MOVED_TO):
+                            watch(path)
+                            changed.extend(pt_files(path))
+                    elif event.mask & (flags.CLOSE_WRITE | flags.MOVED_TO) and path.endswith('.pt') and (path not in changed):
+                        changed.append(path)
+                if changed:
+                    yield changed
+    try:
+        watch(directory)
+    except OSError:
+        inotify.close()
+        raise
+    return generate()
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3.9
 
-import glob, importlib, os, shutil, subprocess, sys
+import argparse, ast, collections, glob, importlib, io, os, shutil, subprocess, sys, token
 
 ROOT_DIR = os.path.relpath(os.path.dirname(__file__))
 SRC_DIR = os.path.join(ROOT_DIR, 'src')
@@ -13,11 +13,29 @@ PEGEN_COPY_DEST = os.path.join(BUILD_DIR, 'pegen')
 GRAMMAR_INPUT = os.path.join(SRC_DIR, 'parseltongue.gram')
 GRAMMAR_OUTPUT = os.path.join(BUILD_DIR, 'parse.py')
 
+# Memoization policy for generated parser rules; see memoized_rules
+MEMOIZE_POLICIES = ['all', 'none', 'profile']
+MEMOIZE_DEFAULT = 'profile'
+MEMOIZE_THRESHOLD = 0.1
+MEMOIZE_CORPUS = os.path.join(SRC_DIR, '*.pt')
+
+# Rules that parse by precedence climbing when the parser's
+# `precedence_climbing` is set, and the methods (in the grammar's
+# subheader) that do it
+CLIMBING_RULES = {'disjunction': 'climb_disjunction'}
+
 sys.path.insert(0, PEGEN_PATH)
-import pegen.__main__ as pegen
+from pegen.build import build_parser
+from pegen.grammar import Alt, Cut, Forced, Gather, GrammarVisitor, Group, \
+  Lookahead, NamedItem, NameLeaf, Opt, Repeat, Repeat0, Repeat1, Rhs, StringLeaf
+from pegen.python_generator import PythonCallMakerVisitor, PythonParserGenerator
 
 sys.path.insert(0, BUILD_DIR)
-import util
+import memo, util
+
+# Token-level rules (name, expect, ...) that memo.Parser memoizes
+TOKEN_RULES = [name for name, value in vars(memo.Parser).items()
+  if hasattr(value, '__wrapped__')]
 
 def need_build(dest, srcs):
   if isinstance(srcs, str): srcs = [srcs]
@@ -57,12 +75,440 @@ def run_python_main(main, argv):
   with new_argv(argv):
     return main()
 
-def make_grammar():
-  if need_build(GRAMMAR_OUTPUT, [GRAMMAR_INPUT] +
+# Token-level grammar names, and the token types they match
+TOKEN_TYPES = {
+  'NAME': token.NAME,
+  'NUMBER': token.NUMBER,
+  'STRING': token.STRING,
+  'OP': token.OP,
+  'TYPE_COMMENT': token.TYPE_COMMENT,
+  'SOFT_KEYWORD': token.NAME,
+}
+
+class Terminals(GrammarVisitor):
+  '''Strings that a grammar matches as terminals (keywords, soft keywords
+  and operators), each mapped to whether it's a soft keyword'''
+
+  def __init__(self, grammar):
+    self.strings = {}
+    for rule in grammar.rules.values():
+      self.visit(rule)
+
+  def visit_StringLeaf(self, node):
+    string = ast.literal_eval(node.value)
+    self.strings[string] = string.isidentifier() and node.value.endswith('"')
+
+  def keywords(self):
+    return sorted(string for string in self.strings if string.isidentifier())
+
+  def soft_keywords(self):
+    return sorted(string for string, soft in self.strings.items() if soft)
+
+  def operators(self):
+    return sorted(string for string in self.strings
+      if not string.isidentifier())
+
+def kind_name(string):
+  '''Name of the generated constant holding a terminal's kind id'''
+  if string.isidentifier():
+    return f'KIND_{string}'
+  elif string in token.EXACT_TOKEN_TYPES:
+    return f'KIND_{token.tok_name[token.EXACT_TOKEN_TYPES[string]]}'
+  return 'KIND_OP_' + '_'.join(f'{ord(char):X}' for char in string)
+
+class KindCallMaker(PythonCallMakerVisitor):
+  '''pegen's call maker, but matching terminals (literal strings and token
+  names like NEWLINE, NUMBER or STRING) with memo.Parser.terminal,
+  by kind id, instead of with `expect` or the memoized token rules'''
+
+  def visit_NameLeaf(self, node):
+    name, call = super().visit_NameLeaf(node)
+    if node.value in ('NEWLINE', 'DEDENT', 'INDENT', 'ENDMARKER', 'ASYNC',
+        'AWAIT', 'NUMBER', 'STRING'):
+      call = f'self.terminal(tokenize.{node.value})'
+    return name, call
+
+  def visit_StringLeaf(self, node):
+    name, call = super().visit_StringLeaf(node)
+    return name, f'self.terminal({kind_name(ast.literal_eval(node.value))})'
+
+  def visit_Forced(self, node):
+    if isinstance(node.node, Group):
+      return super().visit_Forced(node)
+    _, call = self.visit(node.node)
+    return 'forced', f'self.expect_forced({call}, {node.node.value!r})'
+
+class FirstSets:
+  '''FIRST sets of a grammar's rules and alternatives.  A FIRST set holds
+  the token types (ints) and terminal strings (strs) that can start
+  a match.  Tokens that spell a terminal count only as that terminal,
+  as in the kind ids that the lexer assigns (see lexer.SymbolTable).
+  Also computes which rules are nullable (can match without consuming any
+  tokens), and which may have effects (raise an error) while failing or
+  matching nothing, so that skipping them would change the parse.'''
+
+  def __init__(self, rules):
+    self.rules = rules
+    self.nullable = dict.fromkeys(rules, False)
+    self.effects = dict.fromkeys(rules, False)
+    self.first = {name: frozenset() for name in rules}
+    for table, compute in [
+        (self.nullable, self.is_nullable),
+        (self.effects, self.has_effects),
+        (self.first, self.first_set)]:
+      # Iterate to a fixed point, as rules can be (left) recursive.
+      changed = True
+      while changed:
+        changed = False
+        for name, rule in rules.items():
+          value = compute(rule.rhs)
+          if value != table[name]:
+            table[name] = value
+            changed = True
+
+  def is_nullable(self, node):
+    if isinstance(node, NameLeaf):
+      return self.nullable.get(node.value, False)
+    elif isinstance(node, StringLeaf):
+      return False
+    elif isinstance(node, (Opt, Repeat0, Lookahead, Cut)):
+      return True
+    elif isinstance(node, (Repeat1, Gather, Forced)):
+      return self.is_nullable(node.node)
+    elif isinstance(node, Group):
+      return self.is_nullable(node.rhs)
+    elif isinstance(node, Rhs):
+      return any(self.is_nullable(alt) for alt in node.alts)
+    elif isinstance(node, Alt):
+      return all(self.is_nullable(item) for item in node.items)
+    elif isinstance(node, NamedItem):
+      return self.is_nullable(node.item)
+    raise TypeError(f'unexpected grammar node {node!r}')
+
+  def prefix(self, alt):
+    '''Items of an alternative that get tried on its first token: up to and
+    including the first one that can't match without consuming a token'''
+    for item in alt.items:
+      yield item.item
+      if not self.is_nullable(item):
+        break
+
+  def has_effects(self, node):
+    if isinstance(node, NameLeaf):
+      return self.effects.get(node.value, False)
+    elif isinstance(node, (StringLeaf, Cut)):
+      return False  # a cut only affects its own rule
+    elif isinstance(node, Forced):
+      return True
+    elif isinstance(node, Gather):
+      return self.has_effects(node.node) or self.has_effects(node.separator)
+    elif isinstance(node, (Opt, Repeat, Lookahead)):
+      return self.has_effects(node.node)
+    elif isinstance(node, Group):
+      return self.has_effects(node.rhs)
+    elif isinstance(node, Rhs):
+      return any(self.has_effects(alt) for alt in node.alts)
+    elif isinstance(node, Alt):
+      if any(self.has_effects(item) for item in self.prefix(node)):
+        return True
+      # Matching nothing runs the action, which might raise.
+      return self.is_nullable(node) and node.action is not None and \
+        any(word in node.action for word in ['RAISE', 'raise', 'self.'])
+    elif isinstance(node, NamedItem):
+      return self.has_effects(node.item)
+    raise TypeError(f'unexpected grammar node {node!r}')
+
+  def first_set(self, node):
+    if isinstance(node, NameLeaf):
+      name = node.value
+      if name in self.rules:
+        return self.first[name]
+      elif name in TOKEN_TYPES:
+        return frozenset({TOKEN_TYPES[name]})
+      return frozenset({getattr(token, name)})
+    elif isinstance(node, StringLeaf):
+      return frozenset({ast.literal_eval(node.value)})
+    elif isinstance(node, Cut):
+      return frozenset()
+    elif isinstance(node, Gather):
+      first = self.first_set(node.node)
+      if self.is_nullable(node.node):
+        first |= self.first_set(node.separator)
+      return first
+    elif isinstance(node, (Opt, Repeat, Lookahead, Forced)):
+      return self.first_set(node.node)
+    elif isinstance(node, Group):
+      return self.first_set(node.rhs)
+    elif isinstance(node, Rhs):
+      return frozenset().union(*(self.first_set(alt) for alt in node.alts))
+    elif isinstance(node, Alt):
+      return frozenset().union(
+        *(self.first_set(item) for item in self.prefix(node)))
+    elif isinstance(node, NamedItem):
+      return self.first_set(node.item)
+    raise TypeError(f'unexpected grammar node {node!r}')
+
+  def guard(self, alt):
+    '''FIRST set of an alternative, if it's safe to skip the alternative when
+    the next token isn't in it; else None.  That requires the alternative
+    to not be nullable, and its first token to be reached without effects
+    or cuts.'''
+    if self.is_nullable(alt): return None
+    for item in self.prefix(alt):
+      if isinstance(item, (Cut, Forced)) or self.has_effects(item):
+        return None
+    return self.first_set(alt)
+
+class ParseltongueGenerator(PythonParserGenerator):
+  '''pegen's Python parser generator, with a memoization policy, terminals
+  matched by kind id, and FIRST-set dispatch.
+
+  Only the rules in `memoized` (all rules if None) get memoized.  Other
+  rules are emitted undecorated, so they skip both the memo tables and
+  verbose tracing.  Leaders of left-recursive rules are always memoized,
+  as growing the seed needs it.  Token-level rules of memo.Parser not in
+  `memoized` are overridden with their plain, unmemoized versions.
+
+  The kind ids of the grammar's terminals become module-level constants,
+  registered with the lexer's symbol table when the parser gets imported
+  (see KindCallMaker).
+
+  Rules in CLIMBING_RULES start by handing off to their precedence climbing
+  method if the parser's `precedence_climbing` is set.
+
+  Alternatives that use an `invalid_*` rule only get tried when the parser's
+  `call_invalid_rules` is set, as in CPython: they only serve to raise
+  better syntax errors, in a second pass after a failed parse.
+
+  With `dispatch`, rules peek at the next token's kind and return None
+  right away if it can't start any alternative, and skip individual
+  alternatives that can't start with it (see FirstSets).  The FIRST sets
+  become module-level frozensets of kinds, named in `first_names`, which
+  must be filled in beforehand by generating the parser once without
+  output.'''
+
+  def __init__(self, grammar, file, memoized = None, dispatch = True,
+      first_names = None):
+    super().__init__(grammar, file)
+    self.callmakervisitor = KindCallMaker(self)
+    self.terminals = Terminals(grammar)
+    self.memoized = memoized
+    self.skip_memoize = False
+    self.token_rules_done = False
+    self.first_sets = FirstSets(grammar.rules) if dispatch else None
+    self.first_names = {} if first_names is None else first_names
+    self.guarded = False   # whether the current rule has guards
+    self.rule_guard = None  # FIRST set of the current rule, if guarded
+    self.alt_guards = []    # FIRST sets of remaining alternatives to guard
+    self.peeked = False
+    self.invalid_alt = False  # whether the current alternative is invalid_*
+    self.climbing = None   # precedence climbing method for the current rule
+
+  def print(self, *args):
+    if self.skip_memoize and args == ('@memoize',): return
+    if args == ('# Keywords and soft keywords are listed at the end of the parser definition.',):
+      self.print_kinds()
+      self.print_first_sets()
+    if self.climbing and args == ('mark = self._mark()',):
+      super().print('if self.precedence_climbing:')
+      with self.indent():
+        super().print(f'return self.{self.climbing}()')
+      self.climbing = None
+    if self.guarded:
+      if args == ('mark = self._mark()',) and not self.peeked:
+        super().print(*args)
+        super().print('kind = self._tokenizer.peek_kind()')
+        self.peeked = True
+        if self.rule_guard:
+          super().print(f'if {self.guard_condition(self.rule_guard, True)}:')
+          with self.indent():
+            super().print('return None')
+        return
+    if args in [('if (',), ('while (',)]:
+      super().print(*args)
+      with self.indent():
+        if self.invalid_alt:
+          super().print('self.call_invalid_rules')
+          super().print('and')
+        if self.guarded and args == ('if (',) and self.alt_guards:
+          guard = self.alt_guards.pop(0)
+          if guard is not None:
+            super().print(self.guard_condition(guard))
+            super().print('and')
+      return
+    super().print(*args)
+
+  def visit_Rule(self, node):
+    if not self.token_rules_done:
+      self.token_rules_done = True
+      self.print_token_rules()
+    self.skip_memoize = \
+      self.memoized is not None and node.name not in self.memoized
+    self.climbing = CLIMBING_RULES.get(node.name)
+    if self.first_sets and not node.is_loop() and not node.is_gather():
+      guards = [self.first_sets.guard(alt) for alt in node.flatten().alts]
+      if None not in guards:
+        self.rule_guard = frozenset().union(*guards)
+      if len(guards) > 1:
+        self.alt_guards = [None if guard == self.rule_guard else guard
+          for guard in guards]
+      if all(guard is None for guard in self.alt_guards):
+        self.alt_guards = []
+      self.guarded = self.rule_guard is not None or bool(self.alt_guards)
+    try:
+      super().visit_Rule(node)
+    finally:
+      self.skip_memoize = False
+      self.climbing = None
+      self.guarded = False
+      self.rule_guard = None
+      self.alt_guards = []
+      self.peeked = False
+
+  def visit_Alt(self, node, is_loop, is_gather):
+    self.invalid_alt = self.invalidvisitor.visit(node)
+    try:
+      super().visit_Alt(node, is_loop, is_gather)
+    finally:
+      self.invalid_alt = False
+
+  def guard_condition(self, first, negate = False):
+    '''Python condition for the next token's `kind` being in a FIRST set
+    (or not being in it, if `negate`)'''
+    key = set(first)
+    # NAME and OP tokens include the soft keywords and operators,
+    # which have kinds of their own.
+    if token.NAME in key:
+      key.update(self.terminals.soft_keywords())
+    if token.OP in key:
+      key.update(self.terminals.operators())
+    key = frozenset(key)
+    if key not in self.first_names:
+      self.first_names[key] = f'FIRST_{len(self.first_names)}'
+    test = 'not in' if negate else 'in'
+    return f'kind {test} {self.first_names[key]}'
+
+  def print_kinds(self):
+    self.print('# Kind ids of the terminals, which the lexer assigns to the tokens')
+    self.print('# spelling them')
+    for string in self.terminals.keywords() + self.terminals.operators():
+      self.print(f'{kind_name(string)} = symbols.kind({string!r})')
+    self.print()
+
+  def print_first_sets(self):
+    if not self.first_names: return
+    self.print('# FIRST sets: kinds of the tokens that can start a rule or')
+    self.print('# alternative.  Rules try only the alternatives the next token')
+    self.print('# can start.')
+    for key, name in self.first_names.items():
+      types = sorted(token.tok_name[key] for key in key if isinstance(key, int))
+      strings = sorted(key for key in key if isinstance(key, str))
+      elements = [f'tokenize.{type}' for type in types] + \
+        [kind_name(string) for string in strings]
+      self.print(f"{name} = frozenset({{{', '.join(elements)}}})")
+    self.print()
+
+  def print_token_rules(self):
+    soft_kinds = ', '.join(map(kind_name, self.terminals.soft_keywords()))
+    self.print(f'soft_keyword_kinds = frozenset({{{soft_kinds}}})')
+    self.print()
+    if self.memoized is None: return
+    plain = [name for name in TOKEN_RULES if name not in self.memoized]
+    if not plain: return
+    self.print('# Token-level rules left unmemoized')
+    for name in plain:
+      self.print(f'{name} = Parser.{name}.__wrapped__')
+    self.print()
+
+def generate_parser(grammar, file, memoized = None, dispatch = True):
+  first_names = None
+  if dispatch:
+    # Dry run to name the FIRST sets, which get printed before the rules.
+    dry_run = ParseltongueGenerator(grammar, io.StringIO(), memoized)
+    dry_run.generate(GRAMMAR_INPUT)
+    first_names = dry_run.first_names
+  gen = ParseltongueGenerator(grammar, file, memoized, dispatch, first_names)
+  gen.generate(GRAMMAR_INPUT)
+  return gen
+
+def profile_memoize(grammar, threshold = MEMOIZE_THRESHOLD):
+  '''Rules worth memoizing, found by parsing the sources in `src` with a
+  parser that memoizes every rule, and counting how often each rule gets
+  called again at a position (and with arguments) it was already tried at.
+  Returns the rules for which such repeat calls are at least `threshold`
+  of all calls.  Rules the corpus never calls are left unmemoized; their
+  memoized callers still bound how often they can run.  Token-level rules
+  are never memoized: rerunning them is just a token comparison, which is
+  cheaper than a memo lookup.'''
+  file = io.StringIO()
+  generate_parser(grammar, file)
+  namespace = {'__name__': 'parse'}
+  exec(compile(file.getvalue(), GRAMMAR_OUTPUT, 'exec'), namespace)
+  parser_class = namespace[grammar.metas.get('class', 'GeneratedParser')]
+
+  calls = collections.Counter()
+  repeats = collections.Counter()
+  tried = set()
+  def counted(name, method):
+    def wrapper(self, *args):
+      calls[name] += 1
+      key = (name, self._mark(), args)
+      if key in tried:
+        repeats[name] += 1
+      else:
+        tried.add(key)
+      return method(self, *args)
+    return wrapper
+  counting = {}
+  for name in dir(parser_class):
+    method = getattr(parser_class, name)
+    if getattr(method, '__name__', None) == 'memoize_wrapper' and \
+        name not in TOKEN_RULES:
+      counting[name] = counted(name, method)
+  counting_class = type('Counting' + parser_class.__name__,
+    (parser_class,), counting)
+
+  import lexer
+  for filename in sorted(glob.glob(MEMOIZE_CORPUS)):
+    tried.clear()
+    with open(filename, 'r') as source:
+      tokenizer = lexer.Tokenizer(source, filename)
+      counting_class(tokenizer, filename = filename).file()
+
+  memoized = {name for name in calls
+    if repeats[name] >= threshold * calls[name] and repeats[name]}
+  print(f'\t[profile: memoizing {len(memoized)} of {len(counting)} rules; '
+    f'{sum(repeats[name] for name in memoized)} of '
+    f'{sum(repeats.values())} repeat calls]')
+  return memoized
+
+def memoized_rules(grammar, policy):
+  '''Set of rules to memoize according to `policy`: 'all' (None),
+  'none', 'profile', or a comma-separated list of rule names.'''
+  if policy == 'all':
+    return None
+  elif policy == 'none':
+    return set()
+  elif policy == 'profile':
+    return profile_memoize(grammar)
+  memoized = set(name.strip() for name in policy.split(','))
+  unknown = memoized - set(grammar.rules) - set(TOKEN_RULES)
+  if unknown:
+    sys.exit(f'--memoize: unknown rules {", ".join(sorted(unknown))}')
+  return memoized
+
+def make_grammar(memoize = None):
+  '''Build the parser from the grammar, memoizing rules according to the
+  `memoize` policy (see memoized_rules).  Giving a policy forces a rebuild.'''
+  if memoize is not None or need_build(GRAMMAR_OUTPUT, [GRAMMAR_INPUT, __file__] +
       glob.glob(os.path.join(PEGEN_PATH, 'pegen', '*.py'))):
     mkdir(os.path.dirname(GRAMMAR_OUTPUT))
-    run_python_main(pegen.main,
-      ['pegen', '--quiet', GRAMMAR_INPUT, '-o', GRAMMAR_OUTPUT])
+    policy = memoize or MEMOIZE_DEFAULT
+    print(f'\tpegen {GRAMMAR_INPUT} -o {GRAMMAR_OUTPUT} [memoize {policy}]')
+    grammar, parser, tokenizer = build_parser(GRAMMAR_INPUT)
+    memoized = memoized_rules(grammar, policy)
+    with open(GRAMMAR_OUTPUT, 'w') as file:
+      generate_parser(grammar, file, memoized)
   for filename in PEGEN_COPY:
     copy(os.path.join(PEGEN_PATH, 'pegen', filename), PEGEN_COPY_DEST)
 
@@ -102,7 +548,14 @@ def make_transpile_loop():
     return 1
 
 def make():
-  make_grammar()
+  argparser = argparse.ArgumentParser('make.py')
+  argparser.add_argument('--memoize', metavar = 'POLICY',
+    help = 'which parser rules to memoize (rebuilding the parser): '
+      f"{', '.join(MEMOIZE_POLICIES)}, or a comma-separated list of rules "
+      f'(default {MEMOIZE_DEFAULT}: rules called again at the same position '
+      f'on at least {MEMOIZE_THRESHOLD:.0%}% of their calls in src)')
+  args = argparser.parse_args()
+  make_grammar(args.memoize)
   make_transpile_loop()
 
 if __name__ == '__main__': make()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3.9
+'''Regression tests, runnable with pytest or directly with python3.9'''
+
+import contextlib, importlib.util, io, mmap, os, random, sys, tempfile, token
+
+ROOT_DIR = os.path.relpath(os.path.dirname(__file__))
+BUILD_DIR = os.path.join(ROOT_DIR, 'lib')
+
+sys.path.insert(0, BUILD_DIR)
+import lexer, parse, util
+
+# lib/__main__.py, under a name that doesn't clash with this script's
+spec = importlib.util.spec_from_file_location('parseltongue_main',
+  os.path.join(BUILD_DIR, '__main__.py'))
+main_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(main_module)
+
+def parse_failure(code):
+  '''Parse `code` like `python3.9 lib file.pt` does, expecting failure:
+  return the SyntaxError that the second pass raises, or else the token
+  that the error would be reported at.'''
+  tokenizer = lexer.Tokenizer(code, '<test>')
+  parser = parse.ParseltongueParser(tokenizer, filename = '<test>')
+  assert parser.file() is None, 'parse succeeded'
+  parser.enable_invalid_rules()
+  try:
+    parser.file()
+  except SyntaxError as error:
+    return error
+  return tokenizer.diagnose()
+
+def stream_failure(code):
+  '''Error message that `python3.9 lib --stream` reports for `code`:
+  from a SyntaxError raised by the second pass, or else the last line
+  written to stderr'''
+  stderr = io.StringIO()
+  try:
+    with contextlib.redirect_stderr(stderr):
+      assert main_module.transpile_stream(
+        io.StringIO(code), io.StringIO()) == 1, 'parse succeeded'
+  except SyntaxError as error:
+    return error.msg
+  return stderr.getvalue().rstrip('\n').split('\n')[-1]
+
+# Errors that only the second pass (invalid_* rules) explains, including
+# ones in the suffix of a statement whose valid prefix got committed
+INVALID_STATEMENTS = [
+  ('if a\n  b\nelse\n', "expected an indented block after 'else'"),
+  ('if a\n  b\nelif c\n', "expected an indented block after 'elif'"),
+  ('for x in y\n  b\nelse\n', "expected an indented block after 'else'"),
+  ('while a\n  b\nelse\n', "expected an indented block after 'else'"),
+  ('try\n  b\nfinally\n', "expected a block after 'finally'"),
+  ('x = 1\nif a\n  b\nelse\n', "expected an indented block after 'else'"),
+  ('del f()\n', 'cannot delete function call'),
+  ('x = 1\ndel f()\n', 'cannot delete function call'),
+  ('x = 1\ny = 2\ndel f()\n', 'cannot delete function call'),
+]
+
+def test_second_pass_error_messages():
+  for code, message in INVALID_STATEMENTS:
+    error = parse_failure(code)
+    assert isinstance(error, SyntaxError), (code, error)
+    assert error.msg.startswith(message), (code, error.msg)
+    assert message in stream_failure(code), (code, stream_failure(code))
+
+def test_diagnose_furthest_token():
+  # The lexer buffers the INDENT/NAME on line 2 along with the NEWLINE,
+  # but the parser fails at the NEWLINE.
+  tok = parse_failure('import\n  x\n')
+  assert (tok.type, tok.string, tok.start[0]) == (token.NEWLINE, '\n', 1)
+  tok = parse_failure('pt = (\n x\n y +\n )\n')
+  assert (tok.type, tok.string, tok.start[0]) == (token.NEWLINE, ')', 4)
+
+def test_lex_mmap_in_place():
+  code = b'def f(x)\n  return x + 1\n'
+  with tempfile.TemporaryDirectory() as directory:
+    filename = os.path.join(directory, 'test.pt')
+    with open(filename, 'wb') as file:
+      file.write(code)
+    source = util.map_file(filename)
+    assert isinstance(source, mmap.mmap)
+    lex = lexer.Lexer(source, filename)
+    assert lex.code is source
+    assert [tuple(tok) for tok in lex.tokens] == \
+      [tuple(tok) for tok in lexer.Lexer(code, filename).tokens]
+    source.close()
+
+def test_decode_errors_are_lexer_errors():
+  for code, line_num, column, message in [
+    (b'# -*- coding: foobar -*-\nx = 1\n', 1, 1, 'unknown encoding: foobar'),
+    (b'#!/bin/sh\n# coding: foobar\n', 2, 1, 'unknown encoding: foobar'),
+    (b'x = 1\ny = 2\nz = "\xe9"\n', 3, 6, 'cannot decode source as utf-8'),
+  ]:
+    try:
+      lexer.Lexer(code, '<test>')
+    except lexer.ParselTongueLexerError as error:
+      [diagnostic] = error.diagnostics
+      assert (diagnostic.line_num, diagnostic.column) == (line_num, column)
+      assert diagnostic.message.startswith(message), diagnostic.message
+    else:
+      assert False, f'no error for {code!r}'
+    # Reported per file, like other lexer errors
+    report = io.StringIO()
+    assert main_module.transpile_source(code, '<test>', report) is None
+    assert message in report.getvalue()
+
+def test_transpile_file_closes_mapping():
+  maps = []
+  def recording_map_file(filename):
+    maps.append(map_file(filename))
+    return maps[-1]
+  map_file = main_module.util.map_file
+  main_module.util.map_file = recording_map_file
+  try:
+    with tempfile.TemporaryDirectory() as directory:
+      filename = os.path.join(directory, 'test.pt')
+      with open(filename, 'w') as file:
+        file.write('x = 1\n')
+      report = io.StringIO()
+      assert main_module.transpile_file(filename, file = report) == 0
+      assert len(maps) == 1 and maps[0].closed
+      # Without mapping (as in --watch), the file is just read
+      assert main_module.transpile_file(filename, file = report,
+        mapped = False) == 0
+      assert len(maps) == 1
+  finally:
+    main_module.util.map_file = map_file
+
+def test_recover_from_bad_dedent():
+  # Only the inconsistent dedent is an error; the lines after it return
+  # to enclosing levels (including the global one) without further errors.
+  for code, expected in [
+    ('if a\n    b\n  c\ny = 1\n', [(3, 3, 'dedent to 2 but expected 0')]),
+    ('if a\n  if b\n      c\n    d\n  e\nf\n',
+      [(4, 5, 'dedent to 4 but expected 2')]),
+  ]:
+    lex = lexer.Lexer(code, '<test>', recover = True)
+    assert [(diagnostic.line_num, diagnostic.column, diagnostic.message)
+      for diagnostic in lex.diagnostics] == expected, code
+
+EDIT_LINES = ['x', 'y = 1', '', '  ', '  z', '    w', 'if a', 'f(a,', '  b)',
+  '(', ')', '# c', "s = '''a", "b'''", 'x + \\']
+EDIT_TEXTS = ['', '\n', '\n\n', ' ', '  ', 'q', '(', ')', '\n  ', 'if b\n  c\n',
+  '#', "'''", '\\\n']
+
+def lex_or_none(code, **options):
+  try:
+    return lexer.Lexer(code, '<test>', **options)
+  except SyntaxError:
+    return None
+
+def test_lexer_edit_random(trials = 2000, seed = 0):
+  '''Incremental edits must give the same tokens and checkpoints as
+  lexing the edited code from scratch'''
+  rand = random.Random(seed)
+  for trial in range(trials):
+    code = '\n'.join(rand.choice(EDIT_LINES)
+      for line in range(rand.randint(1, 8)))
+    if rand.random() < 0.5:
+      code += '\n'
+    lex = lex_or_none(code, incremental = True)
+    if lex is None:
+      continue
+    for count in range(4):
+      start = rand.randint(0, len(code))
+      end = min(len(code), start + rand.choice([0, 0, 1, 2, 5]))
+      text = rand.choice(EDIT_TEXTS)
+      new_code = code[:start] + text + code[end:]
+      fresh = lex_or_none(new_code, incremental = True)
+      if fresh is None:
+        break
+      context = f'edit({start}, {end}, {text!r}) of {code!r}'
+      old = list(lex)
+      index, removed, added = lex.edit(start, end, text)
+      new = list(lex)
+      assert new == list(fresh), context
+      assert lex.checkpoints == fresh.checkpoints, context
+      assert new[:index] == old[:index], context
+      assert len(new) == len(old) - removed + added, context
+      code = new_code
+
+def main():
+  failed = 0
+  for name, test in list(globals().items()):
+    if name.startswith('test_') and callable(test):
+      try:
+        test()
+      except Exception as error:
+        failed += 1
+        print(f'FAIL {name}: {error!r}')
+      else:
+        print(f'ok   {name}')
+  if failed:
+    sys.exit(1)
+
+if __name__ == '__main__': main()